@@ -0,0 +1,72 @@
+"""Serve list routes through ``response_cache``.
+
+The key is the request path plus its query parameters in sorted order, so
+``?status=open&sort=-priority`` and ``?sort=-priority&status=open`` share an
+entry. The body does not depend on the caller, so only routes whose results
+are the same for every authenticated user should go through here.
+
+Requests whose session reads from a replica (``request.state.read_replica``)
+are served from the cache but never fill it. Otherwise a lagging replica
+could store pre-write rows under the generation the write just started, and
+every caller would get them, including the writer pinned to the primary.
+"""
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+from urllib.parse import parse_qsl, urlencode
+
+from fastapi import Request, Response, status
+
+from app.api.conditional import ETAG_HEADER, etag_matches, not_modified
+from app.services.response_cache import CacheOutcome, Headers, response_cache
+
+CACHE_HEADER = "X-Cache"
+# Recomputed for every response built from a cached body.
+_SKIPPED_HEADERS = frozenset({b"content-length"})
+
+
+def cache_key(request: Request) -> str:
+    params = sorted(parse_qsl(request.url.query, keep_blank_values=True))
+    return f"{request.url.path}?{urlencode(params)}"
+
+
+async def cached_list(
+    request: Request, scope: Any, build: Callable[[], Awaitable[Response]]
+) -> Response:
+    """Answer from the cache for ``scope``, calling ``build`` on a miss.
+
+    Only 200 responses with a materialized body are stored; anything else
+    ``build`` returns (a 304, a stream) is passed through as is.
+    """
+    built: Response | None = None
+
+    async def build_entry() -> tuple[bytes, Headers] | None:
+        nonlocal built
+        built = await build()
+        if built.status_code != status.HTTP_200_OK or not hasattr(built, "body"):
+            return None
+        headers = tuple(
+            (name.decode("latin-1"), value.decode("latin-1"))
+            for name, value in built.raw_headers
+            if name not in _SKIPPED_HEADERS
+        )
+        return bytes(built.body), headers
+
+    entry, outcome = await response_cache.get_or_build(
+        cache_key(request),
+        str(scope),
+        build_entry,
+        store=not getattr(request.state, "read_replica", False),
+    )
+    if built is not None:
+        response = built
+    else:
+        assert entry is not None
+        etag = dict(entry.headers).get(ETAG_HEADER.lower())
+        if etag and etag_matches(request, etag):
+            response = not_modified(etag)
+        else:
+            response = Response(content=entry.body, headers=dict(entry.headers))
+    if outcome is not CacheOutcome.bypass:
+        response.headers[CACHE_HEADER] = outcome.value
+    return response
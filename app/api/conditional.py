@@ -0,0 +1,143 @@
+"""Strong ETags and ``If-None-Match`` handling for detail and list routes.
+
+Detail ETags hash the row id with its version columns (``updated_at`` and,
+for issues, ``last_activity_at``). List ETags hash the query string, the
+total count when one was asked for, and the id and versions of every row on
+the page, so rows changing, moving in or dropping off the page all change
+it. Both are checked with narrow queries before any full rows are loaded.
+"""
+
+import hashlib
+from typing import Any
+
+from fastapi import HTTPException, Request, Response, status
+from sqlalchemy import Select, select
+from sqlalchemy.sql import ColumnElement
+
+from app.api.query import (
+    TOTAL_COUNT_HEADER,
+    CountMode,
+    count_rows,
+    fetch_page,
+    paginate,
+)
+
+ETAG_HEADER = "ETag"
+
+
+def make_etag(*parts: Any) -> str:
+    raw = "\x1f".join("" if part is None else str(part) for part in parts)
+    return '"' + hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison, so a W/ prefix still matches.
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag in candidates
+
+
+def not_modified(etag: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED, headers={ETAG_HEADER: etag}
+    )
+
+
+def row_etag(row: Any, versions: tuple[ColumnElement[Any], ...]) -> str:
+    return make_etag(row.id, *(getattr(row, str(column.key)) for column in versions))
+
+
+async def check_row(
+    db: Any,
+    request: Request,
+    model: Any,
+    ident: Any,
+    versions: tuple[ColumnElement[Any], ...],
+    detail: str,
+) -> Response | None:
+    """Answer ``If-None-Match`` for one row from its version columns alone.
+
+    Returns a 304 when the client's copy is current, ``None`` when the route
+    should load and return the row (and set ``row_etag`` on it), and raises
+    404 when the row does not exist. Without the header nothing is queried.
+    """
+    if not request.headers.get("if-none-match"):
+        return None
+    probe = (
+        await db.execute(select(model.id, *versions).where(model.id == ident))
+    ).first()
+    if probe is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
+    etag = row_etag(probe, versions)
+    return not_modified(etag) if etag_matches(request, etag) else None
+
+
+async def fetch_page_if_modified(
+    db: Any,
+    request: Request,
+    response: Response,
+    query: Select,
+    versions: tuple[ColumnElement[Any], ...],
+    *,
+    sort: str | None,
+    allowed: dict[str, ColumnElement[Any]],
+    tiebreaker: ColumnElement[Any],
+    page: int,
+    limit: int,
+    cursor: str | None,
+    count: CountMode | None = None,
+) -> list[Any] | Response:
+    """``fetch_page`` that answers ``If-None-Match`` and sets the page ETag.
+
+    With the header, the page is first read as id and version columns only,
+    through the same ordering and seek as the real page, and a 304 is
+    returned if nothing on it changed. Otherwise the ETag comes from the
+    fetched rows, so a plain GET costs no extra query.
+    """
+    if request.headers.get("if-none-match"):
+        probe = paginate(
+            query.with_only_columns(tiebreaker, *versions, maintain_column_froms=True),
+            sort=sort,
+            allowed=allowed,
+            tiebreaker=tiebreaker,
+            page=page,
+            limit=limit,
+            cursor=cursor,
+        )
+        probed_total = None
+        if count is not None:
+            probed_total, _ = await count_rows(db, query, count)
+        probed = (await db.execute(probe)).all()
+        etag = _page_etag(request, probed, versions, probed_total)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+    rows = await fetch_page(
+        db,
+        response,
+        query,
+        sort=sort,
+        allowed=allowed,
+        tiebreaker=tiebreaker,
+        page=page,
+        limit=limit,
+        cursor=cursor,
+        count=count,
+    )
+    total = response.headers.get(TOTAL_COUNT_HEADER)
+    response.headers[ETAG_HEADER] = _page_etag(request, rows, versions, total)
+    return rows
+
+
+def _page_etag(
+    request: Request,
+    rows: Any,
+    versions: tuple[ColumnElement[Any], ...],
+    total: Any,
+) -> str:
+    keys = ["id", *(str(column.key) for column in versions)]
+    values = [getattr(row, key) for row in rows for key in keys]
+    return make_etag(request.url.query, total, len(rows), *values)
@@ -1,27 +1,92 @@
-from fastapi import Depends, HTTPException, Security, status
+from typing import Any, TypeVar
+
+from anyio import to_thread
+from fastapi import Depends, HTTPException, Request, Security, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.orm import Session
 
 from app.core.logging import user_id_ctx
-from app.db.session import get_db
+from app.db import session as db_session
+from app.db.session import AsyncDB, ThreadedSession, get_db
 from app.models import User, UserRole
 from app.services import auth as auth_service, security
+from app.services.entity_cache import Principal
+
+UserT = TypeVar("UserT", User, Principal)
 
 bearer_scheme = HTTPBearer(auto_error=False)
 
+READ_METHODS = frozenset({"GET", "HEAD"})
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Security(bearer_scheme),
+
+def _use_replica(method: str, credentials: HTTPAuthorizationCredentials | None) -> bool:
+    """Route reads to a replica unless the caller wrote within the pin window.
+
+    Writes always go to the primary. The caller is marked by the user
+    dependencies once their token has been accepted, before the route runs,
+    so the window covers the write itself plus replication lag.
+    """
+    if method not in READ_METHODS or not db_session.has_replicas():
+        return False
+    subject = None
+    if credentials is not None:
+        try:
+            subject = security.decode_token(credentials.credentials).get("sub")
+        except ValueError:
+            pass
+    return not (subject and auth_service.has_recent_write(subject))
+
+
+def _pins_primary(request: Request) -> bool:
+    return request.method not in READ_METHODS and db_session.has_replicas()
+
+
+def _threaded_db(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials | None = Security(bearer_scheme),
     db: Session = Depends(get_db),
-) -> User:
+):
+    if not _use_replica(request.method, credentials):
+        yield ThreadedSession(db)
+        return
+    replica = db_session.ReplicaSession()
+    request.state.read_replica = True
+    try:
+        yield ThreadedSession(replica)
+    finally:
+        replica.close()
+
+
+async def _native_async_db(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials | None = Security(bearer_scheme),
+):
+    replica = (
+        request.method in READ_METHODS
+        and db_session.has_replicas()
+        and await to_thread.run_sync(_use_replica, request.method, credentials)
+    )
+    request.state.read_replica = replica
+    factory = (
+        db_session.AsyncReplicaSession
+        if replica
+        else db_session.get_async_session_local()
+    )
+    async with factory() as db:
+        yield db
+
+
+# Async routes depend on this: a native AsyncSession when use_native_async()
+# says so, otherwise the sync session from get_db driven through worker threads.
+# Reads go to a replica when DATABASE_REPLICA_URLS is set.
+get_async_db = _native_async_db if db_session.use_native_async() else _threaded_db
+
+
+def _access_payload(credentials: HTTPAuthorizationCredentials | None) -> dict:
     if credentials is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated"
         )
-    if auth_service.is_access_blacklisted(credentials.credentials):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail="Token revoked"
-        )
     try:
         payload = security.decode_token(credentials.credentials)
     except ValueError:
@@ -32,12 +97,17 @@ def get_current_user(
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token type"
         )
-    user = db.get(User, payload.get("sub"))
-    if not user or not user.is_active:
+    return payload
+
+
+def _ensure_not_revoked(token: str, payload: dict[str, Any]) -> None:
+    blacklisted, revoked_at = auth_service.access_token_state(
+        token, str(payload.get("sub"))
+    )
+    if blacklisted:
         raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail="Inactive user"
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Token revoked"
         )
-    revoked_at = auth_service.get_access_revoked_at(str(user.id))
     token_issued_at = payload.get("iat")
     if (
         revoked_at is not None
@@ -47,10 +117,49 @@ def get_current_user(
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Token revoked"
         )
+
+
+def _ensure_active(user: UserT | None) -> UserT:
+    if not user or not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Inactive user"
+        )
     user_id_ctx.set(str(user.id))
     return user
 
 
+def get_current_user(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials = Security(bearer_scheme),
+    db: Session = Depends(get_db),
+) -> User:
+    payload = _access_payload(credentials)
+    _ensure_not_revoked(credentials.credentials, payload)
+    user = _ensure_active(db.get(User, payload.get("sub")))
+    if _pins_primary(request):
+        auth_service.mark_recent_write(str(user.id))
+    return user
+
+
+async def get_current_user_async(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials = Security(bearer_scheme),
+    db: AsyncDB = Depends(get_async_db),
+) -> Principal:
+    """The caller's id, role and active flag.
+
+    Revocation is checked on every request; the user lookup is served from
+    the principal cache. Routes that need the full row load it themselves.
+    """
+    payload = _access_payload(credentials)
+    # The token store client is synchronous; keep its round-trips off the loop.
+    await to_thread.run_sync(_ensure_not_revoked, credentials.credentials, payload)
+    user = _ensure_active(await auth_service.load_principal(db, payload.get("sub")))
+    if _pins_primary(request):
+        await to_thread.run_sync(auth_service.mark_recent_write, str(user.id))
+    return user
+
+
 def require_roles(*roles: UserRole):
     def dependency(user: User = Depends(get_current_user)) -> User:
         if user.role not in roles:
@@ -1,50 +1,71 @@
+from typing import TypeVar
 from uuid import UUID
 from fastapi import Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_user
-from app.db.session import get_db
+from app.api.deps import (
+    UserT,
+    get_async_db,
+    get_current_user,
+    get_current_user_async,
+)
+from app.db.session import AsyncDB, get_db
 from app.models import Comment, Issue, Project, User, UserRole
 from app.schemas.issue import IssueUpdate
+from app.services.entity_cache import (
+    IssueRef,
+    Principal,
+    ProjectRef,
+    entity_cache,
+    invalidate_on_change,
+)
+
+# Columns loaded into the cached refs, in NamedTuple field order.
+PROJECT_REF_COLUMNS = (Project.id, Project.created_by_id, Project.is_archived)
+ISSUE_REF_COLUMNS = (Issue.id, Issue.project, Issue.reporter, Issue.assignee)
+
+invalidate_on_change(Project, entity_cache, ProjectRef, "created_by_id", "is_archived")
+invalidate_on_change(Issue, entity_cache, IssueRef, "project", "reporter", "assignee")
+
+# The checks below take either the loaded row or its cached ref.
+ProjectT = TypeVar("ProjectT", Project, ProjectRef)
+IssueT = TypeVar("IssueT", Issue, IssueRef)
+
+
+def _found(instance, detail: str):
+    if not instance:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
+    return instance
 
 
 def get_project(project_id: UUID, db: Session = Depends(get_db)) -> Project:
-    project = db.get(Project, project_id)
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Project not found"
-        )
-    return project
+    return _found(db.get(Project, project_id), "Project not found")
 
 
 def get_issue(issue_id: UUID, db: Session = Depends(get_db)) -> Issue:
-    issue = db.get(Issue, issue_id)
-    if not issue:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Issue not found"
-        )
-    return issue
+    return _found(db.get(Issue, issue_id), "Issue not found")
 
 
 def get_comment(comment_id: UUID, db: Session = Depends(get_db)) -> Comment:
-    comment = db.get(Comment, comment_id)
-    if not comment:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found"
-        )
-    return comment
+    return _found(db.get(Comment, comment_id), "Comment not found")
 
 
-def require_manager_or_admin(user: User = Depends(get_current_user)) -> User:
+def require_manager_or_admin(user: UserT = Depends(get_current_user)) -> UserT:
     if user.role not in {UserRole.manager, UserRole.admin}:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     return user
 
 
+def require_admin(user: UserT = Depends(get_current_user)) -> UserT:
+    if user.role != UserRole.admin:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+    return user
+
+
 def require_project_manage(
-    project: Project = Depends(get_project),
-    user: User = Depends(get_current_user),
-) -> Project:
+    project: ProjectT = Depends(get_project),
+    user: User | Principal = Depends(get_current_user),
+) -> ProjectT:
     if user.role == UserRole.admin:
         return project
     if project.created_by_id == user.id:
@@ -52,18 +73,9 @@ def require_project_manage(
     raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
 
 
-def require_issue_update_permission(
-    issue_id: UUID,
-    payload: IssueUpdate,
-    db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
-) -> Issue:
-    issue = db.get(Issue, issue_id)
-    if not issue:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Issue not found"
-        )
-
+def check_issue_update(
+    issue: IssueT, payload: IssueUpdate, user: User | Principal
+) -> IssueT:
     is_manager = user.role in {UserRole.manager, UserRole.admin}
     is_reporter = user.id == issue.reporter
     is_assignee = user.id == issue.assignee
@@ -81,12 +93,87 @@ def require_issue_update_permission(
     return issue
 
 
+def require_issue_update_permission(
+    issue_id: UUID,
+    payload: IssueUpdate,
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user),
+) -> Issue:
+    issue = _found(db.get(Issue, issue_id), "Issue not found")
+    return check_issue_update(issue, payload, user)
+
+
 def require_comment_author(
     comment: Comment = Depends(get_comment),
-    user: User = Depends(get_current_user),
+    user: User | Principal = Depends(get_current_user),
 ) -> Comment:
     if comment.author_id != user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, detail="Only author can edit"
         )
     return comment
+
+
+async def get_project_async(
+    project_id: UUID, db: AsyncDB = Depends(get_async_db)
+) -> ProjectRef:
+    """The project's id, owner and archive flag, usually from ``entity_cache``."""
+    return _found(
+        await entity_cache.fetch(db, ProjectRef, PROJECT_REF_COLUMNS, project_id),
+        "Project not found",
+    )
+
+
+async def get_issue_async(
+    issue_id: UUID, db: AsyncDB = Depends(get_async_db)
+) -> IssueRef:
+    """The issue's id, project, reporter and assignee, usually from ``entity_cache``."""
+    return _found(
+        await entity_cache.fetch(db, IssueRef, ISSUE_REF_COLUMNS, issue_id),
+        "Issue not found",
+    )
+
+
+async def get_comment_async(
+    comment_id: UUID, db: AsyncDB = Depends(get_async_db)
+) -> Comment:
+    return _found(await db.get(Comment, comment_id), "Comment not found")
+
+
+async def require_manager_or_admin_async(
+    user: Principal = Depends(get_current_user_async),
+) -> Principal:
+    return require_manager_or_admin(user)
+
+
+async def require_admin_async(
+    user: Principal = Depends(get_current_user_async),
+) -> Principal:
+    return require_admin(user)
+
+
+async def require_project_manage_async(
+    project_id: UUID,
+    db: AsyncDB = Depends(get_async_db),
+    user: Principal = Depends(get_current_user_async),
+) -> Project:
+    # The route changes the row, so check the loaded row, not the cached ref.
+    project = _found(await db.get(Project, project_id), "Project not found")
+    return require_project_manage(project, user)
+
+
+async def require_issue_update_permission_async(
+    issue_id: UUID,
+    payload: IssueUpdate,
+    db: AsyncDB = Depends(get_async_db),
+    user: Principal = Depends(get_current_user_async),
+) -> Issue:
+    issue = _found(await db.get(Issue, issue_id), "Issue not found")
+    return check_issue_update(issue, payload, user)
+
+
+async def require_comment_author_async(
+    comment: Comment = Depends(get_comment_async),
+    user: Principal = Depends(get_current_user_async),
+) -> Comment:
+    return require_comment_author(comment, user)
@@ -1,16 +1,64 @@
+import base64
+import binascii
+import enum
+import json
+import uuid
+from collections.abc import Sequence
+from datetime import date, datetime
 from typing import Any
 
-from sqlalchemy import asc, desc
-from sqlalchemy.orm import Query
+from fastapi import HTTPException, Response, status
+from pydantic import BaseModel
+from sqlalchemy import (
+    Select,
+    Table,
+    and_,
+    asc,
+    desc,
+    false,
+    func,
+    or_,
+    select,
+    text,
+)
 from sqlalchemy.sql import ColumnElement
 
 SEARCH_PATTERN = r"^[A-Za-z0-9 _.,@-]*$"
+SEARCH_DESCRIPTION = (
+    "Full-text match: every word must start a word in the row, so `check` "
+    "finds `checkout` but `bug` does not find `debugging`."
+)
 SORT_PATTERN = r"^-?[a-z_]+$"
+CURSOR_MAX_LENGTH = 512
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+DEFAULT_CURSOR_SORT = "created_at"
+TOTAL_COUNT_HEADER = "X-Total-Count"
+TOTAL_COUNT_MODE_HEADER = "X-Total-Count-Mode"
+COUNT_CAP = 1000
+
+
+class CountMode(str, enum.Enum):
+    exact = "exact"
+    capped = "capped"
+    estimated = "estimated"
+
+
+def columns_for(model: Any, schema: type[BaseModel]) -> list[ColumnElement[Any]]:
+    """The table columns behind ``schema``'s fields, for a column projection.
+
+    Selecting these instead of the entity skips ORM instance construction;
+    the rows still validate into ``schema`` attribute by attribute.
+    """
+    table = model.__table__
+    return [table.c[name] for name in schema.model_fields]
 
 
 def apply_sort(
-    query: Query, sort: str | None, allowed: dict[str, ColumnElement[Any]]
-) -> Query:
+    query: Select,
+    sort: str | None,
+    allowed: dict[str, ColumnElement[Any]],
+    tiebreaker: ColumnElement[Any] | None = None,
+) -> Select:
     if not sort:
         return query
     direction = desc if sort.startswith("-") else asc
@@ -18,11 +66,306 @@ def apply_sort(
     column = allowed.get(field)
     if column is None:
         return query
-    return query.order_by(direction(column))
+    query = query.order_by(direction(column))
+    if tiebreaker is not None:
+        query = query.order_by(direction(tiebreaker))
+    return query
 
 
-def apply_pagination(query: Query, page: int, limit: int) -> Query:
+def apply_pagination(query: Select, page: int, limit: int) -> Select:
     page = max(page, 1)
     limit = max(limit, 1)
     offset = (page - 1) * limit
     return query.offset(offset).limit(limit)
+
+
+def paginate(
+    query: Select,
+    *,
+    sort: str | None,
+    allowed: dict[str, ColumnElement[Any]],
+    tiebreaker: ColumnElement[Any],
+    page: int,
+    limit: int,
+    cursor: str | None,
+) -> Select:
+    """Order and slice a list query.
+
+    Passing ``cursor`` (an empty string starts from the top) switches from
+    OFFSET paging to keyset paging on the active sort key plus ``tiebreaker``.
+    """
+    if cursor is None:
+        query = apply_sort(query, sort, allowed, tiebreaker)
+        return apply_pagination(query, page, limit)
+    return apply_cursor(query, cursor, sort, allowed, tiebreaker, limit)
+
+
+async def fetch_page(
+    db: Any,
+    response: Response,
+    query: Select,
+    *,
+    sort: str | None,
+    allowed: dict[str, ColumnElement[Any]],
+    tiebreaker: ColumnElement[Any],
+    page: int,
+    limit: int,
+    cursor: str | None,
+    count: CountMode | None = None,
+) -> list[Any]:
+    """Run a paginated list query and set the cursor and total-count headers.
+
+    A query over several columns (see ``columns_for``) returns ``Row`` objects
+    rather than ORM instances.
+
+    ``count=exact`` on an OFFSET page rides along as ``COUNT(*) OVER()`` on the
+    page query itself; keyset pages and empty pages fall back to a count query.
+    """
+    windowed = count is CountMode.exact and cursor is None
+    paged = paginate(
+        query.add_columns(func.count().over()) if windowed else query,
+        sort=sort,
+        allowed=allowed,
+        tiebreaker=tiebreaker,
+        page=page,
+        limit=limit,
+        cursor=cursor,
+    )
+    # One entity or column comes back as scalars; a column projection as rows.
+    scalar = len(query.column_descriptions) == 1
+    if windowed:
+        result = (await db.execute(paged)).all()
+        rows = [row[0] for row in result] if scalar else list(result)
+    elif scalar:
+        rows = list((await db.scalars(paged)).all())
+    else:
+        rows = list((await db.execute(paged)).all())
+    set_next_cursor(response, rows, sort, allowed, tiebreaker, limit, cursor)
+    if count is not None:
+        if windowed and result:
+            total, mode = result[0][-1], CountMode.exact
+        else:
+            total, mode = await count_rows(db, query, count)
+        response.headers[TOTAL_COUNT_HEADER] = str(total)
+        response.headers[TOTAL_COUNT_MODE_HEADER] = mode.value
+    return rows
+
+
+async def count_rows(db: Any, query: Select, mode: CountMode) -> tuple[int, CountMode]:
+    """Count the rows ``query`` matches; returns the count and how it was taken.
+
+    ``capped`` stops at ``COUNT_CAP`` and reports ``capped`` only when the cap
+    was hit. ``estimated`` uses the planner's table estimate for unfiltered
+    Postgres lists and otherwise degrades to ``capped``.
+    """
+    if mode is CountMode.estimated:
+        estimate = await _planner_estimate(db, query)
+        if estimate is not None:
+            return estimate, CountMode.estimated
+        mode = CountMode.capped
+    base = query.order_by(None)
+    if mode is CountMode.capped:
+        base = base.limit(COUNT_CAP + 1)
+    total = await db.scalar(select(func.count()).select_from(base.subquery()))
+    if mode is CountMode.capped and total > COUNT_CAP:
+        return COUNT_CAP, CountMode.capped
+    return total, CountMode.exact
+
+
+async def _planner_estimate(db: Any, query: Select) -> int | None:
+    froms = query.get_final_froms()
+    if (
+        query.whereclause is not None
+        or len(froms) != 1
+        or not isinstance(froms[0], Table)
+        or db.get_bind().dialect.name != "postgresql"
+    ):
+        return None
+    estimate = await db.scalar(
+        text(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:name AS regclass)"
+        ),
+        {"name": froms[0].name},
+    )
+    # reltuples is -1 until the table has been vacuumed or analyzed.
+    if estimate is None or estimate < 0:
+        return None
+    return int(estimate)
+
+
+def apply_cursor(
+    query: Select,
+    cursor: str,
+    sort: str | None,
+    allowed: dict[str, ColumnElement[Any]],
+    tiebreaker: ColumnElement[Any],
+    limit: int,
+) -> Select:
+    return apply_keyset(query, cursor, sort_keys(sort, allowed, tiebreaker), limit)
+
+
+def apply_keyset(
+    query: Select,
+    cursor: str | None,
+    keys: list[tuple[ColumnElement[Any], bool]],
+    limit: int,
+) -> Select:
+    """Order by ``keys`` (``(column, descending)`` pairs) and seek past ``cursor``."""
+    if cursor:
+        values = decode_cursor(cursor, keys)
+        query = query.filter(_seek_predicate(keys, values))
+    for column, descending in keys:
+        ordering = desc(column) if descending else asc(column)
+        if _is_nullable(column):
+            ordering = ordering.nulls_last()
+        query = query.order_by(ordering)
+    return query.limit(max(limit, 1))
+
+
+def set_next_cursor(
+    response: Response,
+    rows: Sequence[Any],
+    sort: str | None,
+    allowed: dict[str, ColumnElement[Any]],
+    tiebreaker: ColumnElement[Any],
+    limit: int,
+    cursor: str | None,
+) -> None:
+    if cursor is None:
+        return
+    keys = sort_keys(sort, allowed, tiebreaker)
+    set_keyset_cursor(response, rows, keys, limit)
+
+
+def set_keyset_cursor(
+    response: Response,
+    rows: Sequence[Any],
+    keys: list[tuple[ColumnElement[Any], bool]],
+    limit: int,
+) -> None:
+    if len(rows) < max(limit, 1):
+        return
+    response.headers[NEXT_CURSOR_HEADER] = encode_cursor(keys, rows[-1])
+
+
+def sort_keys(
+    sort: str | None,
+    allowed: dict[str, ColumnElement[Any]],
+    tiebreaker: ColumnElement[Any],
+) -> list[tuple[ColumnElement[Any], bool]]:
+    field = (sort or "").lstrip("-")
+    descending = sort is not None and sort.startswith("-")
+    column = allowed.get(field)
+    if column is None:
+        column = allowed.get(DEFAULT_CURSOR_SORT)
+        descending = False
+    keys = [(column, descending)] if column is not None else []
+    keys.append((tiebreaker, descending))
+    return keys
+
+
+def encode_cursor(keys: list[tuple[ColumnElement[Any], bool]], row: Any) -> str:
+    payload = {
+        "k": [_key_name(column, descending) for column, descending in keys],
+        "v": [_encode_value(getattr(row, _attr_name(column))) for column, _ in keys],
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, keys: list[tuple[ColumnElement[Any], bool]]) -> list:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        names = payload["k"]
+        raw_values = payload["v"]
+        if names != [_key_name(column, descending) for column, descending in keys]:
+            raise ValueError("Cursor does not match sort")
+        if not isinstance(raw_values, list) or len(raw_values) != len(keys):
+            raise ValueError("Malformed cursor")
+        return [
+            _decode_value(column, value) for (column, _), value in zip(keys, raw_values)
+        ]
+    except (ValueError, KeyError, TypeError, binascii.Error, UnicodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
+
+
+def _seek_predicate(
+    keys: list[tuple[ColumnElement[Any], bool]], values: list[Any]
+) -> ColumnElement[bool]:
+    branches = []
+    for index, (column, descending) in enumerate(keys):
+        prefix = [
+            _equals(prev_column, values[prev_index])
+            for prev_index, (prev_column, _) in enumerate(keys[:index])
+        ]
+        branches.append(and_(*prefix, _after(column, descending, values[index])))
+    predicate = or_(*branches)
+    leading_column, leading_desc = keys[0]
+    leading_value = values[0]
+    if leading_value is not None and not _is_nullable(leading_column):
+        # Redundant range bound so the planner can seek the leading index column.
+        bound = (
+            leading_column <= leading_value
+            if leading_desc
+            else leading_column >= leading_value
+        )
+        predicate = and_(bound, predicate)
+    return predicate
+
+
+def _after(column: ColumnElement[Any], descending: bool, value: Any):
+    # NULLs sort last in both directions, so nothing follows a NULL key value.
+    if value is None:
+        return false()
+    condition = column < value if descending else column > value
+    if _is_nullable(column):
+        return or_(condition, column.is_(None))
+    return condition
+
+
+def _equals(column: ColumnElement[Any], value: Any):
+    if value is None:
+        return column.is_(None)
+    return column == value
+
+
+def _is_nullable(column: ColumnElement[Any]) -> bool:
+    return bool(getattr(getattr(column, "expression", column), "nullable", False))
+
+
+def _attr_name(column: ColumnElement[Any]) -> str:
+    return str(column.key)
+
+
+def _key_name(column: ColumnElement[Any], descending: bool) -> str:
+    name = _attr_name(column)
+    return f"-{name}" if descending else name
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def _decode_value(column: ColumnElement[Any], value: Any) -> Any:
+    if value is None or not isinstance(value, str):
+        return value
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if issubclass(python_type, datetime):
+        return datetime.fromisoformat(value)
+    if issubclass(python_type, date):
+        return date.fromisoformat(value)
+    if issubclass(python_type, enum.Enum):
+        return python_type(value)
+    return value
@@ -1,6 +1,51 @@
+from collections.abc import AsyncIterable, AsyncIterator
+from functools import cache
+from typing import Any
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
 from app.schemas.common import ErrorResponse
 
+JSON_MEDIA_TYPE = "application/json"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
 UNAUTHORIZED = {401: {"model": ErrorResponse, "description": "Unauthorized"}}
 FORBIDDEN = {403: {"model": ErrorResponse, "description": "Forbidden"}}
 NOT_FOUND = {404: {"model": ErrorResponse, "description": "Not found"}}
 RATE_LIMITED = {429: {"model": ErrorResponse, "description": "Too many requests"}}
+
+
+async def ndjson_lines(
+    rows: AsyncIterable[Any], schema: type[BaseModel]
+) -> AsyncIterator[bytes]:
+    async for row in rows:
+        yield schema.model_validate(row).model_dump_json().encode() + b"\n"
+
+
+@cache
+def _adapter(schema: Any) -> TypeAdapter[Any]:
+    return TypeAdapter(schema)
+
+
+def json_response(
+    value: Any, schema: Any, response: Response | None = None, status_code: int = 200
+) -> Response:
+    """Serialize ``value`` as ``schema`` straight to JSON bytes.
+
+    The body matches what ``response_model=schema`` would produce, but rows
+    are validated once and pydantic-core writes the bytes, skipping the
+    intermediate dicts and ``json.dumps``. FastAPI only merges headers set on
+    the injected ``response`` into responses it builds itself, so they are
+    copied over here.
+    """
+    adapter = _adapter(schema)
+    body = adapter.dump_json(adapter.validate_python(value, from_attributes=True))
+    result = Response(
+        content=body,
+        media_type=JSON_MEDIA_TYPE,
+        status_code=(response and response.status_code) or status_code,
+    )
+    if response is not None:
+        result.headers.raw.extend(response.headers.raw)
+    return result
@@ -1,3 +1,3 @@
-from app.api.routes import auth, projects, issues, comments
+from app.api.routes import auth, projects, issues, comments, search, me, audit
 
-__all__ = ["auth", "projects", "issues", "comments"]
+__all__ = ["auth", "projects", "issues", "comments", "search", "me", "audit"]
@@ -0,0 +1,74 @@
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy import select
+from sqlalchemy.sql import ColumnElement
+
+from app.api import deps
+from app.api.permissions import require_admin_async
+from app.api.query import CURSOR_MAX_LENGTH, apply_keyset, set_keyset_cursor
+from app.db.session import AsyncDB
+from app.models import AuditEvent
+from app.schemas.audit import AuditEventOut
+from app.services.entity_cache import Principal
+
+router = APIRouter(prefix="/audit", tags=["audit"])
+
+# Newest first; the (occurred_at, id) primary key and the per-issue, project
+# and user indexes all end in these columns.
+AUDIT_KEYS: list[tuple[ColumnElement[Any], bool]] = [
+    (AuditEvent.occurred_at, True),
+    (AuditEvent.id, True),
+]
+
+
+async def audit_page(
+    db: Any,
+    response: Response,
+    conditions: list[Any],
+    *,
+    cursor: str | None,
+    limit: int,
+) -> list[AuditEvent]:
+    query = select(AuditEvent).where(*conditions)
+    page = apply_keyset(query, cursor, AUDIT_KEYS, limit)
+    rows = list((await db.scalars(page)).all())
+    set_keyset_cursor(response, rows, AUDIT_KEYS, limit)
+    return rows
+
+
+@router.get("/events", response_model=list[AuditEventOut])
+async def list_audit_events(
+    response: Response,
+    event: str | None = Query(default=None, max_length=64),
+    user_id: str | None = Query(default=None, max_length=64),
+    issue_id: UUID | None = Query(default=None),
+    project_id: UUID | None = Query(default=None),
+    since: datetime | None = Query(default=None),
+    until: datetime | None = Query(default=None),
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: str | None = Query(default=None, max_length=CURSOR_MAX_LENGTH),
+    db: AsyncDB = Depends(deps.get_async_db),
+    _: Principal = Depends(require_admin_async),
+):
+    """Stored audit events, newest first; follow ``X-Next-Cursor`` for more.
+
+    ``since`` is inclusive and ``until`` exclusive. Events are written in
+    batches, so the last second or so may not be visible yet.
+    """
+    conditions = []
+    if event:
+        conditions.append(AuditEvent.event == event)
+    if user_id:
+        conditions.append(AuditEvent.user_id == user_id)
+    if issue_id:
+        conditions.append(AuditEvent.issue_id == issue_id)
+    if project_id:
+        conditions.append(AuditEvent.project_id == project_id)
+    if since:
+        conditions.append(AuditEvent.occurred_at >= since)
+    if until:
+        conditions.append(AuditEvent.occurred_at < until)
+    return await audit_page(db, response, conditions, cursor=cursor, limit=limit)
@@ -1,10 +1,12 @@
 from datetime import timedelta
 
+from anyio import to_thread
 from fastapi import APIRouter, Depends, HTTPException, Request, Security, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.orm import Session
 
 from app.api import deps
+from app.db.session import AsyncDB
 from app.models import User, UserRole
 from app.schemas.auth import (
     LoginRequest,
@@ -15,6 +17,7 @@ from app.schemas.auth import (
 )
 from app.schemas.user import UserOut
 from app.services import auth as auth_service, security
+from app.services.entity_cache import Principal
 from app.services.audit import audit_log
 from app.services.pii import hash_pii
 from app.core.config import settings
@@ -142,9 +145,12 @@ def logout(
 
 @router.post("/logout-all", status_code=204, responses=UNAUTHORIZED)
 @limiter.limit(settings.rate_limit_sensitive)
-def logout_all(request: Request, current_user: User = Depends(deps.get_current_user)):
-    auth_service.revoke_all_refresh(current_user.id)
-    auth_service.revoke_all_access(current_user.id)
+async def logout_all(
+    request: Request, current_user: Principal = Depends(deps.get_current_user_async)
+):
+    await to_thread.run_sync(auth_service.revoke_all_refresh, current_user.id)
+    await to_thread.run_sync(auth_service.revoke_all_access, current_user.id)
+    auth_service.invalidate_principal(current_user.id)
     audit_log(
         "logout_all",
         str(current_user.id),
@@ -168,6 +174,7 @@ def change_password(
     db.commit()
     auth_service.revoke_all_refresh(current_user.id)
     auth_service.revoke_all_access(current_user.id)
+    auth_service.invalidate_principal(current_user.id)
     audit_log(
         "change_password",
         str(current_user.id),
@@ -177,5 +184,11 @@ def change_password(
 
 
 @router.get("/me", response_model=UserOut)
-def me(current_user: User = Depends(deps.get_current_user)):
-    return current_user
+async def me(
+    current_user: Principal = Depends(deps.get_current_user_async),
+    db: AsyncDB = Depends(deps.get_async_db),
+):
+    user = await db.get(User, current_user.id)
+    if not user:
+        raise HTTPException(status_code=401, detail="Inactive user")
+    return user
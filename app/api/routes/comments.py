@@ -1,10 +1,22 @@
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Request, status
-from sqlalchemy.orm import Session
+
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
 
 from app.api import deps
-from app.api.permissions import get_issue, require_comment_author
-from app.models import Comment, Issue, User
+from app.api.caching import cached_list
+from app.api.conditional import fetch_page_if_modified
+from app.api.permissions import get_issue_async, require_comment_author_async
+from app.api.query import (
+    CURSOR_MAX_LENGTH,
+    SORT_PATTERN,
+    apply_sort,
+    columns_for,
+)
+from app.api.responses import NDJSON_MEDIA_TYPE, json_response, ndjson_lines
+from app.db.session import AsyncDB
+from app.models import Comment
 from app.schemas.comment import (
     CommentCreate,
     CommentCreateForIssue,
@@ -12,27 +24,117 @@ from app.schemas.comment import (
     CommentUpdate,
 )
 from app.services.audit import audit_log
+from app.services.entity_cache import IssueRef, Principal
+from app.services.response_cache import response_cache
 from app.services.security import sanitize_markdown
 
 router = APIRouter(tags=["comments"])
 
+COMMENT_SORT_FIELDS = {
+    "created_at": Comment.created_at,
+    "updated_at": Comment.updated_at,
+}
+DEFAULT_COMMENT_SORT = "created_at"
+COMMENT_COLUMNS = columns_for(Comment, CommentOut)
+STREAM_BATCH_SIZE = 500
+
 
 @router.get("/issues/{issue_id}/comments", response_model=list[CommentOut])
-def list_issue_comments(
-    issue: Issue = Depends(get_issue),
-    db: Session = Depends(deps.get_db),
-    _: User = Depends(deps.get_current_user),
+async def list_issue_comments(
+    request: Request,
+    response: Response,
+    issue: IssueRef = Depends(get_issue_async),
+    page: int = Query(default=1, ge=1),
+    limit: int = Query(default=50, ge=1, le=200),
+    sort: str | None = Query(default=None, pattern=SORT_PATTERN),
+    cursor: str | None = Query(default=None, max_length=CURSOR_MAX_LENGTH),
+    stream: bool = Query(default=False),
+    db: AsyncDB = Depends(deps.get_async_db),
+    _: Principal = Depends(deps.get_current_user_async),
 ):
-    return db.query(Comment).filter(Comment.issue_id == issue.id).all()
+    return await _list_comments(
+        db,
+        request,
+        response,
+        issue.id,
+        page,
+        limit,
+        sort,
+        cursor,
+        stream,
+        issue.project,
+    )
 
 
 @router.get("/comments/issue/{issue_id}", response_model=list[CommentOut])
-def list_comments_legacy(
+async def list_comments_legacy(
     issue_id: UUID,
-    db: Session = Depends(deps.get_db),
-    _: User = Depends(deps.get_current_user),
+    request: Request,
+    response: Response,
+    page: int = Query(default=1, ge=1),
+    limit: int = Query(default=50, ge=1, le=200),
+    sort: str | None = Query(default=None, pattern=SORT_PATTERN),
+    cursor: str | None = Query(default=None, max_length=CURSOR_MAX_LENGTH),
+    stream: bool = Query(default=False),
+    db: AsyncDB = Depends(deps.get_async_db),
+    _: Principal = Depends(deps.get_current_user_async),
 ):
-    return db.query(Comment).filter(Comment.issue_id == issue_id).all()
+    return await _list_comments(
+        db, request, response, issue_id, page, limit, sort, cursor, stream
+    )
+
+
+async def _list_comments(
+    db: AsyncDB,
+    request: Request,
+    response: Response,
+    issue_id: UUID,
+    page: int,
+    limit: int,
+    sort: str | None,
+    cursor: str | None,
+    stream: bool,
+    project_id: UUID | None = None,
+):
+    """Page through an issue's comments, oldest first unless ``sort`` says otherwise.
+
+    ``stream=true`` ignores paging and returns the whole thread as NDJSON,
+    fetched ``STREAM_BATCH_SIZE`` rows at a time. Pages are served through
+    the response cache when the issue's ``project_id`` is known.
+    """
+    sort = sort or DEFAULT_COMMENT_SORT
+    if stream:
+        stmt = select(Comment).where(Comment.issue_id == issue_id)
+        stmt = apply_sort(stmt, sort, COMMENT_SORT_FIELDS, Comment.id)
+        rows = await db.stream_scalars(
+            stmt.execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+        return StreamingResponse(
+            ndjson_lines(rows, CommentOut), media_type=NDJSON_MEDIA_TYPE
+        )
+    query = select(*COMMENT_COLUMNS).where(Comment.issue_id == issue_id)
+
+    async def build() -> Response:
+        rows = await fetch_page_if_modified(
+            db,
+            request,
+            response,
+            query,
+            (Comment.updated_at,),
+            sort=sort,
+            allowed=COMMENT_SORT_FIELDS,
+            tiebreaker=Comment.id,
+            page=page,
+            limit=limit,
+            cursor=cursor,
+        )
+        if isinstance(rows, Response):
+            return rows
+        return json_response(rows, list[CommentOut], response)
+
+    if project_id is None:
+        return await build()
+    return await cached_list(request, project_id, build)
 
 
 @router.post(
@@ -40,24 +142,23 @@ def list_comments_legacy(
     response_model=CommentOut,
     status_code=status.HTTP_201_CREATED,
 )
-def add_issue_comment(
+async def add_issue_comment(
     issue_id: UUID,
     payload: CommentCreateForIssue,
     request: Request,
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_user),
+    db: AsyncDB = Depends(deps.get_async_db),
+    current_user: Principal = Depends(deps.get_current_user_async),
 ):
-    issue = db.get(Issue, issue_id)
-    if not issue:
-        raise HTTPException(status_code=404, detail="Issue not found")
+    issue = await get_issue_async(issue_id, db)
     comment = Comment(
         content=sanitize_markdown(payload.content) or "",
         issue_id=issue.id,
         author_id=current_user.id,
     )
     db.add(comment)
-    db.commit()
-    db.refresh(comment)
+    await db.commit()
+    await response_cache.invalidate(issue.project)
+    await db.refresh(comment)
     audit_log(
         "comment_add",
         str(current_user.id),
@@ -71,23 +172,22 @@ def add_issue_comment(
 @router.post(
     "/comments", response_model=CommentOut, status_code=status.HTTP_201_CREATED
 )
-def add_comment_legacy(
+async def add_comment_legacy(
     payload: CommentCreate,
     request: Request,
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_user),
+    db: AsyncDB = Depends(deps.get_async_db),
+    current_user: Principal = Depends(deps.get_current_user_async),
 ):
-    issue = db.get(Issue, payload.issue_id)
-    if not issue:
-        raise HTTPException(status_code=404, detail="Issue not found")
+    issue = await get_issue_async(payload.issue_id, db)
     comment = Comment(
         content=sanitize_markdown(payload.content) or "",
         issue_id=payload.issue_id,
         author_id=current_user.id,
     )
     db.add(comment)
-    db.commit()
-    db.refresh(comment)
+    await db.commit()
+    await response_cache.invalidate(issue.project)
+    await db.refresh(comment)
     audit_log(
         "comment_add",
         str(current_user.id),
@@ -99,15 +199,18 @@ def add_comment_legacy(
 
 
 @router.patch("/comments/{comment_id}", response_model=CommentOut)
-def edit_comment(
+async def edit_comment(
     payload: CommentUpdate,
     request: Request,
-    comment: Comment = Depends(require_comment_author),
-    db: Session = Depends(deps.get_db),
+    comment: Comment = Depends(require_comment_author_async),
+    db: AsyncDB = Depends(deps.get_async_db),
 ):
     comment.content = sanitize_markdown(payload.content) or ""
-    db.commit()
-    db.refresh(comment)
+    await db.commit()
+    # The edit moves the issue's last_activity_at, which project lists show.
+    issue = await get_issue_async(comment.issue_id, db)
+    await response_cache.invalidate(issue.project)
+    await db.refresh(comment)
     audit_log(
         "comment_edit",
         str(comment.author_id),
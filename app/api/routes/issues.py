@@ -1,37 +1,100 @@
 import enum
+import json
+import tempfile
 import uuid
+from collections.abc import AsyncIterator
 from datetime import date, datetime
-from uuid import UUID
 from typing import Any
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
-from sqlalchemy import or_
-from sqlalchemy.orm import Session
+from anyio import to_thread
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
 
 from app.api import deps
-from app.api.permissions import require_issue_update_permission
-from app.api.query import SEARCH_PATTERN, SORT_PATTERN, apply_pagination, apply_sort
-from app.models import Comment, Issue, IssuePriority, IssueStatus, Project, User
-from app.schemas.issue import IssueCreate, IssueOut, IssueUpdate
-from app.services.audit import audit_log
+from app.api.conditional import (
+    ETAG_HEADER,
+    check_row,
+    fetch_page_if_modified,
+    row_etag,
+)
+from app.api.permissions import (
+    check_issue_update,
+    get_issue_async,
+    get_project_async,
+    require_issue_update_permission_async,
+)
+from app.api.query import (
+    CURSOR_MAX_LENGTH,
+    SEARCH_DESCRIPTION,
+    SEARCH_PATTERN,
+    SORT_PATTERN,
+    CountMode,
+    columns_for,
+)
+from app.api.responses import NDJSON_MEDIA_TYPE, json_response
+from app.api.routes.audit import audit_page
+from app.core.config import settings
+from app.db.session import AsyncDB
+from app.models import AuditEvent, Issue, IssuePriority, IssueStatus, User
+from app.schemas.audit import ActivityEntry
+from app.schemas.issue import (
+    BulkIssueResult,
+    BulkIssueSummary,
+    BulkIssueUpdate,
+    BulkIssueUpdateResult,
+    BulkIssueUpdateSummary,
+    IssueCreate,
+    IssueOut,
+    IssueUpdate,
+)
+from app.services import issue_import
+from app.services.audit import audit_log, record_event
+from app.services.entity_cache import IssueRef, Principal
+from app.services.response_cache import response_cache
+from app.services.search import dialect_name, search_clause
 from app.services.security import sanitize_markdown
 
 router = APIRouter(prefix="/issues", tags=["issues"])
 
+ISSUE_SORT_FIELDS = {
+    "created_at": Issue.created_at,
+    "updated_at": Issue.updated_at,
+    "priority": Issue.priority,
+    "status": Issue.status,
+    "due_date": Issue.due_date,
+    "comment_count": Issue.comment_count,
+    "last_activity_at": Issue.last_activity_at,
+}
+# List pages select these columns rather than Issue entities.
+ISSUE_COLUMNS = columns_for(Issue, IssueOut)
+# Comment activity moves last_activity_at without touching updated_at.
+ISSUE_VERSIONS = (Issue.updated_at, Issue.last_activity_at)
+
 
 @router.get("/", response_model=list[IssueOut])
-def list_issues(
+async def list_issues(
+    request: Request,
+    response: Response,
     status_filter: IssueStatus | None = Query(default=None, alias="status"),
     priority: IssuePriority | None = Query(default=None),
     assignee: UUID | None = Query(default=None),
-    search: str | None = Query(default=None, max_length=200, pattern=SEARCH_PATTERN),
+    search: str | None = Query(
+        default=None,
+        max_length=200,
+        pattern=SEARCH_PATTERN,
+        description=SEARCH_DESCRIPTION,
+    ),
     page: int = Query(default=1, ge=1),
     limit: int = Query(default=50, ge=1, le=200),
     sort: str | None = Query(default=None, pattern=SORT_PATTERN),
-    db: Session = Depends(deps.get_db),
-    _: User = Depends(deps.get_current_user),
+    cursor: str | None = Query(default=None, max_length=CURSOR_MAX_LENGTH),
+    count: CountMode | None = Query(default=None),
+    db: AsyncDB = Depends(deps.get_async_db),
+    _: Principal = Depends(deps.get_current_user_async),
 ):
-    q = db.query(Issue)
+    q = select(*ISSUE_COLUMNS)
     if status_filter:
         q = q.filter(Issue.status == status_filter)
     if priority:
@@ -39,45 +102,79 @@ def list_issues(
     if assignee:
         q = q.filter(Issue.assignee == assignee)
     if search:
-        like = f"%{search}%"
-        q = q.filter(or_(Issue.title.ilike(like), Issue.description.ilike(like)))
-    q = apply_sort(
+        clause = search_clause(dialect_name(db), Issue, search)
+        if clause is not None:
+            q = q.filter(clause)
+    rows = await fetch_page_if_modified(
+        db,
+        request,
+        response,
         q,
-        sort,
-        {
-            "created_at": Issue.created_at,
-            "updated_at": Issue.updated_at,
-            "priority": Issue.priority,
-            "status": Issue.status,
-            "due_date": Issue.due_date,
-        },
+        ISSUE_VERSIONS,
+        sort=sort,
+        allowed=ISSUE_SORT_FIELDS,
+        tiebreaker=Issue.id,
+        page=page,
+        limit=limit,
+        cursor=cursor,
+        count=count,
     )
-    q = apply_pagination(q, page, limit)
-    return q.all()
+    if isinstance(rows, Response):
+        return rows
+    return json_response(rows, list[IssueOut], response)
 
 
 @router.get("/{issue_id}", response_model=IssueOut)
-def get_issue(
+async def get_issue(
     issue_id: UUID,
-    db: Session = Depends(deps.get_db),
-    _: User = Depends(deps.get_current_user),
+    request: Request,
+    response: Response,
+    db: AsyncDB = Depends(deps.get_async_db),
+    _: Principal = Depends(deps.get_current_user_async),
 ):
-    issue = db.get(Issue, issue_id)
+    cached = await check_row(
+        db, request, Issue, issue_id, ISSUE_VERSIONS, "Issue not found"
+    )
+    if cached is not None:
+        return cached
+    issue = await db.get(Issue, issue_id)
     if not issue:
         raise HTTPException(status_code=404, detail="Issue not found")
-    return issue
+    response.headers[ETAG_HEADER] = row_etag(issue, ISSUE_VERSIONS)
+    return json_response(issue, IssueOut, response)
+
+
+@router.get("/{issue_id}/activity", response_model=list[ActivityEntry])
+async def issue_activity(
+    response: Response,
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: str | None = Query(default=None, max_length=CURSOR_MAX_LENGTH),
+    issue: IssueRef = Depends(get_issue_async),
+    db: AsyncDB = Depends(deps.get_async_db),
+    _: Principal = Depends(deps.get_current_user_async),
+):
+    """Audit events recorded against the issue, newest first.
+
+    Follow ``X-Next-Cursor`` for older events. Events are written in
+    batches, so the most recent second or so may not be listed yet.
+    """
+    return await audit_page(
+        db,
+        response,
+        [AuditEvent.issue_id == issue.id],
+        cursor=cursor,
+        limit=limit,
+    )
 
 
 @router.post("/", response_model=IssueOut, status_code=status.HTTP_201_CREATED)
-def create_issue(
+async def create_issue(
     payload: IssueCreate,
     request: Request,
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_user),
+    db: AsyncDB = Depends(deps.get_async_db),
+    current_user: Principal = Depends(deps.get_current_user_async),
 ):
-    project = db.get(Project, payload.project)
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    project = await get_project_async(payload.project, db)
     issue = Issue(
         title=payload.title,
         description=sanitize_markdown(payload.description),
@@ -88,8 +185,9 @@ def create_issue(
         due_date=payload.due_date,
     )
     db.add(issue)
-    db.commit()
-    db.refresh(issue)
+    await db.commit()
+    await response_cache.invalidate(project.id)
+    await db.refresh(issue)
     audit_log(
         "issue_create",
         str(current_user.id),
@@ -100,31 +198,255 @@ def create_issue(
     return issue
 
 
+@router.post("/bulk", response_model=BulkIssueSummary)
+async def bulk_create_issues(
+    request: Request,
+    db: AsyncDB = Depends(deps.get_async_db),
+    current_user: Principal = Depends(deps.get_current_user_async),
+):
+    """Create issues from a JSON array or an NDJSON stream of ``IssueCreate``.
+
+    Records are validated and inserted in batches; each record gets a result
+    carrying its new id or the reason it was rejected.
+
+    NDJSON is the path for large imports. The upload is spooled to a
+    temporary file, then results are streamed back as NDJSON lines, one
+    batch at a time as each batch commits, followed by a
+    ``{"created", "failed"}`` summary line. JSON arrays are parsed whole and
+    answered with a single ``BulkIssueSummary``, so they are capped at
+    ``BULK_IMPORT_JSON_MAX_BYTES``.
+    """
+    client_host = request.client.host if request.client else None
+    if _media_type(request) == NDJSON_MEDIA_TYPE:
+        spool = await _spool_body(request)
+        records = _ndjson_records(_spooled_chunks(spool))
+        return StreamingResponse(
+            _ndjson_results(db, records, current_user.id, client_host),
+            media_type=NDJSON_MEDIA_TYPE,
+        )
+    results: list[BulkIssueResult] = []
+    async for batch in _import_batches(
+        db, _json_array_records(request), current_user.id
+    ):
+        results.extend(batch)
+    created = sum(1 for result in results if result.id is not None)
+    _audit_bulk_create(current_user.id, client_host, created, len(results) - created)
+    return BulkIssueSummary(
+        created=created, failed=len(results) - created, results=results
+    )
+
+
+async def _ndjson_results(
+    db: AsyncDB,
+    records: AsyncIterator[issue_import.Record],
+    reporter_id: UUID,
+    client_host: str | None,
+) -> AsyncIterator[str]:
+    created = failed = 0
+    async for batch in _import_batches(db, records, reporter_id):
+        for result in batch:
+            if result.id is None:
+                failed += 1
+            else:
+                created += 1
+        yield "".join(result.model_dump_json() + "\n" for result in batch)
+    _audit_bulk_create(reporter_id, client_host, created, failed)
+    yield json.dumps({"created": created, "failed": failed}) + "\n"
+
+
+async def _import_batches(
+    db: AsyncDB, records: AsyncIterator[issue_import.Record], reporter_id: UUID
+) -> AsyncIterator[list[BulkIssueResult]]:
+    batch: list[issue_import.Record] = []
+    async for record in records:
+        batch.append(record)
+        if len(batch) >= issue_import.BATCH_SIZE:
+            yield await _create_batch(db, batch, reporter_id)
+            batch = []
+    if batch:
+        yield await _create_batch(db, batch, reporter_id)
+
+
+async def _create_batch(
+    db: AsyncDB, batch: list[issue_import.Record], reporter_id: UUID
+) -> list[BulkIssueResult]:
+    results = await issue_import.create_batch(db, batch, reporter_id)
+    await response_cache.invalidate(
+        *(payload.project for _, payload in batch if isinstance(payload, IssueCreate))
+    )
+    return results
+
+
+def _audit_bulk_create(
+    user_id: UUID, client_host: str | None, created: int, failed: int
+) -> None:
+    audit_log(
+        "issue_bulk_create", str(user_id), client_host, created=created, failed=failed
+    )
+
+
+def _media_type(request: Request) -> str:
+    return request.headers.get("content-type", "").split(";")[0].strip().lower()
+
+
+async def _json_array_records(
+    request: Request,
+) -> AsyncIterator[issue_import.Record]:
+    limit = settings.bulk_import_json_max_bytes
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > limit:
+            raise HTTPException(
+                status_code=413,
+                detail=f"JSON array imports are limited to {limit} bytes; "
+                f"send {NDJSON_MEDIA_TYPE} instead",
+            )
+    try:
+        items = json.loads(body)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid JSON body")
+    if not isinstance(items, list):
+        raise HTTPException(status_code=400, detail="Expected a JSON array")
+    for index, item in enumerate(items):
+        yield issue_import.parse_record(index, item)
+
+
+async def _spool_body(request: Request) -> Any:
+    # Reading the whole upload before the response starts keeps memory
+    # bounded without interleaving request and response bodies, which some
+    # clients and proxies cannot do.
+    # Returned open; _spooled_chunks closes it once the records are read.
+    spool = tempfile.SpooledTemporaryFile(  # noqa: SIM115
+        max_size=issue_import.SPOOL_MEMORY_BYTES
+    )
+    try:
+        async for chunk in request.stream():
+            await to_thread.run_sync(spool.write, chunk)
+    except BaseException:
+        spool.close()
+        raise
+    spool.seek(0)
+    return spool
+
+
+async def _spooled_chunks(spool: Any) -> AsyncIterator[bytes]:
+    try:
+        while chunk := await to_thread.run_sync(
+            spool.read, issue_import.SPOOL_READ_BYTES
+        ):
+            yield chunk
+    finally:
+        spool.close()
+
+
+async def _ndjson_records(
+    chunks: AsyncIterator[bytes],
+) -> AsyncIterator[issue_import.Record]:
+    index = 0
+    pending = b""
+    async for chunk in chunks:
+        *lines, pending = (pending + chunk).split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield issue_import.parse_record(index, line)
+                index += 1
+    if pending.strip():
+        yield issue_import.parse_record(index, pending)
+
+
+@router.patch("/bulk", response_model=BulkIssueUpdateSummary)
+async def bulk_update_issues(
+    payload: BulkIssueUpdate,
+    request: Request,
+    db: AsyncDB = Depends(deps.get_async_db),
+    current_user: Principal = Depends(deps.get_current_user_async),
+):
+    """Apply ``IssueUpdate``s to many issues in one transaction.
+
+    Issues and assignees are loaded with one query each. Rejected ids are
+    reported and skipped; the accepted changes are committed together and
+    audited as one event.
+    """
+    pairs = payload.pairs()
+    ids = {issue_id for issue_id, _ in pairs}
+    issues = {
+        issue.id: issue
+        for issue in (await db.scalars(select(Issue).where(Issue.id.in_(ids)))).all()
+    }
+    assignees = {update.assignee for _, update in pairs if update.assignee is not None}
+    known_assignees = (
+        set((await db.scalars(select(User.id).where(User.id.in_(assignees)))).all())
+        if assignees
+        else set()
+    )
+
+    results: list[BulkIssueUpdateResult] = []
+    updates: list[dict[str, Any]] = []
+    for issue_id, update in pairs:
+        issue = issues.get(issue_id)
+        data = update.model_dump(exclude_unset=True)
+        try:
+            if issue is None:
+                raise HTTPException(status_code=404, detail="Issue not found")
+            check_issue_update(issue, update, current_user)
+            if data.get("assignee") and data["assignee"] not in known_assignees:
+                raise HTTPException(status_code=404, detail="Assignee not found")
+            if "status" in data:
+                _enforce_transition(issue, data["status"])
+        except HTTPException as exc:
+            results.append(
+                BulkIssueUpdateResult(id=issue_id, updated=False, error=exc.detail)
+            )
+            continue
+        changes = _apply_update(issue, data)
+        results.append(BulkIssueUpdateResult(id=issue_id, updated=True))
+        updates.append(
+            {
+                "issue_id": str(issue.id),
+                "project": str(issue.project),
+                "fields": list(changes.keys()),
+                "changes": changes,
+            }
+        )
+    await db.commit()
+    await response_cache.invalidate(*(entry["project"] for entry in updates))
+
+    ip = request.client.host if request.client else None
+    # Stored per issue as well so each issue's activity shows the change.
+    for entry in updates:
+        record_event("issue_update", str(current_user.id), ip, bulk=True, **entry)
+    updated = len(updates)
+    audit_log(
+        "issue_bulk_update",
+        str(current_user.id),
+        ip,
+        updated=updated,
+        failed=len(results) - updated,
+        updates=updates,
+    )
+    return BulkIssueUpdateSummary(
+        updated=updated, failed=len(results) - updated, results=results
+    )
+
+
 @router.patch("/{issue_id}", response_model=IssueOut)
-def update_issue(
+async def update_issue(
     payload: IssueUpdate,
     request: Request,
-    db: Session = Depends(deps.get_db),
-    issue: Issue = Depends(require_issue_update_permission),
-    current_user: User = Depends(deps.get_current_user),
+    db: AsyncDB = Depends(deps.get_async_db),
+    issue: Issue = Depends(require_issue_update_permission_async),
+    current_user: Principal = Depends(deps.get_current_user_async),
 ):
     data = payload.model_dump(exclude_unset=True)
 
     if "status" in data:
-        _enforce_transition(issue, data["status"], db)
+        _enforce_transition(issue, data["status"])
 
-    changes: dict[str, dict[str, Any]] = {}
-    for field, value in data.items():
-        if field == "description":
-            value = sanitize_markdown(value)
-        previous = _serialize_audit_value(getattr(issue, field))
-        next_value = _serialize_audit_value(value)
-        if previous == next_value:
-            continue
-        changes[field] = {"from": previous, "to": next_value}
-        setattr(issue, field, value)
-    db.commit()
-    db.refresh(issue)
+    changes = _apply_update(issue, data)
+    await db.commit()
+    await response_cache.invalidate(issue.project)
+    await db.refresh(issue)
     audit_log(
         "issue_update",
         str(current_user.id),
@@ -137,6 +459,20 @@ def update_issue(
     return issue
 
 
+def _apply_update(issue: Issue, data: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    changes: dict[str, dict[str, Any]] = {}
+    for field, value in data.items():
+        if field == "description":
+            value = sanitize_markdown(value)
+        previous = _serialize_audit_value(getattr(issue, field))
+        next_value = _serialize_audit_value(value)
+        if previous == next_value:
+            continue
+        changes[field] = {"from": previous, "to": next_value}
+        setattr(issue, field, value)
+    return changes
+
+
 def _serialize_audit_value(value: Any) -> Any:
     if isinstance(value, enum.Enum):
         return value.value
@@ -147,23 +483,27 @@ def _serialize_audit_value(value: Any) -> Any:
     return value
 
 
-def _enforce_transition(issue: Issue, new_status: IssueStatus, db: Session) -> None:
-    allowed = {
-        IssueStatus.open: {IssueStatus.in_progress},
-        IssueStatus.in_progress: {IssueStatus.resolved},
-        IssueStatus.resolved: {IssueStatus.closed, IssueStatus.reopened},
-        IssueStatus.closed: {IssueStatus.reopened},
-        IssueStatus.reopened: {IssueStatus.in_progress},
-    }
+ISSUE_TRANSITIONS = {
+    IssueStatus.open: {IssueStatus.in_progress},
+    IssueStatus.in_progress: {IssueStatus.resolved},
+    IssueStatus.resolved: {IssueStatus.closed, IssueStatus.reopened},
+    IssueStatus.closed: {IssueStatus.reopened},
+    IssueStatus.reopened: {IssueStatus.in_progress},
+}
+
+
+def _enforce_transition(issue: Issue, new_status: IssueStatus) -> None:
     if new_status == issue.status:
         return
-    valid_next = allowed.get(issue.status, set())
+    valid_next = ISSUE_TRANSITIONS.get(issue.status, set())
     if new_status not in valid_next:
         raise HTTPException(status_code=400, detail="Invalid status transition")
-    if issue.priority == IssuePriority.critical and new_status == IssueStatus.closed:
-        comment_count = db.query(Comment).filter(Comment.issue_id == issue.id).count()
-        if comment_count == 0:
-            raise HTTPException(
-                status_code=400,
-                detail="Critical issues require a comment before closing",
-            )
+    if (
+        issue.priority == IssuePriority.critical
+        and new_status == IssueStatus.closed
+        and issue.comment_count == 0
+    ):
+        raise HTTPException(
+            status_code=400,
+            detail="Critical issues require a comment before closing",
+        )
@@ -0,0 +1,72 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy import func, select
+
+from app.api import deps
+from app.api.query import (
+    CURSOR_MAX_LENGTH,
+    apply_keyset,
+    columns_for,
+    set_keyset_cursor,
+)
+from app.api.responses import json_response
+from app.db.session import AsyncDB
+from app.models import Issue, IssueStatus
+from app.models.issue import PRIORITY_RANK, STATUS_RANK
+from app.schemas.issue import InboxGroup, IssueOut, MyIssues
+from app.services.entity_cache import Principal
+
+router = APIRouter(prefix="/me", tags=["me"])
+
+# Matches ix_issues_assignee_inbox column for column, so pages are index scans.
+INBOX_KEYS = [
+    (STATUS_RANK.label("status_rank"), False),
+    (PRIORITY_RANK.label("priority_rank"), False),
+    (Issue.due_date, False),
+    (Issue.id, False),
+]
+# The rank labels ride along so the next cursor can be read off the last row.
+INBOX_COLUMNS = [*columns_for(Issue, IssueOut), INBOX_KEYS[0][0], INBOX_KEYS[1][0]]
+OPEN_STATUSES = [status for status in IssueStatus if status != IssueStatus.closed]
+
+
+@router.get("/issues", response_model=MyIssues)
+async def my_issues(
+    response: Response,
+    status_filter: list[IssueStatus] | None = Query(default=None, alias="status"),
+    project: UUID | None = Query(default=None),
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: str | None = Query(default=None, max_length=CURSOR_MAX_LENGTH),
+    db: AsyncDB = Depends(deps.get_async_db),
+    current_user: Principal = Depends(deps.get_current_user_async),
+):
+    """Issues assigned to the caller across projects, with per-group counts.
+
+    Ordered by status (open, in progress, resolved, closed, reopened),
+    priority (most urgent first), due date; follow
+    ``X-Next-Cursor`` for the next page. Closed issues are left out unless
+    ``status`` asks for them. ``groups`` counts every matching issue by
+    project and status, not just the current page.
+    """
+    statuses = status_filter or OPEN_STATUSES
+    conditions = [Issue.assignee == current_user.id, Issue.status.in_(statuses)]
+    if project:
+        conditions.append(Issue.project == project)
+
+    query = select(*INBOX_COLUMNS).where(*conditions)
+    page = apply_keyset(query, cursor, INBOX_KEYS, limit)
+    items = list((await db.execute(page)).all())
+    set_keyset_cursor(response, items, INBOX_KEYS, limit)
+
+    grouped = await db.execute(
+        select(Issue.project, Issue.status, func.count())
+        .where(*conditions)
+        .group_by(Issue.project, Issue.status)
+        .order_by(Issue.project, Issue.status)
+    )
+    groups = [
+        InboxGroup(project=group_project, status=status, count=count)
+        for group_project, status, count in grouped.all()
+    ]
+    return json_response(MyIssues(groups=groups, items=items), MyIssues, response)
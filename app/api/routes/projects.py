@@ -1,59 +1,111 @@
 from uuid import UUID
-from fastapi import APIRouter, Depends, Query, Request, status
-from sqlalchemy import or_
-from sqlalchemy.orm import Session
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
 
 from app.api import deps
+from app.api.caching import cached_list
+from app.api.conditional import (
+    ETAG_HEADER,
+    check_row,
+    fetch_page_if_modified,
+    row_etag,
+)
 from app.api.permissions import (
-    get_project,
-    require_manager_or_admin,
-    require_project_manage,
+    get_project_async,
+    require_manager_or_admin_async,
+    require_project_manage_async,
 )
-from app.api.query import SEARCH_PATTERN, SORT_PATTERN, apply_pagination, apply_sort
-from app.models import Issue, IssuePriority, IssueStatus, Project, User
+from app.api.query import (
+    CURSOR_MAX_LENGTH,
+    SEARCH_DESCRIPTION,
+    SEARCH_PATTERN,
+    SORT_PATTERN,
+    CountMode,
+    columns_for,
+)
+from app.api.responses import NDJSON_MEDIA_TYPE, json_response
+from app.api.routes.issues import ISSUE_COLUMNS, ISSUE_SORT_FIELDS, ISSUE_VERSIONS
+from app.db.session import AsyncDB
+from app.models import Issue, IssuePriority, IssueStatus, Project
 from app.schemas.issue import IssueCreateForProject, IssueOut
-from app.schemas.project import ProjectCreate, ProjectOut, ProjectUpdate
+from app.schemas.project import (
+    ProjectCreate,
+    ProjectOut,
+    ProjectSummary,
+    ProjectUpdate,
+)
+from app.services import export
 from app.services.audit import audit_log
+from app.services.entity_cache import Principal, ProjectRef
+from app.services.project_summary import project_summary
+from app.services.response_cache import response_cache
+from app.services.search import dialect_name, search_clause
 from app.services.security import sanitize_markdown
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
+PROJECT_SORT_FIELDS = {
+    "name": Project.name,
+    "created_at": Project.created_at,
+    "updated_at": Project.updated_at,
+}
+PROJECT_COLUMNS = columns_for(Project, ProjectOut)
+PROJECT_VERSIONS = (Project.updated_at,)
+
 
 @router.get("/", response_model=list[ProjectOut])
-def list_projects(
-    search: str | None = Query(default=None, max_length=200, pattern=SEARCH_PATTERN),
+async def list_projects(
+    request: Request,
+    response: Response,
+    search: str | None = Query(
+        default=None,
+        max_length=200,
+        pattern=SEARCH_PATTERN,
+        description=SEARCH_DESCRIPTION,
+    ),
     is_archived: bool | None = Query(default=False),
     page: int = Query(default=1, ge=1),
     limit: int = Query(default=50, ge=1, le=200),
     sort: str | None = Query(default=None, pattern=SORT_PATTERN),
-    db: Session = Depends(deps.get_db),
-    _: User = Depends(deps.get_current_user),
+    cursor: str | None = Query(default=None, max_length=CURSOR_MAX_LENGTH),
+    count: CountMode | None = Query(default=None),
+    db: AsyncDB = Depends(deps.get_async_db),
+    _: Principal = Depends(deps.get_current_user_async),
 ):
-    q = db.query(Project)
+    q = select(*PROJECT_COLUMNS)
     if is_archived is not None:
         q = q.filter(Project.is_archived == is_archived)
     if search:
-        like = f"%{search}%"
-        q = q.filter(or_(Project.name.ilike(like), Project.description.ilike(like)))
-    q = apply_sort(
+        clause = search_clause(dialect_name(db), Project, search)
+        if clause is not None:
+            q = q.filter(clause)
+    rows = await fetch_page_if_modified(
+        db,
+        request,
+        response,
         q,
-        sort,
-        {
-            "name": Project.name,
-            "created_at": Project.created_at,
-            "updated_at": Project.updated_at,
-        },
+        PROJECT_VERSIONS,
+        sort=sort,
+        allowed=PROJECT_SORT_FIELDS,
+        tiebreaker=Project.id,
+        page=page,
+        limit=limit,
+        cursor=cursor,
+        count=count,
     )
-    q = apply_pagination(q, page, limit)
-    return q.all()
+    if isinstance(rows, Response):
+        return rows
+    return json_response(rows, list[ProjectOut], response)
 
 
 @router.post("/", response_model=ProjectOut, status_code=status.HTTP_201_CREATED)
-def create_project(
+async def create_project(
     payload: ProjectCreate,
     request: Request,
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(require_manager_or_admin),
+    db: AsyncDB = Depends(deps.get_async_db),
+    current_user: Principal = Depends(require_manager_or_admin_async),
 ):
     project = Project(
         name=payload.name,
@@ -61,8 +113,8 @@ def create_project(
         created_by_id=current_user.id,
     )
     db.add(project)
-    db.commit()
-    db.refresh(project)
+    await db.commit()
+    await db.refresh(project)
     audit_log(
         "project_create",
         str(current_user.id),
@@ -73,27 +125,50 @@ def create_project(
 
 
 @router.get("/{project_id}", response_model=ProjectOut)
-def get_project_detail(
-    project: Project = Depends(get_project), _: User = Depends(deps.get_current_user)
+async def get_project_detail(
+    project_id: UUID,
+    request: Request,
+    response: Response,
+    db: AsyncDB = Depends(deps.get_async_db),
+    _: Principal = Depends(deps.get_current_user_async),
 ):
-    return project
+    cached = await check_row(
+        db, request, Project, project_id, PROJECT_VERSIONS, "Project not found"
+    )
+    if cached is not None:
+        return cached
+    project = await db.get(Project, project_id)
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    response.headers[ETAG_HEADER] = row_etag(project, PROJECT_VERSIONS)
+    return json_response(project, ProjectOut, response)
+
+
+@router.get("/{project_id}/summary", response_model=ProjectSummary)
+async def get_project_summary(
+    project: ProjectRef = Depends(get_project_async),
+    db: AsyncDB = Depends(deps.get_async_db),
+    _: Principal = Depends(deps.get_current_user_async),
+):
+    return await project_summary(db, project.id)
 
 
 @router.patch("/{project_id}", response_model=ProjectOut)
-def update_project(
+async def update_project(
     payload: ProjectUpdate,
     request: Request,
-    project: Project = Depends(require_project_manage),
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_user),
+    project: Project = Depends(require_project_manage_async),
+    db: AsyncDB = Depends(deps.get_async_db),
+    current_user: Principal = Depends(deps.get_current_user_async),
 ):
     data = payload.model_dump(exclude_unset=True)
     for field, value in data.items():
         if field == "description":
             value = sanitize_markdown(value)
         setattr(project, field, value)
-    db.commit()
-    db.refresh(project)
+    await db.commit()
+    await response_cache.invalidate(project.id)
+    await db.refresh(project)
     audit_log(
         "project_update",
         str(current_user.id),
@@ -105,14 +180,15 @@ def update_project(
 
 
 @router.delete("/{project_id}", status_code=204)
-def archive_project(
+async def archive_project(
     request: Request,
-    project: Project = Depends(require_project_manage),
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_user),
+    project: Project = Depends(require_project_manage_async),
+    db: AsyncDB = Depends(deps.get_async_db),
+    current_user: Principal = Depends(deps.get_current_user_async),
 ):
     project.is_archived = True
-    db.commit()
+    await db.commit()
+    await response_cache.invalidate(project.id)
     audit_log(
         "project_archive",
         str(current_user.id),
@@ -123,19 +199,28 @@ def archive_project(
 
 
 @router.get("/{project_id}/issues", response_model=list[IssueOut])
-def list_project_issues(
-    project: Project = Depends(get_project),
+async def list_project_issues(
+    request: Request,
+    response: Response,
+    project: ProjectRef = Depends(get_project_async),
     status_filter: IssueStatus | None = Query(default=None, alias="status"),
     priority: IssuePriority | None = Query(default=None),
     assignee: UUID | None = Query(default=None),
-    search: str | None = Query(default=None, max_length=200, pattern=SEARCH_PATTERN),
+    search: str | None = Query(
+        default=None,
+        max_length=200,
+        pattern=SEARCH_PATTERN,
+        description=SEARCH_DESCRIPTION,
+    ),
     page: int = Query(default=1, ge=1),
     limit: int = Query(default=50, ge=1, le=200),
     sort: str | None = Query(default=None, pattern=SORT_PATTERN),
-    db: Session = Depends(deps.get_db),
-    _: User = Depends(deps.get_current_user),
+    cursor: str | None = Query(default=None, max_length=CURSOR_MAX_LENGTH),
+    count: CountMode | None = Query(default=None),
+    db: AsyncDB = Depends(deps.get_async_db),
+    _: Principal = Depends(deps.get_current_user_async),
 ):
-    q = db.query(Issue).filter(Issue.project == project.id)
+    q = select(*ISSUE_COLUMNS).where(Issue.project == project.id)
     if status_filter:
         q = q.filter(Issue.status == status_filter)
     if priority:
@@ -143,32 +228,81 @@ def list_project_issues(
     if assignee:
         q = q.filter(Issue.assignee == assignee)
     if search:
-        like = f"%{search}%"
-        q = q.filter(or_(Issue.title.ilike(like), Issue.description.ilike(like)))
-    q = apply_sort(
-        q,
-        sort,
-        {
-            "created_at": Issue.created_at,
-            "updated_at": Issue.updated_at,
-            "priority": Issue.priority,
-            "status": Issue.status,
-            "due_date": Issue.due_date,
-        },
+        clause = search_clause(dialect_name(db), Issue, search)
+        if clause is not None:
+            q = q.filter(clause)
+
+    async def build() -> Response:
+        rows = await fetch_page_if_modified(
+            db,
+            request,
+            response,
+            q,
+            ISSUE_VERSIONS,
+            sort=sort,
+            allowed=ISSUE_SORT_FIELDS,
+            tiebreaker=Issue.id,
+            page=page,
+            limit=limit,
+            cursor=cursor,
+            count=count,
+        )
+        if isinstance(rows, Response):
+            return rows
+        return json_response(rows, list[IssueOut], response)
+
+    return await cached_list(request, project.id, build)
+
+
+@router.get("/{project_id}/export")
+async def export_project(
+    request: Request,
+    project: ProjectRef = Depends(get_project_async),
+    export_format: export.ExportFormat = Query(
+        default=export.ExportFormat.ndjson, alias="format"
+    ),
+    comments: bool = Query(default=False),
+    db: AsyncDB = Depends(deps.get_async_db),
+    current_user: Principal = Depends(deps.get_current_user_async),
+):
+    """Stream every issue of a project as NDJSON or CSV.
+
+    Rows come from one server-side cursor query, so the export is a single
+    consistent snapshot and memory stays flat regardless of project size.
+    ``comments=true`` embeds each issue's comments (a JSON column in CSV).
+    """
+    audit_log(
+        "project_export",
+        str(current_user.id),
+        request.client.host if request.client else None,
+        project_id=str(project.id),
+        format=export_format.value,
+        comments=comments,
+    )
+    records = export.export_records(db, project.id, comments)
+    if export_format is export.ExportFormat.csv:
+        body = export.csv_chunks(records, comments)
+        media_type = "text/csv"
+    else:
+        body = export.ndjson_chunks(records)
+        media_type = NDJSON_MEDIA_TYPE
+    filename = f"project-{project.id}.{export_format.value}"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
-    q = apply_pagination(q, page, limit)
-    return q.all()
 
 
 @router.post(
     "/{project_id}/issues", response_model=IssueOut, status_code=status.HTTP_201_CREATED
 )
-def create_project_issue(
+async def create_project_issue(
     payload: IssueCreateForProject,
     request: Request,
-    project: Project = Depends(get_project),
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_user),
+    project: ProjectRef = Depends(get_project_async),
+    db: AsyncDB = Depends(deps.get_async_db),
+    current_user: Principal = Depends(deps.get_current_user_async),
 ):
     issue = Issue(
         title=payload.title,
@@ -180,8 +314,9 @@ def create_project_issue(
         due_date=payload.due_date,
     )
     db.add(issue)
-    db.commit()
-    db.refresh(issue)
+    await db.commit()
+    await response_cache.invalidate(project.id)
+    await db.refresh(issue)
     audit_log(
         "issue_create",
         str(current_user.id),
@@ -0,0 +1,93 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+
+from app.api import deps
+from app.api.query import SEARCH_PATTERN
+from app.db.session import AsyncDB
+from app.models import Comment, Issue, Project
+from app.schemas.search import SearchHit, SearchScope
+from app.services.entity_cache import Principal
+from app.services.search import dialect_name, ranked_search
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+SNIPPET_LENGTH = 200
+
+
+@router.get("/", response_model=list[SearchHit])
+async def search(
+    q: str = Query(min_length=1, max_length=200, pattern=SEARCH_PATTERN),
+    scope: list[SearchScope] = Query(
+        default=[SearchScope.issues, SearchScope.projects]
+    ),
+    include_comments: bool = Query(default=False),
+    project: UUID | None = Query(default=None),
+    limit: int = Query(default=20, ge=1, le=100),
+    db: AsyncDB = Depends(deps.get_async_db),
+    _: Principal = Depends(deps.get_current_user_async),
+):
+    """Ranked full-text hits across issues, projects and, optionally, comments.
+
+    Each word of ``q`` matches a word in the row that starts with it, and all
+    of them must match: ``check`` finds "checkout", but ``bug`` does not find
+    "debugging".
+    """
+    scopes = set(scope)
+    if include_comments:
+        scopes.add(SearchScope.comments)
+    dialect = dialect_name(db)
+    hits: list[SearchHit] = []
+
+    if SearchScope.issues in scopes:
+        stmt = ranked_search(dialect, Issue, q, limit)
+        if stmt is not None:
+            if project:
+                stmt = stmt.where(Issue.project == project)
+            for issue, rank in await db.execute(stmt):
+                hits.append(
+                    SearchHit(
+                        type=SearchScope.issues,
+                        id=issue.id,
+                        title=issue.title,
+                        project=issue.project,
+                        rank=rank,
+                    )
+                )
+
+    if SearchScope.projects in scopes and project is None:
+        stmt = ranked_search(dialect, Project, q, limit)
+        if stmt is not None:
+            for found, rank in await db.execute(stmt):
+                hits.append(
+                    SearchHit(
+                        type=SearchScope.projects,
+                        id=found.id,
+                        title=found.name,
+                        project=found.id,
+                        rank=rank,
+                    )
+                )
+
+    if SearchScope.comments in scopes:
+        stmt = ranked_search(dialect, Comment, q, limit)
+        if stmt is not None:
+            stmt = stmt.add_columns(Issue.project).join_from(
+                Comment, Issue, Issue.id == Comment.issue_id
+            )
+            if project:
+                stmt = stmt.where(Issue.project == project)
+            for comment, rank, issue_project in await db.execute(stmt):
+                hits.append(
+                    SearchHit(
+                        type=SearchScope.comments,
+                        id=comment.id,
+                        title=comment.content[:SNIPPET_LENGTH],
+                        project=issue_project,
+                        issue_id=comment.issue_id,
+                        rank=rank,
+                    )
+                )
+
+    hits.sort(key=lambda hit: hit.rank, reverse=True)
+    return hits[:limit]
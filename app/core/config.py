@@ -4,12 +4,23 @@ from cryptography.fernet import Fernet
 from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+JWT_ALGORITHMS = ("RS256", "ES256", "EdDSA")
+
 
 class Settings(BaseSettings):
     app_name: str = "ai4b-bugtracker"
     env: str = "development"
 
     database_url: str = "postgresql+psycopg2://ai4b:ai4b@db:5432/bugtracker"
+    database_replica_urls: str = ""
+    read_your_writes_seconds: int = 5
+    # None picks the native AsyncSession whenever its driver is installed.
+    db_async: bool | None = None
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping_idle_seconds: float = 30.0
     redis_url: str = "redis://redis:6379/0"
 
     access_token_expire_minutes: int = 15
@@ -17,6 +28,8 @@ class Settings(BaseSettings):
     jwt_alg: str = "RS256"
     jwt_private_key_path: Path = Path("/run/secrets/jwt_private.pem")
     jwt_public_key_path: Path = Path("/run/secrets/jwt_public.pem")
+    jwt_previous_public_key_paths: str = ""
+    jwt_cache_entries: int = 10_000
 
     rate_limit_login: str = "3/minute"
     rate_limit_global: str = "100/minute"
@@ -26,11 +39,33 @@ class Settings(BaseSettings):
         r"^(?=.*[a-z])(?=.*[A-Z])(?=.*\d)(?=.*[^A-Za-z0-9]).{8,}$"
     )
 
+    bulk_import_max_bytes: int = 256 * 1024 * 1024
+    bulk_import_json_max_bytes: int = 16 * 1024 * 1024
+
     cors_origins: str = "http://localhost:3000"
     cors_allow_methods: str = "GET,POST,PATCH,DELETE,OPTIONS"
-    cors_allow_headers: str = "Authorization,Content-Type"
+    cors_allow_headers: str = "Authorization,Content-Type,If-None-Match"
+    cors_expose_headers: str = (
+        "X-Request-ID,X-Next-Cursor,X-Total-Count,X-Total-Count-Mode,ETag"
+    )
     cors_max_age: int = 600
     log_level: str = "INFO"
+    log_queue_size: int = 10_000
+    access_log_sample_rate: float = 1.0
+    access_log_sample_routes: str = ""
+    audit_batch_size: int = 500
+    audit_flush_interval_seconds: float = 1.0
+    audit_max_pending: int = 50_000
+    audit_retention_days: int = 365
+    response_cache_entries: int = 1000
+    response_cache_ttl_seconds: float = 30.0
+    response_cache_stale_seconds: float = 30.0
+    response_cache_redis: bool = False
+    entity_cache_entries: int = 10_000
+    entity_cache_ttl_seconds: float = 60.0
+    entity_cache_redis: bool = False
+    principal_cache_entries: int = 10_000
+    principal_cache_ttl_seconds: float = 30.0
     pii_encryption_key: str | None = None
     pii_hash_key: str = "dev-only-pii-hash-key"
 
@@ -38,6 +73,8 @@ class Settings(BaseSettings):
 
     @model_validator(mode="after")
     def validate_security_settings(self) -> "Settings":
+        if self.jwt_alg not in JWT_ALGORITHMS:
+            raise ValueError(f"JWT_ALG must be one of {', '.join(JWT_ALGORITHMS)}")
         if self.env.lower() == "production" and not self.pii_encryption_key:
             raise ValueError("PII_ENCRYPTION_KEY is required in production")
         if self.pii_encryption_key:
@@ -49,6 +86,18 @@ class Settings(BaseSettings):
                 ) from exc
         return self
 
+    @property
+    def replica_urls(self) -> list[str]:
+        return [u.strip() for u in self.database_replica_urls.split(",") if u.strip()]
+
+    @property
+    def previous_public_key_paths(self) -> list[Path]:
+        return [
+            Path(p.strip())
+            for p in self.jwt_previous_public_key_paths.split(",")
+            if p.strip()
+        ]
+
     @property
     def allowed_origins(self) -> list[str]:
         return [o.strip() for o in self.cors_origins.split(",") if o.strip()]
@@ -63,6 +112,10 @@ class Settings(BaseSettings):
     def allowed_headers(self) -> list[str]:
         return [h.strip() for h in self.cors_allow_headers.split(",") if h.strip()]
 
+    @property
+    def exposed_headers(self) -> list[str]:
+        return [h.strip() for h in self.cors_expose_headers.split(",") if h.strip()]
+
 
 @lru_cache
 def get_settings() -> Settings:
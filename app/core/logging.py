@@ -1,42 +1,243 @@
+import atexit
+import copy
 import json
 import logging
+import queue
+import random
+from collections import deque
 from contextvars import ContextVar
 from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any
+
+from app.core.metrics import log_metrics
+
+
+def _load_orjson() -> Any:
+    # orjson is an optional speedup; the stdlib encoder is the fallback.
+    try:
+        import orjson
+    except ImportError:  # pragma: no cover
+        return None
+    return orjson
+
 
 request_id_ctx: ContextVar[str | None] = ContextVar("request_id", default=None)
 user_id_ctx: ContextVar[str | None] = ContextVar("user_id", default=None)
 client_ip_ctx: ContextVar[str | None] = ContextVar("client_ip", default=None)
 
+CONTEXT_FIELDS = (
+    ("request_id", request_id_ctx),
+    ("user_id", user_id_ctx),
+    ("client_ip", client_ip_ctx),
+)
+# Records from these loggers, and anything at WARNING or above, are never
+# sampled and never dropped when the queue is full.
+UNSAMPLED_LOGGERS = frozenset({"audit"})
+# How long such a record may wait for room in a full queue. Logging runs on
+# the event loop, so the wait is short; after it the record is spilled.
+OVERFLOW_WAIT_SECONDS = 0.005
+# How often an idle listener looks for spilled records.
+SPILL_POLL_SECONDS = 0.1
+
+_listener: "SpillingQueueListener | None" = None
+_orjson = _load_orjson()
+
+
+def _dumps(payload: dict[str, Any]) -> str:
+    if _orjson is not None:
+        return _orjson.dumps(payload, default=str).decode("utf-8")
+    return json.dumps(payload, ensure_ascii=True, default=str)
+
 
 class JsonFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         payload = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": datetime.fromtimestamp(
+                record.created, timezone.utc
+            ).isoformat(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
-        request_id = request_id_ctx.get()
-        user_id = user_id_ctx.get()
-        client_ip = client_ip_ctx.get()
-        if request_id:
-            payload["request_id"] = request_id
-        if user_id:
-            payload["user_id"] = user_id
-        if client_ip:
-            payload["client_ip"] = client_ip
+        for name, var in CONTEXT_FIELDS:
+            # Queued records carry the context captured on the request thread.
+            value = getattr(record, name, None) or var.get()
+            if value:
+                payload[name] = value
         event = getattr(record, "event", None)
         if event is not None:
             payload["event"] = event
         if record.exc_info:
             payload["exc_info"] = self.formatException(record.exc_info)
-        return json.dumps(payload, ensure_ascii=True)
+        elif record.exc_text:
+            payload["exc_info"] = record.exc_text
+        return _dumps(payload)
+
+
+def _must_deliver(record: logging.LogRecord) -> bool:
+    return record.levelno >= logging.WARNING or record.name in UNSAMPLED_LOGGERS
+
+
+class ContextQueueHandler(QueueHandler):
+    """Hand records to a bounded queue; formatting and I/O run on the listener.
+
+    Only the context variables and the interpolated message are resolved on
+    the calling thread. When the queue is full, routine records are dropped
+    and counted. Audit and warning-or-worse records wait up to
+    ``OVERFLOW_WAIT_SECONDS`` for room, then go to the unbounded ``spill``
+    deque that ``SpillingQueueListener`` drains.
+    """
+
+    def __init__(
+        self,
+        log_queue: "queue.Queue[logging.LogRecord]",
+        spill: "deque[logging.LogRecord] | None" = None,
+    ):
+        super().__init__(log_queue)
+        self.log_queue = log_queue
+        self.spill: deque[logging.LogRecord] = deque() if spill is None else spill
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        for name, var in CONTEXT_FIELDS:
+            setattr(record, name, var.get())
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.log_queue.put_nowait(record)
+        except queue.Full:
+            if not _must_deliver(record):
+                log_metrics.incr("dropped")
+                return
+            log_metrics.incr("blocked")
+            try:
+                self.log_queue.put(record, timeout=OVERFLOW_WAIT_SECONDS)
+            except queue.Full:
+                log_metrics.incr("spilled")
+                self.spill.append(record)
+
 
+class SpillingQueueListener(QueueListener):
+    """``QueueListener`` that also handles the records a handler spilled."""
+
+    def __init__(
+        self,
+        log_queue: "queue.Queue[logging.LogRecord]",
+        spill: "deque[logging.LogRecord]",
+        *handlers: logging.Handler,
+        respect_handler_level: bool = False,
+    ):
+        super().__init__(
+            log_queue, *handlers, respect_handler_level=respect_handler_level
+        )
+        self.log_queue = log_queue
+        self.spill = spill
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        # Poll while idle, so a spill that raced the last queued record
+        # still goes out.
+        while True:
+            self.drain_spill()
+            try:
+                return self.log_queue.get(block, timeout=SPILL_POLL_SECONDS)
+            except queue.Empty:
+                if not block:
+                    raise
+
+    def drain_spill(self) -> None:
+        while self.spill:
+            self.handle(self.spill.popleft())
+
+    def stop(self) -> None:
+        super().stop()
+        self.drain_spill()
+
+
+class AccessLogSampler(logging.Filter):
+    """Keep a fraction of 2xx access records, chosen per route.
+
+    ``rules`` maps route prefixes to keep rates; the longest matching prefix
+    wins and ``default`` applies otherwise. Non-2xx records always pass.
+    """
+
+    def __init__(self, default: float = 1.0, rules: dict[str, float] | None = None):
+        super().__init__()
+        self.default = default
+        self.rules = sorted((rules or {}).items(), key=lambda rule: -len(rule[0]))
+
+    def rate_for(self, route: str) -> float:
+        for prefix, rate in self.rules:
+            if route.startswith(prefix):
+                return rate
+        return self.default
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if _must_deliver(record):
+            return True
+        event = getattr(record, "event", None)
+        if not isinstance(event, dict):
+            return True
+        status_code = event.get("status_code", 0)
+        if not 200 <= status_code < 300:
+            return True
+        rate = self.rate_for(event.get("route") or event.get("path", ""))
+        if rate >= 1 or random.random() < rate:
+            return True
+        log_metrics.incr("sampled_out")
+        return False
+
+
+def parse_sample_rules(spec: str) -> dict[str, float]:
+    """Parse ``"/health=0,/api/issues=0.1"`` into ``{prefix: rate}``."""
+    rules = {}
+    for item in spec.split(","):
+        prefix, sep, rate = item.strip().rpartition("=")
+        if sep and prefix:
+            rules[prefix.strip()] = float(rate)
+    return rules
+
+
+@atexit.register
+def _stop_listener() -> None:
+    # stop() drains whatever is still queued before returning.
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def configure_logging(
+    level: str,
+    *,
+    queue_size: int = 10_000,
+    access_sample_rate: float = 1.0,
+    access_sample_routes: str = "",
+) -> None:
+    global _listener
+    _stop_listener()
+    stream = logging.StreamHandler()
+    stream.setFormatter(JsonFormatter())
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=queue_size)
+    spill: deque[logging.LogRecord] = deque()
+    _listener = SpillingQueueListener(
+        log_queue, spill, stream, respect_handler_level=True
+    )
+    _listener.start()
 
-def configure_logging(level: str) -> None:
-    handler = logging.StreamHandler()
-    handler.setFormatter(JsonFormatter())
     root = logging.getLogger()
     root.handlers.clear()
-    root.addHandler(handler)
+    root.addHandler(ContextQueueHandler(log_queue, spill))
     root.setLevel(level.upper())
+
+    access = logging.getLogger("access")
+    access.filters.clear()
+    access.addFilter(
+        AccessLogSampler(access_sample_rate, parse_sample_rules(access_sample_routes))
+    )
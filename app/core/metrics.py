@@ -26,3 +26,106 @@ class MetricsStore:
 
 
 metrics = MetricsStore()
+
+
+class CounterMetrics:
+    """Named counters for one subsystem, reported in ``keys`` order."""
+
+    def __init__(self, keys: tuple[str, ...]) -> None:
+        self.keys = keys
+        self._lock = Lock()
+        self._counters: Counter[str] = Counter()
+
+    def incr(self, key: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[key] += amount
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return {key: self._counters[key] for key in self.keys}
+
+
+# Log records lost to sampling or queue overflow, overflow waits, and records
+# spilled past the queue after a wait timed out.
+log_metrics = CounterMetrics(("dropped", "blocked", "spilled", "sampled_out"))
+
+
+# Audit rows written by the batch writer, failed batches and dropped rows.
+audit_metrics = CounterMetrics(("written", "failed_batches", "dropped"))
+
+
+# Response cache lookups by outcome, plus invalidations and evictions.
+response_cache_metrics = CounterMetrics(
+    ("hits", "stale", "misses", "waits", "invalidations", "evictions", "errors")
+)
+
+
+# Entity and principal cache hits, misses and invalidations.
+ENTITY_CACHE_KEYS = ("hits", "misses", "invalidations", "publish_failures")
+entity_cache_metrics = CounterMetrics(ENTITY_CACHE_KEYS)
+principal_cache_metrics = CounterMetrics(ENTITY_CACHE_KEYS)
+
+
+# Verified-JWT cache hits and misses.
+token_cache_metrics = CounterMetrics(("hits", "misses"))
+
+
+class PoolMetrics:
+    """Checkout and connection lifecycle counters for each named DB pool."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._pools: dict[str, object] = {}
+        self._counters: dict[str, Counter[str]] = {}
+        self._wait_max_ms: dict[str, float] = {}
+
+    def register(self, name: str, pool: object) -> None:
+        with self._lock:
+            self._pools[name] = pool
+            self._counters.setdefault(name, Counter())
+            self._wait_max_ms.setdefault(name, 0.0)
+
+    def incr(self, name: str, key: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters.setdefault(name, Counter())[key] += amount
+
+    def record_wait(self, name: str, wait_ms: float, timed_out: bool = False) -> None:
+        with self._lock:
+            counters = self._counters.setdefault(name, Counter())
+            counters["checkouts" if not timed_out else "timeouts"] += 1
+            counters["wait_ms_total"] += round(wait_ms)
+            self._wait_max_ms[name] = max(self._wait_max_ms.get(name, 0.0), wait_ms)
+
+    def snapshot(self) -> dict[str, object]:
+        with self._lock:
+            result: dict[str, object] = {}
+            for name, counters in self._counters.items():
+                stats: dict[str, object] = {
+                    key: counters[key]
+                    for key in (
+                        "checkouts",
+                        "timeouts",
+                        "wait_ms_total",
+                        "connects",
+                        "invalidations",
+                        "pings",
+                        "ping_failures",
+                    )
+                }
+                stats["wait_ms_max"] = round(self._wait_max_ms.get(name, 0.0), 3)
+                pool = self._pools.get(name)
+                # QueuePool reports live occupancy; SQLite's pools do not.
+                for key, attr in (
+                    ("size", "size"),
+                    ("in_use", "checkedout"),
+                    ("idle", "checkedin"),
+                    ("overflow", "overflow"),
+                ):
+                    method = getattr(pool, attr, None)
+                    if callable(method):
+                        stats[key] = method()
+                result[name] = stats
+            return result
+
+
+pool_metrics = PoolMetrics()
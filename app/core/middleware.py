@@ -0,0 +1,180 @@
+import logging
+import time
+import uuid
+from typing import Any
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.logging import client_ip_ctx, request_id_ctx
+from app.core.metrics import metrics
+
+access_logger = logging.getLogger("access")
+
+SECURITY_HEADERS = (
+    ("Content-Security-Policy", "default-src 'self'"),
+    ("X-Content-Type-Options", "nosniff"),
+    ("X-Frame-Options", "DENY"),
+    ("X-XSS-Protection", "1; mode=block"),
+    ("Referrer-Policy", "no-referrer"),
+)
+HSTS_HEADER = (
+    "Strict-Transport-Security",
+    "max-age=63072000; includeSubDomains; preload",
+)
+BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
+JSON_MEDIA_TYPES = frozenset({"application/json"})
+
+
+def _error(status_code: int, code: str, message: str, request_id: str) -> JSONResponse:
+    return JSONResponse(
+        status_code=status_code,
+        content={"error": {"code": code, "message": message, "request_id": request_id}},
+    )
+
+
+class RequestMiddleware:
+    """Request id, access log, security headers and body checks in one ASGI layer.
+
+    The body limit is checked against ``Content-Length`` up front and again
+    while ``receive()`` chunks are counted, so chunked uploads cannot exceed
+    it either. Once a body goes over, the app sees a disconnect and the
+    client gets the 413 in place of whatever the app answers.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        max_body_bytes: int,
+        bulk_max_bytes: int,
+        bulk_routes: frozenset[tuple[str, str]],
+        bulk_media_types: frozenset[str],
+        hsts: bool = False,
+    ):
+        self.app = app
+        self.max_body_bytes = max_body_bytes
+        self.bulk_max_bytes = bulk_max_bytes
+        self.bulk_routes = bulk_routes
+        self.bulk_media_types = bulk_media_types
+        self.security_headers = SECURITY_HEADERS + ((HSTS_HEADER,) if hsts else ())
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.monotonic()
+        request_id = str(uuid.uuid4())
+        scope.setdefault("state", {})["request_id"] = request_id
+        request_id_ctx.set(request_id)
+        if scope.get("client"):
+            client_ip_ctx.set(scope["client"][0])
+
+        status_code = 500
+        response_started = False
+        too_large = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, response_started
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                response_started = True
+                headers = MutableHeaders(scope=message)
+                headers["X-Request-ID"] = request_id
+                for name, value in self.security_headers:
+                    headers.setdefault(name, value)
+            await send(message)
+
+        headers = Headers(scope=scope)
+        bulk = (scope["method"], scope["path"].rstrip("/")) in self.bulk_routes
+        limit = self.bulk_max_bytes if bulk else self.max_body_bytes
+        rejection = self._check_request(
+            scope["method"], headers, limit, bulk, request_id
+        )
+        received = 0
+
+        async def receive_limited() -> Message:
+            nonlocal received, too_large
+            if too_large:
+                return {"type": "http.disconnect"}
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    too_large = True
+                    return {"type": "http.disconnect"}
+            return message
+
+        async def send_unless_too_large(message: Message) -> None:
+            # Once the body goes over the limit, the 413 replaces the app's answer.
+            if too_large and not response_started:
+                return
+            await send_wrapper(message)
+
+        try:
+            if rejection is not None:
+                await rejection(scope, receive, send_wrapper)
+            else:
+                try:
+                    await self.app(scope, receive_limited, send_unless_too_large)
+                except Exception:
+                    if not (too_large and not response_started):
+                        raise
+                if too_large and not response_started:
+                    await self._too_large(request_id)(scope, receive, send_wrapper)
+        finally:
+            self._log_access(scope, status_code, start)
+
+    def _check_request(
+        self, method: str, headers: Headers, limit: int, bulk: bool, request_id: str
+    ) -> JSONResponse | None:
+        content_length = _content_length(headers)
+        if content_length is not None and content_length > limit:
+            return self._too_large(request_id)
+        if method not in BODY_METHODS:
+            return None
+        has_body = bool(content_length) or "transfer-encoding" in headers
+        if not has_body:
+            return None
+        media_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        allowed = self.bulk_media_types if bulk else JSON_MEDIA_TYPES
+        if media_type not in allowed:
+            return _error(
+                415,
+                "unsupported_media_type",
+                "Content-Type must be application/json",
+                request_id,
+            )
+        return None
+
+    def _too_large(self, request_id: str) -> JSONResponse:
+        return _error(413, "payload_too_large", "Request body too large", request_id)
+
+    def _log_access(self, scope: Scope, status_code: int, start: float) -> None:
+        duration_ms = int((time.monotonic() - start) * 1000)
+        route: Any = scope.get("route")
+        access_logger.info(
+            "request",
+            extra={
+                "event": {
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "route": getattr(route, "path", None),
+                    "status_code": status_code,
+                    "duration_ms": duration_ms,
+                }
+            },
+        )
+        metrics.record(status_code)
+
+
+def _content_length(headers: Headers) -> int | None:
+    value = headers.get("content-length")
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
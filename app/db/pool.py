@@ -0,0 +1,107 @@
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import DisconnectionError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+from app.core.config import settings
+from app.core.metrics import pool_metrics
+
+LAST_USED_KEY = "last_used_at"
+
+
+class _TimedCheckout:
+    metrics_name = "primary"
+
+    def _do_get(self) -> Any:
+        start = time.perf_counter()
+        try:
+            record = super()._do_get()  # type: ignore[misc]
+        except PoolTimeoutError:
+            wait_ms = (time.perf_counter() - start) * 1000
+            pool_metrics.record_wait(self.metrics_name, wait_ms, timed_out=True)
+            raise
+        pool_metrics.record_wait(
+            self.metrics_name, (time.perf_counter() - start) * 1000
+        )
+        return record
+
+    def recreate(self) -> Any:
+        # engine.dispose() swaps in a fresh pool; keep reporting under one name.
+        pool = super().recreate()  # type: ignore[misc]
+        pool.metrics_name = self.metrics_name
+        pool_metrics.register(self.metrics_name, pool)
+        return pool
+
+
+class InstrumentedQueuePool(_TimedCheckout, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_options(db_url: Any, use_async: bool = False) -> dict[str, Any]:
+    if make_url(db_url).get_backend_name() == "sqlite":
+        return {}
+    return {
+        "poolclass": InstrumentedAsyncQueuePool if use_async else InstrumentedQueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+    }
+
+
+def instrument_pool(
+    pool: Pool, name: str, idle_ping_seconds: float | None = None
+) -> Pool:
+    """Attach metrics and idle-aware liveness checks to ``pool``.
+
+    Connections are pinged on checkout only when they have sat unused for
+    longer than ``idle_ping_seconds``; a failed ping raises
+    ``DisconnectionError`` so the pool discards the connection and retries.
+    """
+    if idle_ping_seconds is None:
+        idle_ping_seconds = settings.db_pool_pre_ping_idle_seconds
+    if isinstance(pool, _TimedCheckout):
+        pool.metrics_name = name
+    pool_metrics.register(name, pool)
+
+    @event.listens_for(pool, "connect")
+    def _on_connect(dbapi_connection, record):
+        record.info[LAST_USED_KEY] = time.monotonic()
+        pool_metrics.incr(name, "connects")
+
+    @event.listens_for(pool, "checkout")
+    def _on_checkout(dbapi_connection, record, proxy):
+        last_used = record.info.get(LAST_USED_KEY)
+        if (
+            idle_ping_seconds >= 0
+            and last_used is not None
+            and time.monotonic() - last_used > idle_ping_seconds
+        ):
+            pool_metrics.incr(name, "pings")
+            try:
+                cursor = dbapi_connection.cursor()
+                try:
+                    cursor.execute("SELECT 1")
+                finally:
+                    cursor.close()
+            except Exception as exc:
+                pool_metrics.incr(name, "ping_failures")
+                raise DisconnectionError() from exc
+
+    @event.listens_for(pool, "checkin")
+    def _on_checkin(dbapi_connection, record):
+        record.info[LAST_USED_KEY] = time.monotonic()
+
+    @event.listens_for(pool, "invalidate")
+    def _on_invalidate(dbapi_connection, record, exception):
+        pool_metrics.incr(name, "invalidations")
+
+    return pool
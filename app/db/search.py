@@ -0,0 +1,76 @@
+"""Full-text search indexes: tsvector + GIN on Postgres, FTS5 on SQLite."""
+
+from sqlalchemy import DDL, Table, event
+
+SEARCH_CONFIG = "simple"
+SEARCH_VECTOR_COLUMN = "search_vector"
+SEARCH_WEIGHTS = "ABCD"
+
+SEARCHABLE: dict[str, tuple[str, ...]] = {}
+
+
+def fts_table_name(table_name: str) -> str:
+    return f"{table_name}_fts"
+
+
+def tsvector_expression(columns: tuple[str, ...]) -> str:
+    parts = [
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce({column}, '')), "
+        f"'{SEARCH_WEIGHTS[min(index, len(SEARCH_WEIGHTS) - 1)]}')"
+        for index, column in enumerate(columns)
+    ]
+    return " || ".join(parts)
+
+
+def postgres_ddl(table_name: str, columns: tuple[str, ...]) -> list[str]:
+    add_column = (
+        f"ALTER TABLE {table_name} ADD COLUMN {SEARCH_VECTOR_COLUMN} tsvector "
+        f"GENERATED ALWAYS AS ({tsvector_expression(columns)}) STORED"
+    )
+    create_index = (
+        f"CREATE INDEX ix_{table_name}_{SEARCH_VECTOR_COLUMN} ON {table_name} "
+        f"USING GIN ({SEARCH_VECTOR_COLUMN})"
+    )
+    return [add_column, create_index]
+
+
+def sqlite_ddl(table_name: str, columns: tuple[str, ...]) -> list[str]:
+    # External-content FTS5 table keyed on the implicit rowid; triggers keep it
+    # in step with the base table inside the writing transaction.
+    fts = fts_table_name(table_name)
+    cols = ", ".join(columns)
+    new_values = ", ".join(f"new.{column}" for column in columns)
+    old_values = ", ".join(f"old.{column}" for column in columns)
+    insert_new = f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.rowid, {new_values});"
+    delete_old = (
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) "
+        f"VALUES ('delete', old.rowid, {old_values});"
+    )
+    create_table = (
+        f"CREATE VIRTUAL TABLE {fts} USING fts5({cols}, "
+        f"content='{table_name}', content_rowid='rowid')"
+    )
+    on_update = f"AFTER UPDATE OF {cols} ON {table_name}"
+    return [
+        create_table,
+        f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table_name} BEGIN {insert_new} END",
+        f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table_name} BEGIN {delete_old} END",
+        f"CREATE TRIGGER {fts}_au {on_update} BEGIN {delete_old} {insert_new} END",
+    ]
+
+
+def register_search_index(table: Table, *columns: str) -> None:
+    SEARCHABLE[table.name] = columns
+    for statement in postgres_ddl(table.name, columns):
+        event.listen(
+            table, "after_create", DDL(statement).execute_if(dialect="postgresql")
+        )
+    for statement in sqlite_ddl(table.name, columns):
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+    event.listen(
+        table,
+        "before_drop",
+        DDL(f"DROP TABLE IF EXISTS {fts_table_name(table.name)}").execute_if(
+            dialect="sqlite"
+        ),
+    )
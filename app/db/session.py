@@ -1,25 +1,122 @@
+import importlib.util
+from collections.abc import AsyncIterator, Callable
+from itertools import count
+from typing import Any
+
+from anyio import to_thread
 from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 from app.core.config import settings
+from app.db.pool import instrument_pool, pool_options
 
 Base = declarative_base()
 
 _engine = None
 _SessionLocal = None
+_async_engine = None
+_AsyncSessionLocal = None
+_replica_engines: list[Any] | None = None
+_async_replica_engines: list[Any] | None = None
+_replica_turn = count()
 
+ASYNC_DRIVERS = {"postgresql": "postgresql+asyncpg", "sqlite": "sqlite+aiosqlite"}
 
-def _create_engine():
+
+def _engine_options() -> tuple[str, dict[str, Any]]:
     db_url = settings.database_url
-    connect_args = {}
+    connect_args: dict[str, Any] = {}
     if settings.env.lower() == "test":
         db_url = "sqlite+pysqlite:///:memory:"
         connect_args = {"check_same_thread": False}
-    return create_engine(
-        db_url, pool_pre_ping=True, future=True, connect_args=connect_args
+    return db_url, connect_args
+
+
+def _create_engine():
+    db_url, connect_args = _engine_options()
+    engine = create_engine(
+        db_url, future=True, connect_args=connect_args, **pool_options(db_url)
+    )
+    instrument_pool(engine.pool, "primary")
+    return engine
+
+
+def async_url(db_url: str) -> URL:
+    url = make_url(db_url)
+    driver = ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None:
+        raise ValueError(f"No async driver configured for {url.get_backend_name()}")
+    return url.set(drivername=driver)
+
+
+def async_driver_installed(db_url: str) -> bool:
+    driver = ASYNC_DRIVERS.get(make_url(db_url).get_backend_name())
+    return driver is not None and (
+        importlib.util.find_spec(driver.split("+")[1]) is not None
     )
 
 
+def use_native_async() -> bool:
+    """Whether async routes get a native ``AsyncSession``.
+
+    ``DB_ASYNC`` decides when set. Otherwise the native session is used once
+    the async driver for ``DATABASE_URL`` is installed (the ``async`` extra),
+    since ``ThreadedSession`` pays a thread hop per awaited call. Tests run on
+    a private in-memory SQLite that only the sync engine can see.
+    """
+    if settings.db_async is not None:
+        return settings.db_async
+    if settings.env.lower() == "test":
+        return False
+    return async_driver_installed(settings.database_url)
+
+
+def _create_async_engine():
+    url = async_url(_engine_options()[0])
+    engine = create_async_engine(url, **pool_options(url, use_async=True))
+    instrument_pool(engine.sync_engine.pool, "primary_async")
+    return engine
+
+
+def _create_replica_engines(use_async: bool = False) -> list[Any]:
+    engines = []
+    engine: Any
+    for index, db_url in enumerate(settings.replica_urls):
+        if use_async:
+            url = async_url(db_url)
+            engine = create_async_engine(url, **pool_options(url, use_async=True))
+            instrument_pool(engine.sync_engine.pool, f"replica{index}_async")
+        else:
+            engine = create_engine(db_url, future=True, **pool_options(db_url))
+            instrument_pool(engine.pool, f"replica{index}")
+        engines.append(engine)
+    return engines
+
+
+def has_replicas() -> bool:
+    return bool(settings.replica_urls)
+
+
+def get_replica_engines() -> list[Any]:
+    global _replica_engines
+    if _replica_engines is None:
+        _replica_engines = _create_replica_engines()
+    return _replica_engines
+
+
+def get_async_replica_engines() -> list[Any]:
+    global _async_replica_engines
+    if _async_replica_engines is None:
+        _async_replica_engines = _create_replica_engines(use_async=True)
+    return _async_replica_engines
+
+
+def _next_replica(engines: list[Any]) -> Any:
+    return engines[next(_replica_turn) % len(engines)]
+
+
 def get_engine():
     global _engine
     if _engine is None:
@@ -27,15 +124,37 @@ def get_engine():
     return _engine
 
 
+def get_async_engine():
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = _create_async_engine()
+    return _async_engine
+
+
 def get_session_local():
     global _SessionLocal
     if _SessionLocal is None:
+        # Routes refresh explicitly after commit; keeping instances loaded avoids
+        # implicit reloads when a sync session is driven from async routes.
         _SessionLocal = sessionmaker(
-            autocommit=False, autoflush=False, bind=get_engine(), future=True
+            autocommit=False,
+            autoflush=False,
+            bind=get_engine(),
+            future=True,
+            expire_on_commit=False,
         )
     return _SessionLocal
 
 
+def get_async_session_local():
+    global _AsyncSessionLocal
+    if _AsyncSessionLocal is None:
+        _AsyncSessionLocal = async_sessionmaker(
+            get_async_engine(), autoflush=False, expire_on_commit=False
+        )
+    return _AsyncSessionLocal
+
+
 def SessionLocal():
     return get_session_local()()
 
@@ -46,3 +165,100 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with get_async_session_local()() as db:
+        yield db
+
+
+def ReplicaSession() -> Session:
+    return get_session_local()(bind=_next_replica(get_replica_engines()))
+
+
+def AsyncReplicaSession() -> AsyncSession:
+    return get_async_session_local()(bind=_next_replica(get_async_replica_engines()))
+
+
+class ThreadedSession:
+    """AsyncSession-compatible facade that runs a sync Session in worker threads.
+
+    Lets async routes share one implementation between the sync and async
+    database modes; each awaited call holds a worker thread only for the
+    duration of that database round-trip.
+    """
+
+    def __init__(self, session: Session):
+        self.sync_session = session
+
+    def add(self, instance: Any) -> None:
+        self.sync_session.add(instance)
+
+    def add_all(self, instances: Any) -> None:
+        self.sync_session.add_all(instances)
+
+    def get_bind(self, *args: Any, **kwargs: Any) -> Any:
+        return self.sync_session.get_bind(*args, **kwargs)
+
+    async def _run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        return await to_thread.run_sync(lambda: fn(*args, **kwargs))
+
+    async def run_sync(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        return await self._run(fn, self.sync_session, *args, **kwargs)
+
+    async def get(self, entity: Any, ident: Any, **kwargs: Any) -> Any:
+        return await self._run(self.sync_session.get, entity, ident, **kwargs)
+
+    async def execute(self, statement: Any, params: Any = None, **kwargs: Any) -> Any:
+        # Like AsyncSession, fetch every row inside the worker thread.
+        kwargs["execution_options"] = {
+            **kwargs.get("execution_options", {}),
+            "prebuffer_rows": True,
+        }
+        return await self._run(self.sync_session.execute, statement, params, **kwargs)
+
+    async def scalars(self, statement: Any, params: Any = None, **kwargs: Any) -> Any:
+        result = await self.execute(statement, params, **kwargs)
+        return result.scalars()
+
+    async def scalar(self, statement: Any, params: Any = None, **kwargs: Any) -> Any:
+        return await self._run(self.sync_session.scalar, statement, params, **kwargs)
+
+    async def stream(
+        self, statement: Any, params: Any = None, **kwargs: Any
+    ) -> AsyncIterator[Any]:
+        """Iterate rows without buffering; each partition is fetched in a thread.
+
+        Pair with the ``yield_per`` execution option to bound rows per fetch.
+        """
+        result = await self._run(self.sync_session.execute, statement, params, **kwargs)
+        return self._iterate_partitions(result.partitions())
+
+    async def stream_scalars(
+        self, statement: Any, params: Any = None, **kwargs: Any
+    ) -> AsyncIterator[Any]:
+        result = await self._run(self.sync_session.scalars, statement, params, **kwargs)
+        return self._iterate_partitions(result.partitions())
+
+    async def _iterate_partitions(self, partitions: Any) -> AsyncIterator[Any]:
+        while True:
+            partition = await self._run(next, partitions, None)
+            if partition is None:
+                return
+            for row in partition:
+                yield row
+
+    async def flush(self) -> None:
+        await self._run(self.sync_session.flush)
+
+    async def commit(self) -> None:
+        await self._run(self.sync_session.commit)
+
+    async def rollback(self) -> None:
+        await self._run(self.sync_session.rollback)
+
+    async def refresh(self, instance: Any) -> None:
+        await self._run(self.sync_session.refresh, instance)
+
+
+AsyncDB = AsyncSession | ThreadedSession
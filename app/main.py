@@ -1,20 +1,56 @@
 import logging
 import time
-import uuid
+from contextlib import asynccontextmanager
 
+from anyio import to_thread
 from fastapi import FastAPI, HTTPException, Request
+from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.responses import JSONResponse, Response
-from app.api.routes import auth, projects, issues, comments
+from starlette.responses import JSONResponse
+from app.api.routes import auth, projects, issues, comments, search, me, audit
 from app.core.config import settings
-from app.core.logging import client_ip_ctx, configure_logging, request_id_ctx
+from app.core.logging import configure_logging
 from app.core.limiter import limiter
-from app.core.metrics import metrics
+from app.core.middleware import RequestMiddleware
+from app.core.metrics import (
+    audit_metrics,
+    entity_cache_metrics,
+    principal_cache_metrics,
+    log_metrics,
+    metrics,
+    pool_metrics,
+    response_cache_metrics,
+    token_cache_metrics,
+)
+from app.services.audit import audit_buffer
+from app.services.entity_cache import entity_cache, principal_cache
+from app.services.response_cache import response_cache
+from app.services.security import verified_tokens
+
+configure_logging(
+    settings.log_level,
+    queue_size=settings.log_queue_size,
+    access_sample_rate=settings.access_log_sample_rate,
+    access_sample_routes=settings.access_log_sample_routes,
+)
+
 
-configure_logging(settings.log_level)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    audit_buffer.start()
+    entity_cache.start()
+    principal_cache.start()
+    try:
+        yield
+    finally:
+        principal_cache.stop()
+        entity_cache.stop()
+        # Writes out events still buffered at shutdown.
+        await to_thread.run_sync(audit_buffer.stop)
 
-app = FastAPI(title=settings.app_name)
+
+app = FastAPI(title=settings.app_name, lifespan=lifespan)
 rate_limit_enabled = settings.env.lower() != "test"
 if rate_limit_enabled:
     from slowapi.errors import RateLimitExceeded
@@ -29,93 +65,26 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=settings.allowed_methods,
     allow_headers=settings.allowed_headers,
+    expose_headers=settings.exposed_headers,
     max_age=settings.cors_max_age,
 )
 
 
-@app.middleware("http")
-async def add_request_id(request: Request, call_next):
-    request_id = str(uuid.uuid4())
-    request.state.request_id = request_id
-    request_id_ctx.set(request_id)
-    if request.client:
-        client_ip_ctx.set(request.client.host)
-    start = time.monotonic()
-    response: Response = await call_next(request)
-    response.headers["X-Request-ID"] = request_id
-    duration_ms = int((time.monotonic() - start) * 1000)
-    logging.getLogger("access").info(
-        "request",
-        extra={
-            "event": {
-                "method": request.method,
-                "path": request.url.path,
-                "status_code": response.status_code,
-                "duration_ms": duration_ms,
-            }
-        },
-    )
-    metrics.record(response.status_code)
-    return response
-
-
-@app.middleware("http")
-async def security_headers(request: Request, call_next):
-    response: Response = await call_next(request)
-    response.headers.setdefault("Content-Security-Policy", "default-src 'self'")
-    response.headers.setdefault("X-Content-Type-Options", "nosniff")
-    response.headers.setdefault("X-Frame-Options", "DENY")
-    response.headers.setdefault("X-XSS-Protection", "1; mode=block")
-    response.headers.setdefault("Referrer-Policy", "no-referrer")
-    if settings.env.lower() == "production":
-        response.headers.setdefault(
-            "Strict-Transport-Security", "max-age=63072000; includeSubDomains; preload"
-        )
-    return response
-
-
-@app.middleware("http")
-async def limit_body_size(request: Request, call_next):
-    content_length = request.headers.get("content-length")
-    if content_length and int(content_length) > 1_000_000:
-        return JSONResponse(
-            status_code=413,
-            content={
-                "error": {
-                    "code": "payload_too_large",
-                    "message": "Request body too large",
-                    "request_id": getattr(request.state, "request_id", None),
-                }
-            },
-        )
-    return await call_next(request)
-
-
-@app.middleware("http")
-async def enforce_json_content_type(request: Request, call_next):
-    if request.method in {"POST", "PUT", "PATCH"}:
-        content_length = request.headers.get("content-length")
-        has_body = False
-        if content_length:
-            try:
-                has_body = int(content_length) > 0
-            except ValueError:
-                has_body = False
-        if has_body:
-            content_type = request.headers.get("content-type", "")
-            media_type = content_type.split(";")[0].strip().lower()
-            if media_type != "application/json":
-                return JSONResponse(
-                    status_code=415,
-                    content={
-                        "error": {
-                            "code": "unsupported_media_type",
-                            "message": "Content-Type must be application/json",
-                            "request_id": getattr(request.state, "request_id", None),
-                        }
-                    },
-                )
-    return await call_next(request)
+MAX_BODY_BYTES = 1_000_000
+# Bulk import routes take large bodies and NDJSON streams. Matched on method
+# too: PATCH /api/issues/bulk is the bulk update and keeps the normal limits.
+BULK_IMPORT_ROUTES = frozenset({("POST", "/api/issues/bulk")})
+BULK_MEDIA_TYPES = frozenset({"application/json", "application/x-ndjson"})
+
+# Added last so it wraps everything else, including CORS and rate limiting.
+app.add_middleware(
+    RequestMiddleware,
+    max_body_bytes=MAX_BODY_BYTES,
+    bulk_max_bytes=settings.bulk_import_max_bytes,
+    bulk_routes=BULK_IMPORT_ROUTES,
+    bulk_media_types=BULK_MEDIA_TYPES,
+    hsts=settings.env.lower() == "production",
+)
 
 
 @app.get("/health/live")
@@ -130,7 +99,28 @@ def ready():
 
 @app.get("/metrics")
 def metrics_endpoint():
-    return metrics.snapshot()
+    return {
+        **metrics.snapshot(),
+        "db_pools": pool_metrics.snapshot(),
+        "logging": log_metrics.snapshot(),
+        "audit": {**audit_metrics.snapshot(), "pending": audit_buffer.pending()},
+        "response_cache": {
+            **response_cache_metrics.snapshot(),
+            "entries": len(response_cache),
+        },
+        "entity_cache": {
+            **entity_cache_metrics.snapshot(),
+            "entries": len(entity_cache),
+        },
+        "principal_cache": {
+            **principal_cache_metrics.snapshot(),
+            "entries": len(principal_cache),
+        },
+        "token_cache": {
+            **token_cache_metrics.snapshot(),
+            "entries": len(verified_tokens),
+        },
+    }
 
 
 @app.exception_handler(Exception)
@@ -199,7 +189,9 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
             "error": {
                 "code": "validation_error",
                 "message": "Validation error",
-                "details": exc.errors(),
+                "details": jsonable_encoder(
+                    exc.errors(), custom_encoder={Exception: str}
+                ),
                 "request_id": getattr(request.state, "request_id", None),
             }
         },
@@ -224,3 +216,6 @@ app.include_router(auth.router, prefix="/api")
 app.include_router(projects.router, prefix="/api")
 app.include_router(issues.router, prefix="/api")
 app.include_router(comments.router, prefix="/api")
+app.include_router(search.router, prefix="/api")
+app.include_router(me.router, prefix="/api")
+app.include_router(audit.router, prefix="/api")
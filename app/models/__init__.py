@@ -2,6 +2,8 @@ from app.models.user import User, UserRole
 from app.models.project import Project
 from app.models.issue import Issue, IssuePriority, IssueStatus
 from app.models.comment import Comment
+from app.models.project_counter import ProjectIssueCounter
+from app.models.audit_event import AuditEvent
 
 __all__ = [
     "User",
@@ -11,4 +13,6 @@ __all__ = [
     "IssueStatus",
     "IssuePriority",
     "Comment",
+    "ProjectIssueCounter",
+    "AuditEvent",
 ]
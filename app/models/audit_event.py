@@ -0,0 +1,37 @@
+import uuid
+from datetime import UTC, datetime
+
+from sqlalchemy import JSON, Column, DateTime, Index, String
+
+from app.db.session import Base
+from app.db.types import GUID
+
+
+class AuditEvent(Base):
+    """Append-only record of one ``audit_log`` call.
+
+    Rows are never updated. ``occurred_at`` leads the primary key so the table
+    can be range-partitioned by time on Postgres, and retention drops whole
+    partitions instead of deleting rows.
+    """
+
+    __tablename__ = "audit_events"
+    __table_args__ = (
+        Index("ix_audit_events_issue_occurred_at", "issue_id", "occurred_at", "id"),
+        Index("ix_audit_events_project_occurred_at", "project_id", "occurred_at", "id"),
+        Index("ix_audit_events_user_occurred_at", "user_id", "occurred_at", "id"),
+    )
+
+    occurred_at = Column(
+        DateTime(timezone=True),
+        primary_key=True,
+        default=lambda: datetime.now(UTC),
+    )
+    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    event = Column(String(64), nullable=False)
+    # Plain columns rather than foreign keys: history outlives deleted rows.
+    user_id = Column(String(64), nullable=True)
+    ip = Column(String(64), nullable=True)
+    issue_id = Column(GUID(), nullable=True)
+    project_id = Column(GUID(), nullable=True)
+    details = Column(JSON, nullable=False, default=dict)
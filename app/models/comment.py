@@ -1,14 +1,30 @@
 import uuid
-from datetime import datetime, timezone
-from sqlalchemy import Column, DateTime, ForeignKey, Text
+from datetime import UTC, datetime
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Text,
+    event,
+    inspect,
+    update,
+)
 from sqlalchemy.orm import relationship
 
+from app.db.search import register_search_index
 from app.db.session import Base
 from app.db.types import GUID
+from app.models.issue import Issue
 
 
 class Comment(Base):
     __tablename__ = "comments"
+    __table_args__ = (
+        Index("ix_comments_issue_id_created_at", "issue_id", "created_at", "id"),
+        Index("ix_comments_author_id", "author_id"),
+    )
 
     id = Column(GUID(), primary_key=True, default=uuid.uuid4)
     content = Column(Text, nullable=False)
@@ -18,15 +34,56 @@ class Comment(Base):
     author_id = Column(
         GUID(), ForeignKey("users.id", ondelete="RESTRICT"), nullable=False
     )
-    created_at = Column(
-        DateTime, default=lambda: datetime.now(timezone.utc), nullable=False
-    )
+    created_at = Column(DateTime, default=lambda: datetime.now(UTC), nullable=False)
     updated_at = Column(
         DateTime,
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        default=lambda: datetime.now(UTC),
+        onupdate=lambda: datetime.now(UTC),
         nullable=False,
     )
 
     issue = relationship("Issue", back_populates="comments")
     author = relationship("User")
+
+
+register_search_index(Comment.__table__, "content")
+
+
+def _touch_issue(connection, issue_id, **values) -> None:
+    # Single UPDATE inside the flush, so the counter moves with the comment row
+    # and concurrent writers cannot lose increments; updated_at is left alone.
+    issues = Issue.__table__
+    connection.execute(
+        update(issues)
+        .where(issues.c.id == issue_id)
+        .values(
+            last_activity_at=datetime.now(UTC),
+            updated_at=issues.c.updated_at,
+            **values,
+        )
+    )
+
+
+@event.listens_for(Comment, "after_insert")
+def _comment_added(mapper, connection, target) -> None:
+    _touch_issue(
+        connection,
+        target.issue_id,
+        comment_count=Issue.__table__.c.comment_count + 1,
+    )
+
+
+@event.listens_for(Comment, "after_update")
+def _comment_edited(mapper, connection, target) -> None:
+    # Only an edit to the text counts as activity, not any flush of the row.
+    if inspect(target).attrs.content.history.has_changes():
+        _touch_issue(connection, target.issue_id)
+
+
+@event.listens_for(Comment, "after_delete")
+def _comment_removed(mapper, connection, target) -> None:
+    _touch_issue(
+        connection,
+        target.issue_id,
+        comment_count=Issue.__table__.c.comment_count - 1,
+    )
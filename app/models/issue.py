@@ -1,9 +1,25 @@
 import enum
 import uuid
-from datetime import datetime, timezone
-from sqlalchemy import Column, Date, DateTime, Enum, ForeignKey, String, Text
+from datetime import UTC, datetime
+
+from sqlalchemy import (
+    Column,
+    Date,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    SmallInteger,
+    String,
+    Text,
+    literal_column,
+    text,
+)
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import ColumnElement
 
+from app.db.search import register_search_index
 from app.db.session import Base
 from app.db.types import GUID
 
@@ -25,6 +41,17 @@ class IssuePriority(str, enum.Enum):
 
 class Issue(Base):
     __tablename__ = "issues"
+    __table_args__ = (
+        Index("ix_issues_project_status_created_at", "project", "status", "created_at"),
+        Index("ix_issues_project_created_at", "project", "created_at", "id"),
+        Index("ix_issues_status_created_at", "status", "created_at"),
+        Index("ix_issues_created_at", "created_at", "id"),
+        Index("ix_issues_reporter", "reporter"),
+        Index(
+            "ix_issues_project_last_activity_at", "project", "last_activity_at", "id"
+        ),
+        Index("ix_issues_project_comment_count", "project", "comment_count", "id"),
+    )
 
     id = Column(GUID(), primary_key=True, default=uuid.uuid4)
     title = Column(String(200), nullable=False)
@@ -41,13 +68,19 @@ class Issue(Base):
         GUID(), ForeignKey("users.id", ondelete="SET NULL"), nullable=True
     )
     due_date = Column(Date, nullable=True)
-    created_at = Column(
-        DateTime, default=lambda: datetime.now(timezone.utc), nullable=False
-    )
+    # Denormalized from comments; maintained by the Comment mapper events.
+    comment_count = Column(Integer, nullable=False, default=0, server_default="0")
+    created_at = Column(DateTime, default=lambda: datetime.now(UTC), nullable=False)
     updated_at = Column(
         DateTime,
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        default=lambda: datetime.now(UTC),
+        onupdate=lambda: datetime.now(UTC),
+        nullable=False,
+    )
+    last_activity_at = Column(
+        DateTime,
+        default=lambda: datetime.now(UTC),
+        onupdate=lambda: datetime.now(UTC),
         nullable=False,
     )
 
@@ -57,3 +90,35 @@ class Issue(Base):
     comments = relationship(
         "Comment", cascade="all, delete-orphan", back_populates="issue"
     )
+
+
+def _rank(column: Column, order: list[enum.Enum]) -> ColumnElement[int]:
+    # Inline literals rather than bound parameters, so queries repeat the
+    # indexed expression exactly.
+    whens = " ".join(
+        f"WHEN '{member.name}' THEN {rank}" for rank, member in enumerate(order)
+    )
+    return literal_column(f"(CASE {column.name} {whens} END)", SmallInteger())
+
+
+# Explicit sort ranks: Postgres orders enums by declaration, SQLite by name.
+# Statuses keep their declaration order; the most urgent priority ranks 0.
+STATUS_RANK = _rank(Issue.status, list(IssueStatus))
+PRIORITY_RANK = _rank(Issue.priority, list(reversed(IssuePriority)))
+
+# Serves the "my work" inbox in index order: one assignee's issues by status
+# rank, priority rank, then due date. Postgres reads the per-project group
+# counts from the index alone.
+Index(
+    "ix_issues_assignee_inbox",
+    Issue.assignee,
+    STATUS_RANK,
+    PRIORITY_RANK,
+    Issue.due_date,
+    Issue.id,
+    postgresql_where=text("assignee IS NOT NULL"),
+    sqlite_where=text("assignee IS NOT NULL"),
+    postgresql_include=["project", "status"],
+)
+
+register_search_index(Issue.__table__, "title", "description")
@@ -1,14 +1,19 @@
 from datetime import datetime, timezone
 import uuid
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, String
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, String
 from sqlalchemy.orm import relationship
 
+from app.db.search import register_search_index
 from app.db.session import Base
 from app.db.types import GUID
 
 
 class Project(Base):
     __tablename__ = "projects"
+    __table_args__ = (
+        Index("ix_projects_created_by_id", "created_by_id"),
+        Index("ix_projects_is_archived_created_at", "is_archived", "created_at", "id"),
+    )
 
     id = Column(GUID(), primary_key=True, default=uuid.uuid4)
     name = Column(String(100), unique=True, nullable=False, index=True)
@@ -28,3 +33,6 @@ class Project(Base):
     is_archived = Column(Boolean, default=False, nullable=False)
 
     creator = relationship("User")
+
+
+register_search_index(Project.__table__, "name", "description")
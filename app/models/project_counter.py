@@ -0,0 +1,80 @@
+from collections import Counter
+from typing import Any
+
+from sqlalchemy import Column, Enum, ForeignKey, Integer, event, inspect
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.db.session import Base
+from app.db.types import GUID
+from app.models.issue import Issue, IssuePriority, IssueStatus
+
+# (project, status, priority) -> change in issue count
+CounterKey = tuple[Any, IssueStatus, IssuePriority]
+
+
+class ProjectIssueCounter(Base):
+    """Issue count per project for each (status, priority) pair."""
+
+    __tablename__ = "project_issue_counters"
+
+    project_id = Column(
+        GUID(), ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True
+    )
+    status = Column(Enum(IssueStatus), primary_key=True)
+    priority = Column(Enum(IssuePriority), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+
+def counter_statements(dialect: str, deltas: Counter) -> list[Any]:
+    """Upsert statements adding ``deltas`` to the counter rows.
+
+    Deltas are applied as ``count = count + delta`` in SQL, so concurrent
+    writers never overwrite each other.
+    """
+    rows = [
+        {"project_id": project, "status": status, "priority": priority, "count": delta}
+        for (project, status, priority), delta in deltas.items()
+        if delta
+    ]
+    if not rows:
+        return []
+    insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+    stmt = insert(ProjectIssueCounter.__table__).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["project_id", "status", "priority"],
+        set_={"count": ProjectIssueCounter.__table__.c.count + stmt.excluded.count},
+    )
+    return [stmt]
+
+
+def _apply(connection, deltas: Counter) -> None:
+    for stmt in counter_statements(connection.dialect.name, deltas):
+        connection.execute(stmt)
+
+
+def _key(target: Issue) -> CounterKey:
+    return (target.project, target.status, target.priority)
+
+
+@event.listens_for(Issue, "after_insert")
+def _issue_added(mapper, connection, target) -> None:
+    _apply(connection, Counter({_key(target): 1}))
+
+
+@event.listens_for(Issue, "after_update")
+def _issue_changed(mapper, connection, target) -> None:
+    state = inspect(target)
+    previous = []
+    for name in ("project", "status", "priority"):
+        history = state.attrs[name].history
+        previous.append(
+            history.deleted[0] if history.deleted else getattr(target, name)
+        )
+    old_key, new_key = tuple(previous), _key(target)
+    if old_key != new_key:
+        _apply(connection, Counter({old_key: -1, new_key: 1}))
+
+
+@event.listens_for(Issue, "after_delete")
+def _issue_removed(mapper, connection, target) -> None:
+    _apply(connection, Counter({_key(target): -1}))
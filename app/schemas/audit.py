@@ -0,0 +1,21 @@
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+
+class ActivityEntry(BaseModel):
+    id: UUID
+    occurred_at: datetime
+    event: str
+    user_id: str | None
+    issue_id: UUID | None
+    project_id: UUID | None
+    details: dict[str, Any]
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class AuditEventOut(ActivityEntry):
+    ip: str | None
@@ -1,7 +1,7 @@
 from datetime import date, datetime
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 from app.models.issue import IssuePriority, IssueStatus
 
 
@@ -36,7 +36,78 @@ class IssueOut(IssueBase):
     project: UUID
     reporter: UUID
     assignee: UUID | None
+    comment_count: int = 0
     created_at: datetime
     updated_at: datetime
+    last_activity_at: datetime | None = None
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class BulkIssueResult(BaseModel):
+    index: int
+    id: UUID | None = None
+    error: str | None = None
+
+
+class BulkIssueSummary(BaseModel):
+    created: int
+    failed: int
+    results: list[BulkIssueResult]
+
+
+class BulkIssueUpdateItem(IssueUpdate):
+    id: UUID
+
+
+class BulkIssueUpdate(BaseModel):
+    """Either one ``update`` applied to every id in ``ids``, or per-id ``items``."""
+
+    ids: list[UUID] = Field(default_factory=list, max_length=1000)
+    update: IssueUpdate | None = None
+    items: list[BulkIssueUpdateItem] = Field(default_factory=list, max_length=1000)
+
+    @model_validator(mode="after")
+    def check_shape(self) -> "BulkIssueUpdate":
+        if self.items and (self.ids or self.update is not None):
+            raise ValueError("Send either ids with update, or items")
+        if not self.items and (not self.ids or self.update is None):
+            raise ValueError("ids and update are required when items is empty")
+        return self
+
+    def pairs(self) -> list[tuple[UUID, IssueUpdate]]:
+        if self.items:
+            return [
+                (
+                    item.id,
+                    IssueUpdate.model_validate(
+                        item.model_dump(exclude_unset=True, exclude={"id"})
+                    ),
+                )
+                for item in self.items
+            ]
+        assert self.update is not None
+        return [(issue_id, self.update) for issue_id in self.ids]
+
+
+class BulkIssueUpdateResult(BaseModel):
+    id: UUID
+    updated: bool
+    error: str | None = None
+
+
+class BulkIssueUpdateSummary(BaseModel):
+    updated: int
+    failed: int
+    results: list[BulkIssueUpdateResult]
+
+
+class InboxGroup(BaseModel):
+    project: UUID
+    status: IssueStatus
+    count: int
+
+
+class MyIssues(BaseModel):
+    groups: list[InboxGroup]
+    items: list[IssueOut]
@@ -3,6 +3,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.models.issue import IssuePriority, IssueStatus
+
 
 class ProjectBase(BaseModel):
     name: str = Field(min_length=1, max_length=100)
@@ -27,3 +29,10 @@ class ProjectOut(ProjectBase):
     created_by_id: UUID
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class ProjectSummary(BaseModel):
+    project_id: UUID
+    total: int
+    by_status: dict[IssueStatus, int]
+    by_priority: dict[IssuePriority, int]
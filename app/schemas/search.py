@@ -0,0 +1,19 @@
+import enum
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class SearchScope(str, enum.Enum):
+    issues = "issues"
+    projects = "projects"
+    comments = "comments"
+
+
+class SearchHit(BaseModel):
+    type: SearchScope
+    id: UUID
+    title: str
+    project: UUID | None = None
+    issue_id: UUID | None = None
+    rank: float
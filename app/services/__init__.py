@@ -1 +1 @@
-__all__ = ["auth", "security", "token_store", "audit", "pii"]
+__all__ = ["auth", "security", "token_store", "audit", "pii", "search"]
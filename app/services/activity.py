@@ -0,0 +1,40 @@
+"""Repair drift in the denormalized ``issues.comment_count``/``last_activity_at``.
+
+The Comment mapper events keep both columns current for ORM writes; bulk
+Core inserts, raw SQL and ``ON DELETE CASCADE`` bypass them.
+"""
+
+from typing import Any
+
+from sqlalchemy import case, func, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.models import Comment, Issue
+
+
+def reconcile_issue_activity(db: Session) -> int:
+    """Recount comments for every drifted issue; returns the rows repaired."""
+    issues = Issue.__table__
+    comments = Comment.__table__
+    actual_count = (
+        select(func.count()).where(comments.c.issue_id == issues.c.id).scalar_subquery()
+    )
+    latest_comment = (
+        select(func.max(comments.c.updated_at))
+        .where(comments.c.issue_id == issues.c.id)
+        .scalar_subquery()
+    )
+    behind = latest_comment > issues.c.last_activity_at
+    result: Any = db.execute(
+        update(issues)
+        .where(or_(issues.c.comment_count != actual_count, behind))
+        .values(
+            comment_count=actual_count,
+            last_activity_at=case(
+                (behind, latest_comment), else_=issues.c.last_activity_at
+            ),
+            updated_at=issues.c.updated_at,
+        )
+    )
+    db.commit()
+    return result.rowcount
@@ -1,13 +1,163 @@
+import json
 import logging
+import threading
+import uuid
+from collections.abc import Callable
+from datetime import UTC, datetime
 from typing import Any
 
-from app.services.security import mask_sensitive
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
 
+from app.core.config import settings
+from app.core.metrics import audit_metrics
+from app.db.session import SessionLocal
+from app.models import AuditEvent
+from app.services.security import mask_sensitive
 
 logger = logging.getLogger("audit")
 
+Row = dict[str, Any]
 
-def audit_log(event: str, user_id: str | None, ip: str | None, **details: Any) -> None:
+
+def _as_uuid(value: Any) -> uuid.UUID | None:
+    if value is None or isinstance(value, uuid.UUID):
+        return value
+    try:
+        return uuid.UUID(str(value))
+    except ValueError:
+        return None
+
+
+def _event_row(row: Row) -> Row:
+    # Runs on the writer thread, so request handlers skip the JSON round-trip.
+    details = row["details"]
+    return {
+        **row,
+        "issue_id": _as_uuid(details.get("issue_id")),
+        "project_id": _as_uuid(details.get("project_id", details.get("project"))),
+        "details": json.loads(json.dumps(details, default=str)),
+    }
+
+
+def write_rows(db: Session, rows: list[Row]) -> None:
+    db.execute(insert(AuditEvent), [_event_row(row) for row in rows])
+
+
+def _write_batch(rows: list[Row]) -> None:
+    db = SessionLocal()
+    try:
+        write_rows(db, rows)
+        db.commit()
+    finally:
+        db.close()
+
+
+class AuditBuffer:
+    """Collect audit rows in memory and write them to ``audit_events`` in batches.
+
+    ``add`` only appends under a lock. A background thread writes once
+    ``batch_size`` rows are pending or every ``flush_interval`` seconds. A
+    failed batch is put back and retried; past ``max_pending`` the oldest rows
+    are dropped and counted, and the log line remains their only record.
+    """
+
+    def __init__(
+        self,
+        writer: Callable[[list[Row]], None],
+        *,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        max_pending: int = 50_000,
+    ):
+        self.writer = writer
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending: list[Row] = []
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def add(self, row: Row) -> None:
+        with self._lock:
+            self._pending.append(row)
+            self._trim()
+            pending = len(self._pending)
+        if pending >= self.batch_size:
+            self._wake.set()
+
+    def _trim(self) -> None:
+        overflow = len(self._pending) - self.max_pending
+        if overflow > 0:
+            del self._pending[:overflow]
+            audit_metrics.incr("dropped", overflow)
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pending = []
+
+    def flush(self) -> int:
+        """Write everything pending now; returns the number of rows written."""
+        with self._write_lock:
+            with self._lock:
+                rows, self._pending = self._pending, []
+            written = 0
+            for start in range(0, len(rows), self.batch_size):
+                batch = rows[start : start + self.batch_size]
+                try:
+                    self.writer(batch)
+                except Exception:
+                    audit_metrics.incr("failed_batches")
+                    logging.getLogger("app").exception("Audit batch write failed")
+                    with self._lock:
+                        self._pending[:0] = rows[start:]
+                        self._trim()
+                    break
+                written += len(batch)
+            audit_metrics.incr("written", written)
+            return written
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="audit-writer", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the writer thread and write whatever is still pending."""
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stopping.set()
+            self._wake.set()
+            thread.join()
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+
+audit_buffer = AuditBuffer(
+    _write_batch,
+    batch_size=settings.audit_batch_size,
+    flush_interval=settings.audit_flush_interval_seconds,
+    max_pending=settings.audit_max_pending,
+)
+
+
+def _safe_details(details: dict[str, Any]) -> dict[str, Any]:
     safe_details = {}
     for key, value in details.items():
         if key in {"token", "access_token", "refresh_token", "password"} and isinstance(
@@ -16,6 +166,33 @@ def audit_log(event: str, user_id: str | None, ip: str | None, **details: Any) -
             safe_details[key] = mask_sensitive(value)
         else:
             safe_details[key] = value
+    return safe_details
+
+
+def _queue(
+    event: str, user_id: str | None, ip: str | None, details: dict[str, Any]
+) -> None:
+    audit_buffer.add(
+        {
+            "id": uuid.uuid4(),
+            "occurred_at": datetime.now(UTC),
+            "event": event,
+            "user_id": user_id,
+            "ip": ip,
+            "details": details,
+        }
+    )
+
+
+def record_event(
+    event: str, user_id: str | None, ip: str | None, **details: Any
+) -> None:
+    """Store an audit event without writing a log line."""
+    _queue(event, user_id, ip, _safe_details(details))
+
+
+def audit_log(event: str, user_id: str | None, ip: str | None, **details: Any) -> None:
+    safe_details = _safe_details(details)
     payload = {
         "event": event,
         "user_id": user_id,
@@ -23,3 +200,4 @@ def audit_log(event: str, user_id: str | None, ip: str | None, **details: Any) -
         "details": safe_details,
     }
     logger.info("audit", extra={"event": payload})
+    _queue(event, user_id, ip, safe_details)
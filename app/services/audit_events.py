@@ -0,0 +1,135 @@
+"""Partition maintenance and retention for the ``audit_events`` store.
+
+On Postgres the table is range-partitioned by month on ``occurred_at``
+(``audit_events_YYYYMM`` plus a default partition); retention drops whole
+partitions. Other databases fall back to batched deletes.
+"""
+
+import re
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import delete, select, text, tuple_
+from sqlalchemy.orm import Session
+
+from app.models import AuditEvent
+
+PARTITION_NAME = re.compile(r"^audit_events_(\d{4})(\d{2})$")
+DEFAULT_PARTITION = "audit_events_default"
+DELETE_BATCH_SIZE = 5000
+
+
+def _month_start(moment: datetime, offset: int = 0) -> datetime:
+    index = moment.year * 12 + moment.month - 1 + offset
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=UTC)
+
+
+def ensure_partitions(db: Session, now: datetime, months_ahead: int = 2) -> list[str]:
+    """Create monthly partitions from this month through ``months_ahead``.
+
+    Rows that already landed in the default partition for a new month are
+    moved into it: Postgres refuses to create a partition whose range the
+    default partition holds rows for, and retention only drops monthly
+    partitions. Returns the names of the partitions created. Only Postgres
+    partitions.
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return []
+    existing = set(_partitions(db))
+    created = []
+    for offset in range(months_ahead + 1):
+        start, end = _month_start(now, offset), _month_start(now, offset + 1)
+        name = f"audit_events_{start:%Y%m}"
+        if name in existing:
+            continue
+        bounds = {"start": start, "end": end}
+        stranded = DEFAULT_PARTITION in existing and db.scalar(
+            text(
+                f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} "
+                "WHERE occurred_at >= :start AND occurred_at < :end)"
+            ),
+            bounds,
+        )
+        if stranded:
+            # Detaching locks audit_events until commit, so no insert can
+            # land in the gap before the default partition is reattached.
+            db.execute(
+                text(f"ALTER TABLE audit_events DETACH PARTITION {DEFAULT_PARTITION}")
+            )
+        db.execute(
+            text(
+                f"CREATE TABLE {name} PARTITION OF audit_events "
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            )
+        )
+        if stranded:
+            columns = ", ".join(AuditEvent.__table__.columns.keys())
+            db.execute(
+                text(
+                    f"INSERT INTO {name} ({columns}) SELECT {columns} "
+                    f"FROM {DEFAULT_PARTITION} "
+                    "WHERE occurred_at >= :start AND occurred_at < :end"
+                ),
+                bounds,
+            )
+            db.execute(
+                text(
+                    f"DELETE FROM {DEFAULT_PARTITION} "
+                    "WHERE occurred_at >= :start AND occurred_at < :end"
+                ),
+                bounds,
+            )
+            db.execute(
+                text(
+                    f"ALTER TABLE audit_events ATTACH PARTITION "
+                    f"{DEFAULT_PARTITION} DEFAULT"
+                )
+            )
+        created.append(name)
+    db.commit()
+    return created
+
+
+def _partitions(db: Session) -> list[str]:
+    return list(
+        db.scalars(
+            text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = 'audit_events'::regclass"
+            )
+        )
+    )
+
+
+def prune_audit_events(db: Session, now: datetime, retention_days: int) -> int:
+    """Remove events older than ``retention_days``; returns rows deleted.
+
+    Monthly partitions that end before the cutoff are dropped outright and
+    are not included in the count; what remains is deleted in batches.
+    """
+    cutoff = now - timedelta(days=retention_days)
+    if db.get_bind().dialect.name == "postgresql":
+        for name in _partitions(db):
+            match = PARTITION_NAME.match(name)
+            if match is None:
+                continue
+            start = datetime(int(match[1]), int(match[2]), 1, tzinfo=UTC)
+            if _month_start(start, 1) <= cutoff:
+                db.execute(text(f"DROP TABLE {name}"))
+        db.commit()
+
+    events = AuditEvent.__table__
+    deleted = 0
+    while True:
+        keys = db.execute(
+            select(events.c.occurred_at, events.c.id)
+            .where(events.c.occurred_at < cutoff)
+            .limit(DELETE_BATCH_SIZE)
+        ).all()
+        if not keys:
+            return deleted
+        db.execute(
+            delete(events).where(tuple_(events.c.occurred_at, events.c.id).in_(keys))
+        )
+        db.commit()
+        deleted += len(keys)
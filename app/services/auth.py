@@ -1,4 +1,5 @@
 from datetime import datetime, timedelta, timezone
+from typing import Any
 import uuid
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
@@ -7,6 +8,13 @@ from app.core.config import settings
 from app.models import User
 from app.services import security
 from app.services import token_store
+from app.services.entity_cache import (
+    Principal,
+    invalidate_on_change,
+    principal_cache,
+)
+
+PRINCIPAL_COLUMNS = (User.id, User.role, User.is_active)
 
 
 def authenticate_user(db: Session, username: str, password: str) -> User:
@@ -67,12 +75,18 @@ def blacklist_access(token: str) -> None:
     ttl_seconds = _token_ttl_seconds(token)
     if ttl_seconds and ttl_seconds > 0:
         token_store.store.add(token, ttl_seconds)
+    security.verified_tokens.discard(token)
 
 
 def is_access_blacklisted(token: str) -> bool:
     return token_store.store.exists(token)
 
 
+def access_token_state(token: str, user_id: str) -> tuple[bool, int | None]:
+    """Whether ``token`` is blacklisted, and the user's revoke-all time."""
+    return token_store.store.access_token_state(token, str(user_id))
+
+
 def enforce_refresh_active(user_id: str, jti: str | None) -> None:
     user_id = str(user_id)
     if not jti or not token_store.store.is_refresh_active(user_id, jti):
@@ -109,3 +123,27 @@ def revoke_all_access(user_id: str) -> None:
 
 def get_access_revoked_at(user_id: str) -> int | None:
     return token_store.store.get_access_revoked_at(str(user_id))
+
+
+def mark_recent_write(user_id: str) -> None:
+    if settings.read_your_writes_seconds > 0:
+        token_store.store.mark_recent_write(
+            str(user_id), settings.read_your_writes_seconds
+        )
+
+
+def has_recent_write(user_id: str) -> bool:
+    return token_store.store.has_recent_write(str(user_id))
+
+
+async def load_principal(db: Any, user_id: Any) -> Principal | None:
+    """The user's id, role and active flag, cached for a short TTL."""
+    return await principal_cache.fetch(db, Principal, PRINCIPAL_COLUMNS, user_id)
+
+
+def invalidate_principal(user_id: Any) -> None:
+    principal_cache.invalidate(Principal, user_id)
+
+
+# Role changes and deactivation apply from the first request after the commit.
+invalidate_on_change(User, principal_cache, Principal, "role", "is_active")
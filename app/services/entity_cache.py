@@ -0,0 +1,228 @@
+"""Cached id lookups for the fields authentication and permissions depend on.
+
+``ProjectRef``, ``IssueRef`` and ``Principal`` carry only the columns that
+scoping and authorization read. They are held in a bounded LRU for
+``ENTITY_CACHE_TTL_SECONDS``. ``invalidate_on_change`` registers those
+columns so that any commit changing them drops the entry. With
+``ENTITY_CACHE_REDIS`` the invalidation is also published on a Redis
+channel, so the other workers drop their copy too. Lookups that find
+nothing are never cached.
+"""
+
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, NamedTuple, TypeVar
+from uuid import UUID
+
+import redis
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import Session, object_session
+
+from app.core.config import settings
+from app.core.metrics import (
+    CounterMetrics,
+    entity_cache_metrics,
+    principal_cache_metrics,
+)
+from app.models.user import UserRole
+
+INVALIDATION_CHANNEL = "entitycache:invalidate"
+PENDING_KEY = "entity_cache.pending"
+
+
+class ProjectRef(NamedTuple):
+    id: UUID
+    created_by_id: UUID
+    is_archived: bool
+
+
+class IssueRef(NamedTuple):
+    id: UUID
+    project: UUID
+    reporter: UUID
+    assignee: UUID | None
+
+
+class Principal(NamedTuple):
+    """The authenticated user as seen by permission checks."""
+
+    id: UUID
+    role: UserRole
+    is_active: bool
+
+
+Ref = ProjectRef | IssueRef | Principal
+RefT = TypeVar("RefT", ProjectRef, IssueRef, Principal)
+
+
+class EntityCache:
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        remote: Any = None,
+        metrics: CounterMetrics = entity_cache_metrics,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.remote = remote
+        self.metrics = metrics
+        self._lock = Lock()
+        self._entries: OrderedDict[str, tuple[Ref, float]] = OrderedDict()
+        self._listener: Any = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, kind: type[RefT], ident: Any) -> RefT | None:
+        key = _key(kind, ident)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[1] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.metrics.incr("hits")
+                return cached[0]  # type: ignore[return-value]
+            if cached is not None:
+                del self._entries[key]
+        self.metrics.incr("misses")
+        return None
+
+    async def fetch(
+        self, db: Any, kind: type[RefT], columns: tuple[Any, ...], ident: Any
+    ) -> RefT | None:
+        """Cached ref for ``ident``, else load ``columns`` (id first) and cache it."""
+        ref = self.get(kind, ident)
+        if ref is None:
+            row = (
+                await db.execute(select(*columns).where(columns[0] == ident))
+            ).first()
+            if row is not None:
+                ref = kind(*row)
+                self.put(ref)
+        return ref
+
+    def put(self, ref: Ref) -> None:
+        if self.max_entries <= 0 or self.ttl_seconds <= 0:
+            return
+        key = _key(type(ref), ref.id)
+        with self._lock:
+            self._entries[key] = (ref, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, kind: type[Ref], *idents: Any) -> None:
+        keys = [_key(kind, ident) for ident in idents]
+        self._discard(keys)
+        self.metrics.incr("invalidations", len(keys))
+        if self.remote is None or not keys:
+            return
+        try:
+            self.remote.publish(INVALIDATION_CHANNEL, " ".join(keys))
+        except redis.RedisError:
+            # The other workers fall back on the TTL for this change.
+            self.metrics.incr("publish_failures")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def start(self) -> None:
+        """Subscribe to invalidations published by other workers."""
+        if self.remote is None or self._listener is not None:
+            return
+        pubsub = self.remote.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(**{INVALIDATION_CHANNEL: self._on_message})
+        self._listener = pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+
+    def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+    def _on_message(self, message: dict[str, Any]) -> None:
+        data = message.get("data")
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+        if isinstance(data, str):
+            self._discard(data.split())
+
+    def _discard(self, keys: list[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+
+def invalidate_on_change(
+    model: type, cache: EntityCache, kind: type[Ref], *columns: str
+) -> None:
+    """Drop ``kind`` entries once a commit changes ``columns`` or deletes a row.
+
+    Ids are collected in ``session.info`` during flush and dropped after the
+    commit. Dropping them at flush time would let a request that runs before
+    the commit re-cache the old values for a full TTL.
+    """
+
+    def changed(mapper: Any, connection: Any, target: Any) -> None:
+        state = inspect(target)
+        if any(state.attrs[name].history.has_changes() for name in columns):
+            _defer(target, cache, kind)
+
+    def deleted(mapper: Any, connection: Any, target: Any) -> None:
+        _defer(target, cache, kind)
+
+    event.listen(model, "after_update", changed)
+    event.listen(model, "after_delete", deleted)
+
+
+def _defer(target: Any, cache: EntityCache, kind: type[Ref]) -> None:
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(PENDING_KEY, set()).add((cache, kind, target.id))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    grouped: dict[tuple[EntityCache, type[Ref]], list[Any]] = {}
+    for cache, kind, ident in session.info.pop(PENDING_KEY, ()):
+        grouped.setdefault((cache, kind), []).append(ident)
+    for (cache, kind), idents in grouped.items():
+        cache.invalidate(kind, *idents)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back(session: Session) -> None:
+    session.info.pop(PENDING_KEY, None)
+
+
+def _key(kind: type[Ref], ident: Any) -> str:
+    return f"{kind.__name__}:{ident}"
+
+
+def _remote_client() -> Any:
+    if not settings.entity_cache_redis:
+        return None
+    try:
+        client = redis.from_url(
+            settings.redis_url, socket_connect_timeout=1, socket_timeout=1
+        )
+        client.ping()
+        return client
+    except (redis.RedisError, ValueError):
+        # Unreachable server or malformed REDIS_URL: run process-local only.
+        return None
+
+
+entity_cache = EntityCache(
+    settings.entity_cache_entries,
+    settings.entity_cache_ttl_seconds,
+    _remote_client(),
+)
+# Kept apart so principals get their own, shorter TTL.
+principal_cache = EntityCache(
+    settings.principal_cache_entries,
+    settings.principal_cache_ttl_seconds,
+    entity_cache.remote,
+    principal_cache_metrics,
+)
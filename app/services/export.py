@@ -0,0 +1,126 @@
+import csv
+import enum
+import io
+import json
+from collections.abc import AsyncIterator, Iterable
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Select, select
+
+from app.models import Comment, Issue
+from app.schemas.comment import CommentOut
+from app.schemas.issue import IssueOut
+
+BATCH_SIZE = 1000
+CHUNK_BYTES = 64 * 1024
+ISSUE_FIELDS = list(IssueOut.model_fields)
+COMMENT_FIELDS = list(CommentOut.model_fields)
+COMMENT_PREFIX = "comment_"
+# Spreadsheet apps evaluate cells starting with these as formulas.
+CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+class ExportFormat(str, enum.Enum):
+    ndjson = "ndjson"
+    csv = "csv"
+
+
+def export_query(project_id: UUID, with_comments: bool) -> Select:
+    """Select a project's issues, optionally joined to their comments.
+
+    Everything comes from one statement, so the export reads a single
+    snapshot; ``yield_per`` makes the driver use a server-side cursor.
+    """
+    table = Issue.__table__
+    stmt = select(*(table.c[name] for name in ISSUE_FIELDS)).where(
+        table.c.project == project_id
+    )
+    order = [table.c.created_at, table.c.id]
+    if with_comments:
+        comments = Comment.__table__
+        stmt = stmt.add_columns(
+            *(comments.c[name].label(COMMENT_PREFIX + name) for name in COMMENT_FIELDS)
+        ).outerjoin(comments, comments.c.issue_id == table.c.id)
+        order += [comments.c.created_at, comments.c.id]
+    return stmt.order_by(*order).execution_options(yield_per=BATCH_SIZE)
+
+
+async def export_records(
+    db: Any, project_id: UUID, with_comments: bool
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield one JSON-ready dict per issue, with its comments when requested."""
+    rows = await db.stream(export_query(project_id, with_comments))
+    current: dict[str, Any] | None = None
+    current_id = None
+    async for row in rows:
+        if current is None or row.id != current_id:
+            if current is not None:
+                yield current
+            current_id = row.id
+            current = IssueOut.model_validate(row).model_dump(mode="json")
+            if with_comments:
+                current["comments"] = []
+        if with_comments and row.comment_id is not None:
+            comment = {
+                name: getattr(row, COMMENT_PREFIX + name) for name in COMMENT_FIELDS
+            }
+            current["comments"].append(
+                CommentOut.model_validate(comment).model_dump(mode="json")
+            )
+    if current is not None:
+        yield current
+
+
+async def ndjson_chunks(records: AsyncIterator[dict[str, Any]]) -> AsyncIterator[bytes]:
+    async def lines() -> AsyncIterator[str]:
+        async for record in records:
+            yield json.dumps(record, separators=(",", ":")) + "\n"
+
+    async for chunk in _chunked(lines()):
+        yield chunk
+
+
+async def csv_chunks(
+    records: AsyncIterator[dict[str, Any]], with_comments: bool
+) -> AsyncIterator[bytes]:
+    header = ISSUE_FIELDS + (["comments"] if with_comments else [])
+
+    async def lines() -> AsyncIterator[str]:
+        yield _csv_line(header)
+        async for record in records:
+            values = [record[name] for name in ISSUE_FIELDS]
+            if with_comments:
+                values.append(json.dumps(record["comments"], separators=(",", ":")))
+            yield _csv_line(_csv_cell(value) for value in values)
+
+    async for chunk in _chunked(lines()):
+        yield chunk
+
+
+def _csv_line(values: Iterable[Any]) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(values)
+    return buffer.getvalue()
+
+
+def _csv_cell(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+async def _chunked(lines: AsyncIterator[str]) -> AsyncIterator[bytes]:
+    """Group small lines into ~``CHUNK_BYTES`` writes to cut per-send overhead."""
+    pending: list[str] = []
+    size = 0
+    async for line in lines:
+        pending.append(line)
+        size += len(line)
+        if size >= CHUNK_BYTES:
+            yield "".join(pending).encode("utf-8")
+            pending, size = [], 0
+    if pending:
+        yield "".join(pending).encode("utf-8")
@@ -0,0 +1,95 @@
+import uuid
+from collections import Counter
+from datetime import UTC, datetime
+from typing import Any
+
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+
+from app.models import Issue, IssueStatus, Project, User
+from app.models.project_counter import counter_statements
+from app.schemas.issue import BulkIssueResult, IssueCreate
+from app.services.search import dialect_name
+from app.services.security import sanitize_markdown
+
+BATCH_SIZE = 1000
+# NDJSON uploads beyond this are spooled to disk before import.
+SPOOL_MEMORY_BYTES = 8 * 1024 * 1024
+SPOOL_READ_BYTES = 64 * 1024
+
+# A parsed record, or the error message for a record that failed to parse.
+Record = tuple[int, IssueCreate | str]
+
+
+def parse_record(index: int, data: Any) -> Record:
+    try:
+        if isinstance(data, (bytes, str)):
+            return index, IssueCreate.model_validate_json(data)
+        return index, IssueCreate.model_validate(data)
+    except ValidationError as exc:
+        return index, format_errors(exc)
+
+
+def format_errors(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc']) or 'body'}: {error['msg']}"
+        for error in exc.errors()
+    )
+
+
+async def create_batch(
+    db: Any, records: list[Record], reporter_id: uuid.UUID
+) -> list[BulkIssueResult]:
+    """Insert the valid records of one batch and commit.
+
+    Project and assignee references are checked with one ``IN`` query each;
+    rows that fail validation are reported and skipped.
+    """
+    payloads = [payload for _, payload in records if isinstance(payload, IssueCreate)]
+    projects = await _existing_ids(db, Project.id, {p.project for p in payloads})
+    assignees = await _existing_ids(
+        db, User.id, {p.assignee for p in payloads if p.assignee}
+    )
+    now = datetime.now(UTC)
+    rows = []
+    results = []
+    deltas: Counter = Counter()
+    for index, payload in records:
+        if isinstance(payload, str):
+            results.append(BulkIssueResult(index=index, error=payload))
+        elif payload.project not in projects:
+            results.append(BulkIssueResult(index=index, error="Project not found"))
+        elif payload.assignee and payload.assignee not in assignees:
+            results.append(BulkIssueResult(index=index, error="Assignee not found"))
+        else:
+            issue_id = uuid.uuid4()
+            rows.append(
+                {
+                    "id": issue_id,
+                    "title": payload.title,
+                    "description": sanitize_markdown(payload.description),
+                    "priority": payload.priority,
+                    "project": payload.project,
+                    "reporter": reporter_id,
+                    "assignee": payload.assignee,
+                    "due_date": payload.due_date,
+                    "created_at": now,
+                    "updated_at": now,
+                    "last_activity_at": now,
+                }
+            )
+            results.append(BulkIssueResult(index=index, id=issue_id))
+            deltas[(payload.project, IssueStatus.open, payload.priority)] += 1
+    if rows:
+        await db.execute(insert(Issue), rows)
+        # Core inserts skip the Issue mapper events, so apply counters here.
+        for stmt in counter_statements(dialect_name(db), deltas):
+            await db.execute(stmt)
+        await db.commit()
+    return results
+
+
+async def _existing_ids(db: Any, column: Any, ids: set[uuid.UUID]) -> set[uuid.UUID]:
+    if not ids:
+        return set()
+    return set((await db.scalars(select(column).where(column.in_(ids)))).all())
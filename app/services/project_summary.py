@@ -0,0 +1,48 @@
+"""Per-project issue counts served from ``project_issue_counters``."""
+
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.models import Issue, IssuePriority, IssueStatus, ProjectIssueCounter
+from app.schemas.project import ProjectSummary
+
+
+async def project_summary(db: Any, project_id: UUID) -> ProjectSummary:
+    """Read the project's counter rows; at most one per (status, priority)."""
+    counters = ProjectIssueCounter.__table__
+    rows = await db.execute(
+        select(counters.c.status, counters.c.priority, counters.c.count).where(
+            counters.c.project_id == project_id
+        )
+    )
+    by_status = dict.fromkeys(IssueStatus, 0)
+    by_priority = dict.fromkeys(IssuePriority, 0)
+    for status, priority, count in rows.all():
+        by_status[status] += count
+        by_priority[priority] += count
+    return ProjectSummary(
+        project_id=project_id,
+        total=sum(by_status.values()),
+        by_status=by_status,
+        by_priority=by_priority,
+    )
+
+
+def rebuild_project_counters(db: Session) -> int:
+    """Recompute every counter row from the issues table; returns rows written."""
+    counters = ProjectIssueCounter.__table__
+    issues = Issue.__table__
+    db.execute(delete(counters))
+    result: Any = db.execute(
+        insert(counters).from_select(
+            ["project_id", "status", "priority", "count"],
+            select(
+                issues.c.project, issues.c.status, issues.c.priority, func.count()
+            ).group_by(issues.c.project, issues.c.status, issues.c.priority),
+        )
+    )
+    db.commit()
+    return result.rowcount
@@ -0,0 +1,246 @@
+"""Cache for hot list responses, invalidated by per-project generations.
+
+Entries are kept in an in-process LRU and, with ``RESPONSE_CACHE_REDIS``, in
+Redis as a second tier shared by every worker. Each entry belongs to a scope
+(a project id) and records the scope's generation when it was built. Write
+routes call ``invalidate`` after committing, which moves the generation on,
+so entries built before the write are never served again. Entries also
+expire after ``RESPONSE_CACHE_TTL_SECONDS`` to bound the damage from writes
+that bypass the routes.
+
+Only one request per key rebuilds at a time. An expired entry whose
+generation is still current is served stale to the others while that happens
+(for up to ``RESPONSE_CACHE_STALE_SECONDS`` more); for a missing or
+invalidated entry they wait for the rebuild instead.
+"""
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from enum import Enum
+from threading import Lock
+from typing import Any, NamedTuple
+
+import redis
+from anyio import to_thread
+
+from app.core.config import settings
+from app.core.metrics import response_cache_metrics
+
+Headers = tuple[tuple[str, str], ...]
+
+
+class CacheOutcome(str, Enum):
+    hit = "HIT"
+    stale = "STALE"
+    miss = "MISS"
+    bypass = "BYPASS"
+
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    headers: Headers
+    generation: int
+    stored_at: float
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        stale_seconds: float,
+        remote: Any = None,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.remote = remote
+        self._lock = Lock()
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._generations: dict[str, int] = {}
+        # Keys being rebuilt by a request on this event loop.
+        self._rebuilding: dict[str, asyncio.Event] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generations.clear()
+
+    async def get_or_build(
+        self,
+        key: str,
+        scope: str,
+        build: Callable[[], Awaitable[tuple[bytes, Headers] | None]],
+        store: bool = True,
+    ) -> tuple[CachedResponse | None, CacheOutcome]:
+        """Return the cached entry for ``key`` or build and store a new one.
+
+        ``build`` returns the body and headers to cache, or ``None`` when its
+        response must not be cached. Returns the entry (``None`` if nothing
+        was cacheable) and how the lookup was answered. With ``store`` false
+        a miss is built but not stored, for reads from a replica that may
+        not have the write behind the current generation yet.
+        """
+        if not self.enabled:
+            await build()
+            return None, CacheOutcome.bypass
+        while True:
+            try:
+                generation, entry = await self._run(self._lookup, key, scope)
+            except redis.RedisError:
+                response_cache_metrics.incr("errors")
+                await build()
+                return None, CacheOutcome.bypass
+            rebuilding = self._rebuilding.get(key)
+            if entry is not None and entry.generation == generation:
+                age = time.time() - entry.stored_at
+                if age < self.ttl_seconds:
+                    response_cache_metrics.incr("hits")
+                    return entry, CacheOutcome.hit
+                if rebuilding and age < self.ttl_seconds + self.stale_seconds:
+                    response_cache_metrics.incr("stale")
+                    return entry, CacheOutcome.stale
+            if rebuilding is None:
+                break
+            response_cache_metrics.incr("waits")
+            await rebuilding.wait()
+
+        response_cache_metrics.incr("misses")
+        if not store:
+            await build()
+            return None, CacheOutcome.miss
+        done = self._rebuilding[key] = asyncio.Event()
+        try:
+            built = await build()
+            if built is None:
+                return None, CacheOutcome.miss
+            entry = CachedResponse(*built, generation, time.time())
+            await self._run(self._store, key, entry)
+            return entry, CacheOutcome.miss
+        finally:
+            del self._rebuilding[key]
+            done.set()
+
+    async def invalidate(self, *scopes: Any) -> None:
+        """Move each scope's generation on; call after the write commits."""
+        if not self.enabled:
+            return
+        await self._run(self._bump, [str(scope) for scope in set(scopes)])
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        # The Redis client is synchronous; keep its round-trips off the loop.
+        if self.remote is None:
+            return func(*args)
+        return await to_thread.run_sync(func, *args)
+
+    def _lookup(self, key: str, scope: str) -> tuple[int, CachedResponse | None]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            generation = self._generations.get(scope, 0)
+        if self.remote is None:
+            return generation, entry
+        generation = int(self.remote.get(f"respgen:{scope}") or 0)
+        if entry is None or entry.generation != generation:
+            raw = self.remote.get(f"resp:{key}")
+            shared = _decode(raw) if raw else None
+            if shared is not None and shared.generation == generation:
+                entry = shared
+                self._store_local(key, entry)
+        return generation, entry
+
+    def _store(self, key: str, entry: CachedResponse) -> None:
+        self._store_local(key, entry)
+        if self.remote is not None:
+            try:
+                self.remote.setex(
+                    f"resp:{key}",
+                    max(1, round(self.ttl_seconds + self.stale_seconds)),
+                    _encode(entry),
+                )
+            except redis.RedisError:
+                response_cache_metrics.incr("errors")
+
+    def _store_local(self, key: str, entry: CachedResponse) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            evicted = 0
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+        if evicted:
+            response_cache_metrics.incr("evictions", evicted)
+
+    def _bump(self, scopes: list[str]) -> None:
+        with self._lock:
+            for scope in scopes:
+                self._generations[scope] = self._generations.get(scope, 0) + 1
+        response_cache_metrics.incr("invalidations", len(scopes))
+        if self.remote is None:
+            return
+        try:
+            pipe = self.remote.pipeline()
+            for scope in scopes:
+                pipe.incr(f"respgen:{scope}")
+            pipe.execute()
+        except redis.RedisError:
+            # Other workers fall back on the TTL for this write.
+            response_cache_metrics.incr("errors")
+
+
+def _encode(entry: CachedResponse) -> str:
+    return json.dumps(
+        {
+            "body": entry.body.decode("utf-8"),
+            "headers": entry.headers,
+            "generation": entry.generation,
+            "stored_at": entry.stored_at,
+        }
+    )
+
+
+def _decode(raw: bytes) -> CachedResponse | None:
+    try:
+        data = json.loads(raw)
+        return CachedResponse(
+            data["body"].encode("utf-8"),
+            tuple((name, value) for name, value in data["headers"]),
+            int(data["generation"]),
+            float(data["stored_at"]),
+        )
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+def _remote_client() -> Any:
+    if not settings.response_cache_redis:
+        return None
+    try:
+        client = redis.from_url(
+            settings.redis_url, socket_connect_timeout=1, socket_timeout=1
+        )
+        client.ping()
+        return client
+    except (redis.RedisError, ValueError):
+        # Unreachable server or malformed REDIS_URL: run process-local only.
+        return None
+
+
+response_cache = ResponseCache(
+    settings.response_cache_entries,
+    settings.response_cache_ttl_seconds,
+    settings.response_cache_stale_seconds,
+    _remote_client(),
+)
@@ -0,0 +1,89 @@
+import re
+from typing import Any
+
+from sqlalchemy import Select, column, func, literal, literal_column, or_, select, table
+from sqlalchemy.sql import ColumnElement
+
+from app.db.search import (
+    SEARCH_CONFIG,
+    SEARCH_VECTOR_COLUMN,
+    SEARCHABLE,
+    fts_table_name,
+)
+
+TOKEN_PATTERN = re.compile(r"[A-Za-z0-9]+")
+MAX_TOKENS = 8
+
+
+def search_tokens(text: str) -> list[str]:
+    return [token.lower() for token in TOKEN_PATTERN.findall(text)][:MAX_TOKENS]
+
+
+def dialect_name(db: Any) -> str:
+    return db.get_bind().dialect.name
+
+
+def search_clause(dialect: str, model: Any, text: str) -> ColumnElement[bool] | None:
+    """Filter ``model`` rows matching every term of ``text`` as a prefix."""
+    tokens = search_tokens(text)
+    if not tokens:
+        return None
+    table_name = model.__tablename__
+    if dialect == "postgresql":
+        return _vector(table_name).op("@@")(_tsquery(tokens))
+    if dialect == "sqlite":
+        fts = _fts_table(table_name)
+        return literal_column(f"{table_name}.rowid").in_(
+            select(fts.c.rowid).where(_fts_match(fts.name, tokens))
+        )
+    return _like_clause(model, text)
+
+
+def ranked_search(dialect: str, model: Any, text: str, limit: int) -> Select | None:
+    """Select ``(row, rank)`` pairs for ``text``, best match first."""
+    tokens = search_tokens(text)
+    if not tokens:
+        return None
+    table_name = model.__tablename__
+    if dialect == "postgresql":
+        query = _tsquery(tokens)
+        vector = _vector(table_name)
+        rank = func.ts_rank_cd(vector, query)
+        stmt = select(model, rank.label("rank")).where(vector.op("@@")(query))
+        return stmt.order_by(rank.desc()).limit(limit)
+    if dialect == "sqlite":
+        fts = _fts_table(table_name)
+        rowid: ColumnElement[Any] = literal_column(f"{table_name}.rowid")
+        # bm25() is lower-is-better; negate so every backend ranks descending.
+        stmt = (
+            select(model, (-fts.c.rank).label("rank"))
+            .join_from(model, fts, fts.c.rowid == rowid)
+            .where(_fts_match(fts.name, tokens))
+        )
+        return stmt.order_by(fts.c.rank).limit(limit)
+    clause = _like_clause(model, text)
+    return select(model, literal(0.0).label("rank")).where(clause).limit(limit)
+
+
+def _like_clause(model: Any, text: str) -> ColumnElement[bool]:
+    like = f"%{text}%"
+    columns = SEARCHABLE[model.__tablename__]
+    return or_(*(getattr(model, name).ilike(like) for name in columns))
+
+
+def _vector(table_name: str) -> ColumnElement[Any]:
+    return literal_column(f"{table_name}.{SEARCH_VECTOR_COLUMN}")
+
+
+def _tsquery(tokens: list[str]) -> ColumnElement[Any]:
+    return func.to_tsquery(SEARCH_CONFIG, " & ".join(f"{t}:*" for t in tokens))
+
+
+def _fts_table(table_name: str):
+    return table(fts_table_name(table_name), column("rowid"), column("rank"))
+
+
+def _fts_match(fts_name: str, tokens: list[str]) -> ColumnElement[bool]:
+    return literal_column(fts_name).op("MATCH")(
+        " ".join(f'"{token}"*' for token in tokens)
+    )
@@ -1,13 +1,24 @@
+import hashlib
 import re
+import time
+import uuid
+from base64 import urlsafe_b64encode
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict
+from threading import Lock
+from typing import Any, Dict, NamedTuple
 
 import jwt
 import bleach
 import bcrypt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
 
 from app.core.config import settings
+from app.core.metrics import token_cache_metrics
+
+_UNSAFE_MARKDOWN = re.compile(r"[<>&\r\x00-\x08\x0b\x0c\x0e-\x1f]")
 
 
 def verify_password_complexity(password: str) -> bool:
@@ -38,22 +49,128 @@ def _load_key(path: Path) -> str:
     return path.read_text()
 
 
-PRIVATE_KEY_CACHE: str | None = None
-PUBLIC_KEY_CACHE: str | None = None
+class KeyRing(NamedTuple):
+    """Pre-parsed JWT keys.
+
+    ``verify_keys`` maps a ``kid`` to its algorithm and public key: the
+    current key plus any ``JWT_PREVIOUS_PUBLIC_KEY_PATHS`` still honoured
+    during a rotation.
+    """
+
+    signing_key: Any
+    kid: str
+    verify_keys: dict[str, tuple[str, Any]]
+
+
+KEYRING_CACHE: KeyRing | None = None
+
+
+def _algorithm_for(public_key: Any) -> str:
+    if isinstance(public_key, rsa.RSAPublicKey):
+        return "RS256"
+    if isinstance(public_key, ec.EllipticCurvePublicKey) and isinstance(
+        public_key.curve, ec.SECP256R1
+    ):
+        return "ES256"
+    if isinstance(public_key, ed25519.Ed25519PublicKey):
+        return "EdDSA"
+    raise ValueError(f"Unsupported JWT key type: {type(public_key).__name__}")
+
+
+def key_id(public_key: Any) -> str:
+    """Stable ``kid``: a truncated SHA-256 of the SubjectPublicKeyInfo DER."""
+    der = public_key.public_bytes(
+        serialization.Encoding.DER, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    return urlsafe_b64encode(hashlib.sha256(der).digest()[:12]).decode("ascii")
+
+
+def load_keyring() -> KeyRing:
+    private_key = serialization.load_pem_private_key(
+        _load_key(settings.jwt_private_key_path).encode("utf-8"), password=None
+    )
+    if _algorithm_for(private_key.public_key()) != settings.jwt_alg:
+        raise ValueError(f"JWT_PRIVATE_KEY_PATH is not a {settings.jwt_alg} key")
+    verify_keys: dict[str, tuple[str, Any]] = {}
+    for path in [settings.jwt_public_key_path, *settings.previous_public_key_paths]:
+        public_key = serialization.load_pem_public_key(_load_key(path).encode("utf-8"))
+        verify_keys[key_id(public_key)] = (_algorithm_for(public_key), public_key)
+    kid = key_id(private_key.public_key())
+    if kid not in verify_keys:
+        raise ValueError("JWT_PUBLIC_KEY_PATH does not match JWT_PRIVATE_KEY_PATH")
+    return KeyRing(private_key, kid, verify_keys)
+
+
+def get_keyring() -> KeyRing:
+    global KEYRING_CACHE
+    if KEYRING_CACHE is None:
+        KEYRING_CACHE = load_keyring()
+    return KEYRING_CACHE
+
+
+def get_private_key() -> Any:
+    return get_keyring().signing_key
+
+
+def get_public_key() -> Any:
+    keyring = get_keyring()
+    return keyring.verify_keys[keyring.kid][1]
+
+
+class VerifiedTokenCache:
+    """Claims of access tokens whose signature has already been checked.
+
+    Keyed by a SHA-256 digest of the token and held until the token's ``exp``.
+    Only signature and expiry verification is skipped: the blacklist and
+    revoke-all checks run on every request regardless.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._lock = Lock()
+        self._entries: OrderedDict[bytes, tuple[dict[str, Any], int]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        key = _digest(token)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[1] > time.time():
+                self._entries.move_to_end(key)
+                token_cache_metrics.incr("hits")
+                return dict(cached[0])
+            if cached is not None:
+                del self._entries[key]
+        token_cache_metrics.incr("misses")
+        return None
+
+    def put(self, token: str, claims: dict[str, Any]) -> None:
+        exp = claims.get("exp")
+        if self.max_entries <= 0 or not isinstance(exp, int):
+            return
+        key = _digest(token)
+        with self._lock:
+            self._entries[key] = (dict(claims), exp)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, token: str) -> None:
+        with self._lock:
+            self._entries.pop(_digest(token), None)
 
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
 
-def get_private_key() -> str:
-    global PRIVATE_KEY_CACHE
-    if PRIVATE_KEY_CACHE is None:
-        PRIVATE_KEY_CACHE = _load_key(settings.jwt_private_key_path)
-    return PRIVATE_KEY_CACHE
 
+def _digest(token: str) -> bytes:
+    return hashlib.sha256(token.encode("utf-8")).digest()
 
-def get_public_key() -> str:
-    global PUBLIC_KEY_CACHE
-    if PUBLIC_KEY_CACHE is None:
-        PUBLIC_KEY_CACHE = _load_key(settings.jwt_public_key_path)
-    return PUBLIC_KEY_CACHE
+
+verified_tokens = VerifiedTokenCache(settings.jwt_cache_entries)
 
 
 def create_token(
@@ -65,23 +182,51 @@ def create_token(
         "type": token_type,
         "iat": int(now.timestamp()),
     }
-    if jti:
-        payload["jti"] = jti
+    # A unique jti keeps two tokens minted in the same second distinct, so
+    # blacklisting one never revokes the other.
+    payload["jti"] = jti or uuid.uuid4().hex
     payload["exp"] = int((now + expires_delta).timestamp())
-    return jwt.encode(payload, get_private_key(), algorithm=settings.jwt_alg)
+    keyring = get_keyring()
+    return jwt.encode(
+        payload,
+        keyring.signing_key,
+        algorithm=settings.jwt_alg,
+        headers={"kid": keyring.kid},
+    )
 
 
 def decode_token(token: str) -> Dict[str, Any]:
+    claims = verified_tokens.get(token)
+    if claims is not None:
+        return claims
     try:
-        return jwt.decode(token, get_public_key(), algorithms=[settings.jwt_alg])
+        algorithm, public_key = _verify_key(jwt.get_unverified_header(token))
+        claims = jwt.decode(token, public_key, algorithms=[algorithm])
     except jwt.PyJWTError as exc:
         raise ValueError("Invalid token") from exc
+    # Refresh tokens are presented once per rotation; caching them buys nothing.
+    if claims.get("type") == "access":
+        verified_tokens.put(token, claims)
+    return claims
+
+
+def _verify_key(header: dict[str, Any]) -> tuple[str, Any]:
+    # Each kid is pinned to its own algorithm, so a token cannot pick one.
+    # Tokens issued before kids were added carry none and use the current key.
+    keyring = get_keyring()
+    verify_key = keyring.verify_keys.get(header.get("kid", keyring.kid))
+    if verify_key is None:
+        raise jwt.InvalidKeyError("Unknown signing key")
+    return verify_key
 
 
 def sanitize_markdown(text: str | None) -> str | None:
     """Escape markdown/HTML to prevent XSS in rendered responses."""
     if text is None:
         return None
+    # bleach returns text without markup, CR or C0 controls unchanged.
+    if not _UNSAFE_MARKDOWN.search(text):
+        return text
     return bleach.clean(text, tags=[], attributes={}, strip=True)
 
 
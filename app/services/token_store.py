@@ -2,13 +2,26 @@
 
 from __future__ import annotations
 
+import hashlib
 import time
+from base64 import urlsafe_b64encode
 from typing import Protocol
 
 import redis
 
 from app.core.config import settings
 
+# Entries written before blacklist_key were keyed "blacklist:{token}". Redis
+# lookups still check that form until they expire (REFRESH_TOKEN_EXPIRE_DAYS);
+# scripts/migrate_token_blacklist.py rewrites them ahead of that.
+LEGACY_BLACKLIST_PREFIX = "blacklist:"
+
+
+def blacklist_key(token: str) -> str:
+    """Compact blacklist key: a 128-bit digest of the token, not the token."""
+    digest = hashlib.sha256(token.encode("utf-8")).digest()[:16]
+    return "bl:" + urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
+
 
 class Store(Protocol):
     def add(self, token: str, ttl_seconds: int) -> None: ...
@@ -27,6 +40,11 @@ class Store(Protocol):
         self, user_id: str, revoked_at: int, ttl_seconds: int
     ) -> None: ...
     def get_access_revoked_at(self, user_id: str) -> int | None: ...
+    def access_token_state(
+        self, token: str, user_id: str
+    ) -> tuple[bool, int | None]: ...
+    def mark_recent_write(self, user_id: str, ttl_seconds: int) -> None: ...
+    def has_recent_write(self, user_id: str) -> bool: ...
 
 
 class InMemoryStore:
@@ -35,16 +53,17 @@ class InMemoryStore:
         self._fails: dict[str, tuple[int, float]] = {}
         self._refresh: dict[str, dict[str, float]] = {}
         self._access_revoked: dict[str, tuple[int, float]] = {}
+        self._recent_writes: dict[str, float] = {}
 
     def add(self, token: str, ttl_seconds: int) -> None:
-        self._data[token] = time.time() + ttl_seconds
+        self._data[blacklist_key(token)] = time.time() + ttl_seconds
 
     def exists(self, token: str) -> bool:
         now = time.time()
         expired = [k for k, exp in self._data.items() if exp <= now]
         for k in expired:
             self._data.pop(k, None)
-        return token in self._data
+        return blacklist_key(token) in self._data
 
     def inc_failure(self, key: str, window: int) -> int:
         now = time.time()
@@ -111,6 +130,21 @@ class InMemoryStore:
             return None
         return revoked_at
 
+    def access_token_state(self, token: str, user_id: str) -> tuple[bool, int | None]:
+        return self.exists(token), self.get_access_revoked_at(user_id)
+
+    def mark_recent_write(self, user_id: str, ttl_seconds: int) -> None:
+        self._recent_writes[user_id] = time.time() + ttl_seconds
+
+    def has_recent_write(self, user_id: str) -> bool:
+        expires_at = self._recent_writes.get(user_id)
+        if expires_at is None:
+            return False
+        if expires_at <= time.time():
+            self._recent_writes.pop(user_id, None)
+            return False
+        return True
+
 
 class RedisStore:
     def __init__(self, url: str):
@@ -122,10 +156,10 @@ class RedisStore:
         )
 
     def add(self, token: str, ttl_seconds: int) -> None:
-        self.client.setex(f"blacklist:{token}", ttl_seconds, "1")
+        self.client.setex(blacklist_key(token), ttl_seconds, "1")
 
     def exists(self, token: str) -> bool:
-        return bool(self.client.get(f"blacklist:{token}"))
+        return bool(self._blacklisted(self.client, token))
 
     def inc_failure(self, key: str, window: int) -> int:
         redis_key = f"loginfail:{key}"
@@ -196,13 +230,32 @@ class RedisStore:
         value = self.client.get(f"accessrevoked:{user_id}")
         return int(value) if value else None
 
+    def access_token_state(self, token: str, user_id: str) -> tuple[bool, int | None]:
+        # Blacklist and revoke-all marker in one round-trip.
+        pipe = self.client.pipeline(transaction=False)
+        self._blacklisted(pipe, token)
+        pipe.get(f"accessrevoked:{user_id}")
+        blacklisted, revoked_at = pipe.execute()
+        return bool(blacklisted), int(revoked_at) if revoked_at else None
+
+    def mark_recent_write(self, user_id: str, ttl_seconds: int) -> None:
+        self.client.setex(f"recentwrite:{user_id}", ttl_seconds, "1")
+
+    @staticmethod
+    def _blacklisted(client, token: str):
+        # One EXISTS covers both key forms, so the legacy check costs nothing.
+        return client.exists(blacklist_key(token), LEGACY_BLACKLIST_PREFIX + token)
+
+    def has_recent_write(self, user_id: str) -> bool:
+        return bool(self.client.exists(f"recentwrite:{user_id}"))
+
 
 def get_store() -> Store:
     try:
         store = RedisStore(settings.redis_url)
         store.client.ping()
         return store
-    except Exception:
+    except (redis.RedisError, ValueError):
         return InMemoryStore()
 
 
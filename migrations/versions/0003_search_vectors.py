@@ -0,0 +1,65 @@
+"""Add full-text search vectors with GIN indexes.
+
+Adding a STORED generated column rewrites issues, projects and comments under
+an ACCESS EXCLUSIVE lock, so run this upgrade in a maintenance window. The GIN
+indexes are then built with CREATE INDEX CONCURRENTLY outside the migration
+transaction; a failed build leaves an INVALID index behind, drop it and
+re-run the upgrade.
+
+Revision ID: 0003_search_vectors
+Revises: 0002_rename_issue_fk_columns
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0003_search_vectors"
+down_revision = "0002_rename_issue_fk_columns"
+branch_labels = None
+depends_on = None
+
+SEARCHABLE = {
+    "issues": ("title", "description"),
+    "projects": ("name", "description"),
+    "comments": ("content",),
+}
+
+
+def _vector_expression(columns):
+    weights = "ABCD"
+    return " || ".join(
+        f"setweight(to_tsvector('simple', coalesce({column}, '')), '{weights[i]}')"
+        for i, column in enumerate(columns)
+    )
+
+
+def upgrade():
+    for table, columns in SEARCHABLE.items():
+        op.execute(
+            f"ALTER TABLE {table} ADD COLUMN search_vector tsvector "
+            f"GENERATED ALWAYS AS ({_vector_expression(columns)}) STORED"
+        )
+    with op.get_context().autocommit_block():
+        for table in SEARCHABLE:
+            op.create_index(
+                f"ix_{table}_search_vector",
+                table,
+                ["search_vector"],
+                postgresql_using="gin",
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for table in SEARCHABLE:
+            op.drop_index(
+                f"ix_{table}_search_vector",
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+    for table in SEARCHABLE:
+        op.drop_column(table, "search_vector")
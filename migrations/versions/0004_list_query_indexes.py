@@ -0,0 +1,75 @@
+"""Index foreign keys and list filter paths.
+
+Indexes are built with CREATE INDEX CONCURRENTLY outside the migration
+transaction so large tables stay writable. A failed concurrent build leaves
+an INVALID index behind; drop it and re-run the upgrade.
+
+Revision ID: 0004_list_query_indexes
+Revises: 0003_search_vectors
+Create Date: 2026-10-16
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0004_list_query_indexes"
+down_revision = "0003_search_vectors"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    (
+        "ix_issues_project_status_created_at",
+        "issues",
+        ["project", "status", "created_at"],
+        None,
+    ),
+    ("ix_issues_project_created_at", "issues", ["project", "created_at", "id"], None),
+    ("ix_issues_status_created_at", "issues", ["status", "created_at"], None),
+    ("ix_issues_created_at", "issues", ["created_at", "id"], None),
+    ("ix_issues_reporter", "issues", ["reporter"], None),
+    (
+        "ix_issues_assignee_status",
+        "issues",
+        ["assignee", "status"],
+        "assignee IS NOT NULL",
+    ),
+    (
+        "ix_comments_issue_id_created_at",
+        "comments",
+        ["issue_id", "created_at", "id"],
+        None,
+    ),
+    ("ix_comments_author_id", "comments", ["author_id"], None),
+    ("ix_projects_created_by_id", "projects", ["created_by_id"], None),
+    (
+        "ix_projects_is_archived_created_at",
+        "projects",
+        ["is_archived", "created_at", "id"],
+        None,
+    ),
+]
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                postgresql_where=sa.text(where) if where else None,
+                if_not_exists=True,
+            )
+        for table in ("issues", "comments", "projects"):
+            op.execute(f"ANALYZE {table}")
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(
+                name, table_name=table, postgresql_concurrently=True, if_exists=True
+            )
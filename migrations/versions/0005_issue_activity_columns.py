@@ -0,0 +1,117 @@
+"""Add denormalized comment_count and last_activity_at to issues.
+
+Both columns are backfilled from comments in id-ordered batches of
+BATCH_SIZE issues, each committed on its own so no statement locks the
+whole table; indexes for the new sort keys are built concurrently
+afterwards.
+
+Revision ID: 0005_issue_activity_columns
+Revises: 0004_list_query_indexes
+Create Date: 2026-10-16
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0005_issue_activity_columns"
+down_revision = "0004_list_query_indexes"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    (
+        "ix_issues_project_last_activity_at",
+        ["project", "last_activity_at", "id"],
+    ),
+    ("ix_issues_project_comment_count", ["project", "comment_count", "id"]),
+]
+
+
+BATCH_SIZE = 10_000
+
+
+def _id_batches(bind):
+    """Yield ``(lower, upper]`` id bounds covering BATCH_SIZE issues each."""
+    lower = None
+    while True:
+        after = "" if lower is None else "WHERE id > :lower"
+        upper = bind.execute(
+            sa.text(f"SELECT id FROM issues {after} ORDER BY id LIMIT 1 OFFSET :skip"),
+            {"lower": lower, "skip": BATCH_SIZE - 1},
+        ).scalar()
+        yield lower, upper
+        if upper is None:
+            return
+        lower = upper
+
+
+def _between(column, lower, upper):
+    bounds = []
+    if lower is not None:
+        bounds.append(f"{column} > :lower")
+    if upper is not None:
+        bounds.append(f"{column} <= :upper")
+    return " AND ".join(bounds) or "TRUE"
+
+
+def _backfill(bind, lower, upper):
+    params = {"lower": lower, "upper": upper}
+    bind.execute(
+        sa.text(
+            f"""
+            UPDATE issues SET
+                comment_count = stats.comments,
+                last_activity_at = GREATEST(issues.updated_at, stats.latest)
+            FROM (
+                SELECT issue_id, count(*) AS comments, max(updated_at) AS latest
+                FROM comments WHERE {_between("issue_id", lower, upper)}
+                GROUP BY issue_id
+            ) AS stats
+            WHERE stats.issue_id = issues.id
+            """
+        ),
+        params,
+    )
+    bind.execute(
+        sa.text(
+            f"""
+            UPDATE issues SET last_activity_at = updated_at
+            WHERE last_activity_at IS NULL AND {_between("id", lower, upper)}
+            """
+        ),
+        params,
+    )
+
+
+def upgrade():
+    op.add_column(
+        "issues",
+        sa.Column("comment_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column("issues", sa.Column("last_activity_at", sa.DateTime(), nullable=True))
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        for lower, upper in _id_batches(bind):
+            _backfill(bind, lower, upper)
+    op.alter_column("issues", "last_activity_at", nullable=False)
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES:
+            op.create_index(
+                name,
+                "issues",
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        op.execute("ANALYZE issues")
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(INDEXES):
+            op.drop_index(
+                name, table_name="issues", postgresql_concurrently=True, if_exists=True
+            )
+    op.drop_column("issues", "last_activity_at")
+    op.drop_column("issues", "comment_count")
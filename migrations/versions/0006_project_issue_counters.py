@@ -0,0 +1,51 @@
+"""Add per-project issue counters keyed by status and priority.
+
+The table is filled from the issues table in the same transaction; the
+application keeps it current afterwards with +1/-1 upserts.
+
+Revision ID: 0006_project_issue_counters
+Revises: 0005_issue_activity_columns
+Create Date: 2026-10-16
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "0006_project_issue_counters"
+down_revision = "0005_issue_activity_columns"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "project_issue_counters",
+        sa.Column(
+            "project_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("projects.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "status",
+            postgresql.ENUM(name="issuestatus", create_type=False),
+            primary_key=True,
+        ),
+        sa.Column(
+            "priority",
+            postgresql.ENUM(name="issuepriority", create_type=False),
+            primary_key=True,
+        ),
+        sa.Column("count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.execute(
+        "INSERT INTO project_issue_counters (project_id, status, priority, count) "
+        "SELECT project, status, priority, count(*) FROM issues "
+        "GROUP BY project, status, priority"
+    )
+
+
+def downgrade():
+    op.drop_table("project_issue_counters")
@@ -0,0 +1,73 @@
+"""Replace the assignee/status index with the inbox index.
+
+ix_issues_assignee_inbox orders by explicit status and priority ranks, so
+the inbox sorts the same on every backend. It leads with assignee and
+INCLUDEs status, so the old index is redundant once the new one is built.
+Both operations run concurrently outside the migration transaction.
+
+Revision ID: 0007_assignee_inbox_index
+Revises: 0006_project_issue_counters
+Create Date: 2026-10-16
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# Must match STATUS_RANK and PRIORITY_RANK in app/models/issue.py.
+STATUS_RANK = (
+    "(CASE status WHEN 'open' THEN 0 WHEN 'in_progress' THEN 1 "
+    "WHEN 'resolved' THEN 2 WHEN 'closed' THEN 3 WHEN 'reopened' THEN 4 END)"
+)
+PRIORITY_RANK = (
+    "(CASE priority WHEN 'critical' THEN 0 WHEN 'high' THEN 1 "
+    "WHEN 'medium' THEN 2 WHEN 'low' THEN 3 END)"
+)
+
+# revision identifiers, used by Alembic.
+revision = "0007_assignee_inbox_index"
+down_revision = "0006_project_issue_counters"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_issues_assignee_inbox",
+            "issues",
+            [
+                "assignee",
+                sa.text(STATUS_RANK),
+                sa.text(PRIORITY_RANK),
+                "due_date",
+                "id",
+            ],
+            postgresql_concurrently=True,
+            postgresql_where=sa.text("assignee IS NOT NULL"),
+            postgresql_include=["project", "status"],
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_issues_assignee_status",
+            table_name="issues",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_issues_assignee_status",
+            "issues",
+            ["assignee", "status"],
+            postgresql_concurrently=True,
+            postgresql_where=sa.text("assignee IS NOT NULL"),
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_issues_assignee_inbox",
+            table_name="issues",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
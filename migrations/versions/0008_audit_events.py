@@ -0,0 +1,73 @@
+"""Add the append-only audit_events store.
+
+The table is range-partitioned by month on occurred_at, with a default
+partition catching rows outside the created months. The upgrade creates this
+month's partition and the next two before any event is written;
+scripts/prune_audit_events.py keeps creating partitions ahead of time and
+drops expired ones.
+
+Revision ID: 0008_audit_events
+Revises: 0007_assignee_inbox_index
+Create Date: 2026-10-16
+"""
+
+from datetime import UTC, datetime
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "0008_audit_events"
+down_revision = "0007_assignee_inbox_index"
+branch_labels = None
+depends_on = None
+
+MONTHS_AHEAD = 2
+
+
+def _month_start(moment, offset):
+    index = moment.year * 12 + moment.month - 1 + offset
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=UTC)
+
+
+def upgrade():
+    op.create_table(
+        "audit_events",
+        sa.Column("occurred_at", sa.DateTime(timezone=True), primary_key=True),
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("event", sa.String(length=64), nullable=False),
+        sa.Column("user_id", sa.String(length=64), nullable=True),
+        sa.Column("ip", sa.String(length=64), nullable=True),
+        sa.Column("issue_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("project_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("details", sa.JSON(), nullable=False),
+        postgresql_partition_by="RANGE (occurred_at)",
+    )
+    now = datetime.now(UTC)
+    for offset in range(MONTHS_AHEAD + 1):
+        start, end = _month_start(now, offset), _month_start(now, offset + 1)
+        op.execute(
+            f"CREATE TABLE audit_events_{start:%Y%m} PARTITION OF audit_events "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+    op.execute("CREATE TABLE audit_events_default PARTITION OF audit_events DEFAULT")
+    op.create_index(
+        "ix_audit_events_issue_occurred_at",
+        "audit_events",
+        ["issue_id", "occurred_at", "id"],
+    )
+    op.create_index(
+        "ix_audit_events_project_occurred_at",
+        "audit_events",
+        ["project_id", "occurred_at", "id"],
+    )
+    op.create_index(
+        "ix_audit_events_user_occurred_at",
+        "audit_events",
+        ["user_id", "occurred_at", "id"],
+    )
+
+
+def downgrade():
+    op.drop_table("audit_events")
@@ -0,0 +1,57 @@
+"""Time JWT signing and verification for each supported ``JWT_ALG``.
+
+Generates a fresh key per algorithm and signs and verifies an access-token
+payload shaped like the ones ``create_token`` issues, using pre-parsed keys as
+the keyring does. Login and refresh sign two tokens each, so the sign column
+is the per-request cost to weigh against policy.
+"""
+
+from __future__ import annotations
+
+import timeit
+import uuid
+from functools import partial
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+
+ROUNDS = 500
+GENERATORS = {
+    "RS256": lambda: rsa.generate_private_key(public_exponent=65537, key_size=2048),
+    "ES256": lambda: ec.generate_private_key(ec.SECP256R1()),
+    "EdDSA": ed25519.Ed25519PrivateKey.generate,
+}
+
+
+def run():
+    payload = {
+        "sub": str(uuid.uuid4()),
+        "type": "access",
+        "iat": 1_700_000_000,
+        "exp": 4_000_000_000,
+    }
+    print(f"{'alg':>6} {'sign':>11} {'verify':>11} {'token bytes':>12}")
+    for algorithm, generate in GENERATORS.items():
+        private_key = generate()
+        public_key = private_key.public_key()
+        headers = {"kid": "bench"}
+        token = jwt.encode(payload, private_key, algorithm=algorithm, headers=headers)
+        assert jwt.decode(token, public_key, algorithms=[algorithm]) == payload
+        sign = timeit.timeit(
+            partial(
+                jwt.encode, payload, private_key, algorithm=algorithm, headers=headers
+            ),
+            number=ROUNDS,
+        )
+        verify = timeit.timeit(
+            partial(jwt.decode, token, public_key, algorithms=[algorithm]),
+            number=ROUNDS,
+        )
+        print(
+            f"{algorithm:>6} {sign / ROUNDS * 1e6:>8.1f} us"
+            f" {verify / ROUNDS * 1e6:>8.1f} us {len(token):>12}"
+        )
+
+
+if __name__ == "__main__":
+    run()
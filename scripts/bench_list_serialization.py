@@ -0,0 +1,94 @@
+"""Compare the ``response_model`` path with ``json_response`` for issue pages.
+
+Seeds an in-memory SQLite database, then times one page per page size:
+selecting ``Issue`` entities and serializing them the way FastAPI does for
+``response_model=list[IssueOut]``, against selecting ``ISSUE_COLUMNS`` and
+writing the body with ``json_response``. Both bodies are checked to match.
+"""
+
+from __future__ import annotations
+
+import timeit
+import uuid
+from datetime import date
+from functools import partial
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from app.api.responses import json_response
+from app.api.routes.issues import ISSUE_COLUMNS
+from app.db.session import Base
+from app.models import Issue, IssuePriority, IssueStatus, Project, User
+from app.schemas.issue import IssueOut
+
+PAGE_SIZES = (50, 100, 200)
+ROUNDS = 100
+
+
+def seed(db: Session, count: int) -> None:
+    user = User(username="bench", email="bench@example.com", password_hash="x")
+    db.add(user)
+    db.flush()
+    project = Project(name="Bench", description="d", created_by_id=user.id)
+    db.add(project)
+    db.flush()
+    db.add_all(
+        Issue(
+            id=uuid.uuid4(),
+            title=f"Issue {i} – café",
+            description="Steps to reproduce: open the page, click save. " * 4,
+            status=list(IssueStatus)[i % 5],
+            priority=list(IssuePriority)[i % 4],
+            project=project.id,
+            reporter=user.id,
+            assignee=user.id if i % 3 else None,
+            due_date=date(2026, 1, 1) if i % 2 else None,
+        )
+        for i in range(count)
+    )
+    db.commit()
+
+
+def response_model_page(db: Session, adapter: TypeAdapter, size: int) -> bytes:
+    # FastAPI validates the returned rows, dumps them to JSON-compatible
+    # Python objects, then JSONResponse runs json.dumps.
+    rows = db.scalars(select(Issue).order_by(Issue.id).limit(size)).all()
+    value = adapter.validate_python(rows, from_attributes=True)
+    body = JSONResponse(adapter.dump_python(value, mode="json")).body
+    db.expunge_all()
+    return body
+
+
+def json_response_page(db: Session, size: int) -> bytes:
+    rows = db.execute(select(*ISSUE_COLUMNS).order_by(Issue.id).limit(size)).all()
+    return json_response(rows, list[IssueOut]).body
+
+
+def run():
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    adapter = TypeAdapter(list[IssueOut])
+    with Session(engine) as db:
+        seed(db, max(PAGE_SIZES))
+        print(
+            f"{'rows':>6} {'response_model':>16} {'json_response':>15} {'speedup':>8}"
+        )
+        for size in PAGE_SIZES:
+            assert response_model_page(db, adapter, size) == json_response_page(
+                db, size
+            )
+            baseline = timeit.timeit(
+                partial(response_model_page, db, adapter, size), number=ROUNDS
+            )
+            fast = timeit.timeit(partial(json_response_page, db, size), number=ROUNDS)
+            print(
+                f"{size:>6} {baseline / ROUNDS * 1000:>13.3f} ms"
+                f" {fast / ROUNDS * 1000:>12.3f} ms {baseline / fast:>7.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,83 @@
+"""Compare access-token decode throughput with and without the verified cache.
+
+Generates a throwaway key pair for ``JWT_ALG`` when the configured key files
+are missing, then times ``decode_token`` three ways: PyJWT with the PEM
+string (re-parsed on every call, as before), PyJWT with the pre-parsed key,
+and ``decode_token`` with the verified-token cache warm. A session's worth of
+distinct tokens is cycled through so the cache sees realistic hit patterns.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import timeit
+from datetime import timedelta
+from functools import partial
+from pathlib import Path
+
+TOKENS = 50
+ROUNDS = 2000
+
+
+def _ensure_keys() -> None:
+    if os.environ.get("JWT_PRIVATE_KEY_PATH"):
+        return
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    key_dir = Path(tempfile.mkdtemp())
+    (key_dir / "private.pem").write_bytes(
+        key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        )
+    )
+    (key_dir / "public.pem").write_bytes(
+        key.public_key().public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+    )
+    os.environ["JWT_PRIVATE_KEY_PATH"] = str(key_dir / "private.pem")
+    os.environ["JWT_PUBLIC_KEY_PATH"] = str(key_dir / "public.pem")
+
+
+def run():
+    _ensure_keys()
+    import jwt
+
+    from app.core.config import settings
+    from app.services import security
+
+    pem = settings.jwt_public_key_path.read_text()
+    algorithms = [settings.jwt_alg]
+    tokens = [
+        security.create_token(f"user-{i}", "access", timedelta(minutes=15))
+        for i in range(TOKENS)
+    ]
+
+    def cycle(decode):
+        for i in range(ROUNDS):
+            decode(tokens[i % TOKENS])
+
+    cases = {
+        "pem string": lambda t: jwt.decode(t, pem, algorithms=algorithms),
+        "parsed key": lambda t: jwt.decode(
+            t, security.get_public_key(), algorithms=algorithms
+        ),
+        "cached": security.decode_token,
+    }
+    for token in tokens:
+        assert security.decode_token(token) == cases["pem string"](token)
+
+    print(f"{'decode':>12} {'per call':>11} {'calls/s':>10}")
+    for name, decode in cases.items():
+        elapsed = timeit.timeit(partial(cycle, decode), number=1)
+        print(f"{name:>12} {elapsed / ROUNDS * 1e6:>8.1f} us {ROUNDS / elapsed:>10.0f}")
+
+
+if __name__ == "__main__":
+    run()
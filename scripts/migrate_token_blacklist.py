@@ -0,0 +1,38 @@
+"""Rewrite ``blacklist:{token}`` entries to compact ``blacklist_key`` keys.
+
+Each entry keeps its remaining TTL. The script is safe to rerun and to run while
+the API serves traffic, since lookups check both key forms until the legacy
+ones are gone. Prints Redis ``MEMORY USAGE`` per entry before and after.
+"""
+
+import redis
+
+from app.core.config import settings
+from app.services.token_store import LEGACY_BLACKLIST_PREFIX, blacklist_key
+
+
+def run():
+    client = redis.from_url(settings.redis_url, decode_responses=True)
+    migrated = before = after = 0
+    for key in client.scan_iter(match=f"{LEGACY_BLACKLIST_PREFIX}*", count=1000):
+        ttl_ms = client.pttl(key)
+        if ttl_ms <= 0:
+            continue
+        new_key = blacklist_key(key[len(LEGACY_BLACKLIST_PREFIX) :])
+        before += client.memory_usage(key, samples=0) or 0
+        pipe = client.pipeline()
+        pipe.psetex(new_key, ttl_ms, "1")
+        pipe.delete(key)
+        pipe.execute()
+        after += client.memory_usage(new_key, samples=0) or 0
+        migrated += 1
+    print(f"Migrated {migrated} blacklist entr{'y' if migrated == 1 else 'ies'}")
+    if migrated:
+        print(
+            f"Memory per entry: {before / migrated:.0f} bytes before,"
+            f" {after / migrated:.0f} bytes after"
+        )
+
+
+if __name__ == "__main__":
+    run()
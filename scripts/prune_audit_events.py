@@ -0,0 +1,30 @@
+"""Create upcoming audit partitions and expire events past AUDIT_RETENTION_DAYS.
+
+Run daily; partitions are created two months ahead so inserts never land in
+the default partition.
+"""
+
+from datetime import UTC, datetime
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.services.audit_events import ensure_partitions, prune_audit_events
+
+
+def run():
+    db: Session = SessionLocal()
+    now = datetime.now(UTC)
+    try:
+        created = ensure_partitions(db, now)
+        if created:
+            print(f"Created partition(s): {', '.join(created)}")
+        deleted = prune_audit_events(db, now, settings.audit_retention_days)
+        print(f"Deleted {deleted} expired audit event(s)")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,19 @@
+"""Recompute per-project issue summary counters from the issues table."""
+
+from sqlalchemy.orm import Session
+
+from app.db.session import SessionLocal
+from app.services.project_summary import rebuild_project_counters
+
+
+def run():
+    db: Session = SessionLocal()
+    try:
+        rows = rebuild_project_counters(db)
+        print(f"Wrote {rows} counter row(s)")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,19 @@
+"""Recompute issue comment counts and last activity from the comments table."""
+
+from sqlalchemy.orm import Session
+
+from app.db.session import SessionLocal
+from app.services.activity import reconcile_issue_activity
+
+
+def run():
+    db: Session = SessionLocal()
+    try:
+        repaired = reconcile_issue_activity(db)
+        print(f"Repaired {repaired} issue(s)")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    run()
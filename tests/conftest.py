@@ -66,9 +66,22 @@ def db_session(engine):
 
 
 @pytest.fixture(scope="function")
-def client(db_session):
+def client(db_session, monkeypatch):
     from app.api import deps
     from app.main import app
+    from app.services import audit
+    from app.services.entity_cache import entity_cache, principal_cache
+    from app.services.response_cache import response_cache
+
+    # Tests also write through db_session, which skips the route invalidations.
+    response_cache.clear()
+    entity_cache.clear()
+    principal_cache.clear()
+    # Audit batches land in the test transaction; tests flush explicitly.
+    audit.audit_buffer.clear()
+    monkeypatch.setattr(
+        audit.audit_buffer, "writer", lambda rows: audit.write_rows(db_session, rows)
+    )
 
     def override_get_db():
         try:
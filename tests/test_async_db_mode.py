@@ -0,0 +1,152 @@
+import json
+from datetime import timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from app.models import User, UserRole
+from app.services.security import create_token, hash_password
+
+pytest.importorskip("aiosqlite")
+
+
+@pytest.fixture
+def async_client(tmp_path):
+    from sqlalchemy.ext.asyncio import (
+        AsyncSession,
+        async_sessionmaker,
+        create_async_engine,
+    )
+
+    from app.api import deps
+    from app.db.session import Base
+    from app.main import app
+
+    path = tmp_path / "async.db"
+    sync_engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(sync_engine)
+    with Session(sync_engine) as db:
+        user = User(
+            username="asyncmgr",
+            email="asyncmgr@example.com",
+            password_hash=hash_password("Manager123!"),
+            role=UserRole.manager,
+        )
+        db.add(user)
+        db.commit()
+        user_id = str(user.id)
+
+    # TestClient runs each request on a fresh event loop, so skip pooling.
+    async_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{path}", poolclass=NullPool
+    )
+    session_local = async_sessionmaker(async_engine, expire_on_commit=False)
+    sessions = []
+
+    async def override_get_async_db():
+        async with session_local() as db:
+            sessions.append(db)
+            yield db
+
+    app.dependency_overrides[deps.get_async_db] = override_get_async_db
+    try:
+        yield TestClient(app), user_id, sessions, AsyncSession
+    finally:
+        app.dependency_overrides.pop(deps.get_async_db, None)
+        sync_engine.dispose()
+
+
+def test_routes_run_on_native_async_session(async_client):
+    client, user_id, sessions, session_type = async_client
+    token = create_token(user_id, "access", timedelta(minutes=15))
+    headers = {"Authorization": f"Bearer {token}"}
+
+    project = client.post(
+        "/api/projects", json={"name": "Async", "description": "d"}, headers=headers
+    )
+    assert project.status_code == 201
+    project_id = project.json()["id"]
+    issue = client.post(
+        f"/api/projects/{project_id}/issues",
+        json={"title": "Async bug", "description": "d", "priority": "critical"},
+        headers=headers,
+    )
+    assert issue.status_code == 201
+    issue_id = issue.json()["id"]
+
+    for next_status in ("in_progress", "resolved"):
+        resp = client.patch(
+            f"/api/issues/{issue_id}", json={"status": next_status}, headers=headers
+        )
+        assert resp.status_code == 200
+    blocked = client.patch(
+        f"/api/issues/{issue_id}", json={"status": "closed"}, headers=headers
+    )
+    assert blocked.status_code == 400
+
+    comment = client.post(
+        f"/api/issues/{issue_id}/comments", json={"content": "ok"}, headers=headers
+    )
+    assert comment.status_code == 201
+    closed = client.patch(
+        f"/api/issues/{issue_id}", json={"status": "closed"}, headers=headers
+    )
+    assert closed.status_code == 200
+
+    listed = client.get(
+        f"/api/projects/{project_id}/issues",
+        params={"cursor": "", "search": "async"},
+        headers=headers,
+    )
+    assert [item["id"] for item in listed.json()] == [issue_id]
+    comments = client.get(f"/api/issues/{issue_id}/comments", headers=headers)
+    assert [item["content"] for item in comments.json()] == ["ok"]
+    streamed = client.get(
+        f"/api/issues/{issue_id}/comments", params={"stream": "true"}, headers=headers
+    )
+    assert [json.loads(line)["content"] for line in streamed.text.splitlines()] == [
+        "ok"
+    ]
+    exported = client.get(
+        f"/api/projects/{project_id}/export",
+        params={"comments": "true"},
+        headers=headers,
+    )
+    record = json.loads(exported.text)
+    assert [c["content"] for c in record["comments"]] == ["ok"]
+    me = client.get("/api/auth/me", headers=headers)
+    assert me.json()["id"] == user_id
+
+    assert sessions
+    assert all(isinstance(db, session_type) for db in sessions)
+
+
+def test_async_url_swaps_driver():
+    from app.db.session import async_url
+
+    url = async_url("postgresql+psycopg2://ai4b:ai4b@db:5432/bugtracker")
+    assert url.drivername == "postgresql+asyncpg"
+    assert (url.username, url.password, url.database) == ("ai4b", "ai4b", "bugtracker")
+    url = async_url("sqlite+pysqlite:///:memory:")
+    assert (url.drivername, url.database) == ("sqlite+aiosqlite", ":memory:")
+    with pytest.raises(ValueError):
+        async_url("mysql://u:p@h/db")
+
+
+def test_native_async_is_the_default_when_the_driver_is_installed(monkeypatch):
+    from app.db import session as db_session
+
+    settings = db_session.settings
+    monkeypatch.setattr(settings, "env", "production")
+    monkeypatch.setattr(settings, "database_url", "sqlite:///app.db")
+    assert settings.db_async is None
+    assert db_session.use_native_async()
+
+    monkeypatch.setattr(settings, "database_url", "mysql://u:p@h/db")
+    assert not db_session.use_native_async()
+    monkeypatch.setattr(settings, "db_async", False)
+    monkeypatch.setattr(settings, "database_url", "sqlite:///app.db")
+    assert not db_session.use_native_async()
@@ -0,0 +1,211 @@
+import os
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.models import AuditEvent, Issue, Project, User, UserRole
+from app.services.audit import AuditBuffer, audit_buffer
+from app.services.audit_events import ensure_partitions, prune_audit_events
+from app.services.security import create_token, hash_password
+
+
+def make_user(db, username, role):
+    user = User(
+        username=username,
+        email=f"{username}@example.com",
+        password_hash=hash_password("User123!"),
+        role=role,
+    )
+    db.add(user)
+    db.flush()
+    token = create_token(str(user.id), "access", timedelta(minutes=15))
+    return user, {"Authorization": f"Bearer {token}"}
+
+
+def seed(db):
+    admin, admin_headers = make_user(db, "auditadmin", UserRole.admin)
+    dev, dev_headers = make_user(db, "auditdev", UserRole.developer)
+    project = Project(name="Audited", description="d", created_by_id=admin.id)
+    db.add(project)
+    db.flush()
+    issue = Issue(
+        title="Tracked",
+        description="d",
+        project=project.id,
+        reporter=dev.id,
+        assignee=dev.id,
+    )
+    db.add(issue)
+    db.commit()
+    return issue, admin_headers, dev_headers
+
+
+def test_issue_activity_lists_stored_changes(client, db_session):
+    issue, _, headers = seed(db_session)
+    for priority in ("high", "critical", "low"):
+        resp = client.patch(
+            f"/api/issues/{issue.id}", json={"priority": priority}, headers=headers
+        )
+        assert resp.status_code == 200
+    resp = client.post(
+        f"/api/issues/{issue.id}/comments", json={"content": "noted"}, headers=headers
+    )
+    assert resp.status_code == 201
+    # Nothing is written on the request path.
+    assert db_session.query(AuditEvent).count() == 0
+    assert audit_buffer.flush() == 4
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 3, **({"cursor": cursor} if cursor else {})}
+        resp = client.get(
+            f"/api/issues/{issue.id}/activity", params=params, headers=headers
+        )
+        assert resp.status_code == 200
+        seen.extend(resp.json())
+        cursor = resp.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+    assert [entry["event"] for entry in seen] == [
+        "comment_add",
+        "issue_update",
+        "issue_update",
+        "issue_update",
+    ]
+    assert seen[1]["details"]["changes"] == {
+        "priority": {"from": "critical", "to": "low"}
+    }
+    assert all("ip" not in entry for entry in seen)
+
+
+def test_bulk_update_is_recorded_per_issue(client, db_session):
+    issue, _, headers = seed(db_session)
+    resp = client.patch(
+        "/api/issues/bulk",
+        json={"ids": [str(issue.id)], "update": {"priority": "high"}},
+        headers=headers,
+    )
+    assert resp.status_code == 200
+    audit_buffer.flush()
+    resp = client.get(f"/api/issues/{issue.id}/activity", headers=headers)
+    [entry] = resp.json()
+    assert entry["event"] == "issue_update"
+    assert entry["details"]["bulk"] is True
+
+
+def test_admin_event_query_filters_and_requires_admin(client, db_session):
+    issue, admin_headers, dev_headers = seed(db_session)
+    client.patch(f"/api/issues/{issue.id}", json={"title": "A"}, headers=dev_headers)
+    client.patch(f"/api/issues/{issue.id}", json={"title": "B"}, headers=dev_headers)
+    audit_buffer.flush()
+
+    resp = client.get("/api/audit/events", headers=dev_headers)
+    assert resp.status_code == 403
+
+    resp = client.get(
+        "/api/audit/events",
+        params={"event": "issue_update", "project_id": str(issue.project), "limit": 1},
+        headers=admin_headers,
+    )
+    assert resp.status_code == 200
+    [newest] = resp.json()
+    assert newest["details"]["changes"]["title"]["to"] == "B"
+    assert "ip" in newest
+    resp = client.get(
+        "/api/audit/events",
+        params={
+            "event": "issue_update",
+            "limit": 1,
+            "cursor": resp.headers["X-Next-Cursor"],
+        },
+        headers=admin_headers,
+    )
+    assert resp.json()[0]["details"]["changes"]["title"]["to"] == "A"
+
+
+def test_buffer_requeues_failed_batches_and_bounds_backlog():
+    written = []
+    failing = True
+
+    def writer(rows):
+        if failing:
+            raise RuntimeError("database unavailable")
+        written.extend(rows)
+
+    buffer = AuditBuffer(writer, batch_size=2, max_pending=3)
+    for index in range(4):
+        buffer.add({"index": index})
+    # The oldest row was dropped to stay within max_pending.
+    assert buffer.pending() == 3
+    assert buffer.flush() == 0
+    assert buffer.pending() == 3
+    failing = False
+    assert buffer.flush() == 3
+    assert [row["index"] for row in written] == [1, 2, 3]
+
+
+def test_prune_removes_expired_events(db_session):
+    now = datetime.now(UTC)
+    for days in (400, 10):
+        db_session.add(
+            AuditEvent(
+                event="login", occurred_at=now - timedelta(days=days), details={}
+            )
+        )
+    db_session.flush()
+    assert prune_audit_events(db_session, now, retention_days=365) == 1
+    [kept] = db_session.query(AuditEvent).all()
+    assert kept.event == "login"
+
+
+POSTGRES_URL = os.environ.get("TEST_POSTGRES_URL")
+
+
+@pytest.fixture
+def partitioned_db():
+    # Partitioning is Postgres-only; run against a scratch schema there.
+    schema = f"audit_{uuid.uuid4().hex[:8]}"
+    admin = create_engine(POSTGRES_URL)
+    with admin.begin() as conn:
+        conn.execute(text(f"CREATE SCHEMA {schema}"))
+    engine = create_engine(
+        POSTGRES_URL, connect_args={"options": f"-csearch_path={schema}"}
+    )
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE audit_events ("
+                "occurred_at timestamptz NOT NULL, id uuid NOT NULL, "
+                "event varchar(64) NOT NULL, user_id varchar(64), ip varchar(64), "
+                "issue_id uuid, project_id uuid, details json NOT NULL, "
+                "PRIMARY KEY (occurred_at, id)) PARTITION BY RANGE (occurred_at)"
+            )
+        )
+        conn.execute(
+            text("CREATE TABLE audit_events_default PARTITION OF audit_events DEFAULT")
+        )
+    with Session(engine) as db:
+        yield db
+    engine.dispose()
+    with admin.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+    admin.dispose()
+
+
+@pytest.mark.skipif(not POSTGRES_URL, reason="TEST_POSTGRES_URL is not set")
+def test_ensure_partitions_moves_rows_out_of_default(partitioned_db):
+    now = datetime.now(UTC)
+    partitioned_db.add(AuditEvent(event="login", occurred_at=now, details={}))
+    partitioned_db.commit()
+
+    created = ensure_partitions(partitioned_db, now)
+    assert created[0] == f"audit_events_{now:%Y%m}"
+    assert len(created) == 3
+    count = "SELECT count(*) FROM {}"
+    assert partitioned_db.scalar(text(count.format(created[0]))) == 1
+    assert partitioned_db.scalar(text(count.format("audit_events_default"))) == 0
+    assert ensure_partitions(partitioned_db, now) == []
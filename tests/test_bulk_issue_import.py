@@ -0,0 +1,107 @@
+import json
+import uuid
+from datetime import timedelta
+
+from sqlalchemy import func, select
+
+from app.core.config import settings
+from app.models import Issue, Project, User, UserRole
+from app.services import issue_import
+from app.services.security import create_token, hash_password
+
+
+def seed(db):
+    user = User(
+        username="bulkuser",
+        email="bulkuser@example.com",
+        password_hash=hash_password("User123!"),
+        role=UserRole.developer,
+    )
+    db.add(user)
+    db.flush()
+    project = Project(name="Bulk", description="demo", created_by_id=user.id)
+    db.add(project)
+    db.commit()
+    token = create_token(str(user.id), "access", timedelta(minutes=15))
+    return user, project, {"Authorization": f"Bearer {token}"}
+
+
+def records(project_id, assignee_id):
+    return [
+        {"title": "First", "description": "<b>bold</b> text", "project": project_id},
+        {"title": "", "description": "missing title", "project": project_id},
+        {"title": "Lost", "description": "d", "project": str(uuid.uuid4())},
+        {
+            "title": "Assigned",
+            "description": "d",
+            "project": project_id,
+            "assignee": assignee_id,
+        },
+        {
+            "title": "Ghost",
+            "description": "d",
+            "project": project_id,
+            "assignee": str(uuid.uuid4()),
+        },
+    ]
+
+
+def assert_results(results, db):
+    errors = {r["index"]: r["error"] for r in results if r["error"]}
+    assert sorted(errors) == [1, 2, 4]
+    assert errors[2] == "Project not found"
+    assert errors[4] == "Assignee not found"
+    assert errors[1].startswith("title:")
+    created = [r["id"] for r in results if r["id"]]
+    issues = db.scalars(select(Issue).where(Issue.id.in_(created))).all()
+    assert {issue.title for issue in issues} == {"First", "Assigned"}
+    assert {issue.description for issue in issues} == {"bold text", "d"}
+
+
+def test_bulk_create_from_json_array(client, db_session, monkeypatch):
+    monkeypatch.setattr(issue_import, "BATCH_SIZE", 2)
+    user, project, headers = seed(db_session)
+    resp = client.post(
+        "/api/issues/bulk",
+        json=records(str(project.id), str(user.id)),
+        headers=headers,
+    )
+    assert resp.status_code == 200
+    body = resp.json()
+    assert (body["created"], body["failed"]) == (2, 3)
+    assert_results(body["results"], db_session)
+
+
+def test_bulk_create_from_ndjson(client, db_session, monkeypatch):
+    monkeypatch.setattr(issue_import, "BATCH_SIZE", 2)
+    user, project, headers = seed(db_session)
+    lines = [json.dumps(r) for r in records(str(project.id), str(user.id))]
+    body = "\n".join(lines[:3]) + "\n\n" + "\n".join(lines[3:])
+    resp = client.post(
+        "/api/issues/bulk",
+        content=body.encode(),
+        headers={**headers, "Content-Type": "application/x-ndjson"},
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    *results, summary = [json.loads(line) for line in resp.text.splitlines()]
+    assert [r["index"] for r in results] == [0, 1, 2, 3, 4]
+    assert summary == {"created": 2, "failed": 3}
+    assert_results(results, db_session)
+
+
+def test_bulk_create_rejects_bad_bodies(client, db_session, monkeypatch):
+    _, _, headers = seed(db_session)
+    resp = client.post("/api/issues/bulk", json={"title": "x"}, headers=headers)
+    assert resp.status_code == 400
+    monkeypatch.setattr(settings, "bulk_import_json_max_bytes", 16)
+    resp = client.post("/api/issues/bulk", json=[{"title": "x" * 20}], headers=headers)
+    assert resp.status_code == 413
+    resp = client.post(
+        "/api/issues/bulk",
+        content=b"title: x",
+        headers={**headers, "Content-Type": "text/plain"},
+    )
+    assert resp.status_code == 415
+    count = db_session.scalar(select(func.count()).select_from(Issue))
+    assert count == 0
@@ -0,0 +1,132 @@
+import uuid
+from datetime import timedelta
+
+from app.models import (
+    Comment,
+    Issue,
+    IssuePriority,
+    IssueStatus,
+    Project,
+    User,
+    UserRole,
+)
+from app.services.security import create_token, hash_password
+
+
+def seed(db):
+    manager = User(
+        username="triage",
+        email="triage@example.com",
+        password_hash=hash_password("Manager123!"),
+        role=UserRole.manager,
+    )
+    dev = User(
+        username="dev",
+        email="dev@example.com",
+        password_hash=hash_password("Dev123!a"),
+        role=UserRole.developer,
+    )
+    db.add_all([manager, dev])
+    db.flush()
+    project = Project(name="Triage", description="demo", created_by_id=manager.id)
+    db.add(project)
+    db.flush()
+    issues = [
+        Issue(
+            title=f"Bug {n}",
+            description="d",
+            project=project.id,
+            reporter=manager.id,
+            status=status,
+            priority=priority,
+        )
+        for n, (status, priority) in enumerate(
+            [
+                (IssueStatus.open, IssuePriority.low),
+                (IssueStatus.open, IssuePriority.low),
+                (IssueStatus.resolved, IssuePriority.critical),
+                (IssueStatus.resolved, IssuePriority.critical),
+            ]
+        )
+    ]
+    db.add_all(issues)
+    db.flush()
+    db.add(Comment(content="note", issue_id=issues[3].id, author_id=manager.id))
+    db.commit()
+    return manager, dev, issues
+
+
+def headers(user):
+    token = create_token(str(user.id), "access", timedelta(minutes=5))
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_bulk_update_applies_one_update_to_many_ids(client, db_session):
+    manager, dev, issues = seed(db_session)
+    missing = uuid.uuid4()
+    resp = client.patch(
+        "/api/issues/bulk",
+        json={
+            "ids": [str(i.id) for i in issues] + [str(missing)],
+            "update": {"status": "in_progress", "assignee": str(dev.id)},
+        },
+        headers=headers(manager),
+    )
+    assert resp.status_code == 200
+    body = resp.json()
+    assert (body["updated"], body["failed"]) == (2, 3)
+    errors = {r["id"]: r["error"] for r in body["results"] if not r["updated"]}
+    assert errors == {
+        str(issues[2].id): "Invalid status transition",
+        str(issues[3].id): "Invalid status transition",
+        str(missing): "Issue not found",
+    }
+    db_session.expire_all()
+    for issue in issues[:2]:
+        refreshed = db_session.get(Issue, issue.id)
+        assert refreshed.status == IssueStatus.in_progress
+        assert refreshed.assignee == dev.id
+    assert db_session.get(Issue, issues[2].id).status == IssueStatus.resolved
+
+
+def test_bulk_update_per_id_items_and_critical_close(client, db_session):
+    manager, _, issues = seed(db_session)
+    resp = client.patch(
+        "/api/issues/bulk",
+        json={
+            "items": [
+                {"id": str(issues[0].id), "title": "Renamed"},
+                {"id": str(issues[1].id), "assignee": str(uuid.uuid4())},
+                {"id": str(issues[2].id), "status": "closed"},
+                {"id": str(issues[3].id), "status": "closed"},
+            ]
+        },
+        headers=headers(manager),
+    )
+    assert resp.status_code == 200
+    results = resp.json()["results"]
+    assert [r["updated"] for r in results] == [True, False, False, True]
+    assert results[1]["error"] == "Assignee not found"
+    assert "require a comment" in results[2]["error"]
+    db_session.expire_all()
+    assert db_session.get(Issue, issues[0].id).title == "Renamed"
+    assert db_session.get(Issue, issues[3].id).status == IssueStatus.closed
+
+
+def test_bulk_update_checks_permissions_and_shape(client, db_session):
+    manager, dev, issues = seed(db_session)
+    resp = client.patch(
+        "/api/issues/bulk",
+        json={"ids": [str(issues[0].id)], "update": {"title": "Nope"}},
+        headers=headers(dev),
+    )
+    assert resp.status_code == 200
+    assert resp.json()["results"] == [
+        {"id": str(issues[0].id), "updated": False, "error": "Forbidden"}
+    ]
+    resp = client.patch(
+        "/api/issues/bulk",
+        json={"ids": [str(issues[0].id)]},
+        headers=headers(manager),
+    )
+    assert resp.status_code == 422
@@ -0,0 +1,77 @@
+import json
+from datetime import datetime, timedelta
+
+from app.api.routes import comments
+from app.models import Comment, Issue, Project, User, UserRole
+from app.services.security import create_token, hash_password
+
+
+def seed(db, comments=7):
+    user = User(
+        username="commenter",
+        email="commenter@example.com",
+        password_hash=hash_password("User123!"),
+        role=UserRole.developer,
+    )
+    db.add(user)
+    db.flush()
+    project = Project(name="Threads", description="demo", created_by_id=user.id)
+    db.add(project)
+    db.flush()
+    issue = Issue(title="Chatty", description="d", project=project.id, reporter=user.id)
+    db.add(issue)
+    db.flush()
+    base = datetime(2026, 1, 1)
+    for i in range(comments):
+        db.add(
+            Comment(
+                content=f"c{i}",
+                issue_id=issue.id,
+                author_id=user.id,
+                # Pairs share a timestamp so the id tiebreaker matters.
+                created_at=base + timedelta(minutes=i // 2),
+            )
+        )
+    db.commit()
+    token = create_token(str(user.id), "access", timedelta(minutes=15))
+    return issue, {"Authorization": f"Bearer {token}"}
+
+
+def test_comment_listing_is_ordered_and_limited(client, db_session):
+    issue, headers = seed(db_session)
+    for url in (f"/api/issues/{issue.id}/comments", f"/api/comments/issue/{issue.id}"):
+        resp = client.get(url, params={"limit": 3}, headers=headers)
+        assert resp.status_code == 200
+        first = resp.json()
+        assert len(first) == 3
+        assert {c["content"] for c in first[:2]} == {"c0", "c1"}
+
+        seen = []
+        cursor = ""
+        while cursor is not None:
+            resp = client.get(
+                url, params={"limit": 3, "cursor": cursor}, headers=headers
+            )
+            assert resp.status_code == 200
+            seen.extend(resp.json())
+            cursor = resp.headers.get("X-Next-Cursor")
+        assert len(seen) == 7
+        assert len({c["id"] for c in seen}) == 7
+        keys = [(c["created_at"], c["id"]) for c in seen]
+        assert keys == sorted(keys)
+
+
+def test_comment_listing_streams_ndjson(client, db_session, monkeypatch):
+    monkeypatch.setattr(comments, "STREAM_BATCH_SIZE", 5)
+    issue, headers = seed(db_session, comments=12)
+    resp = client.get(
+        f"/api/issues/{issue.id}/comments",
+        params={"stream": "true", "sort": "-created_at"},
+        headers=headers,
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in resp.text.splitlines()]
+    assert len(rows) == 12
+    created = [row["created_at"] for row in rows]
+    assert created == sorted(created, reverse=True)
@@ -0,0 +1,125 @@
+import uuid
+from datetime import timedelta
+
+from app.models import Issue, Project, User, UserRole
+from app.services.security import create_token, hash_password
+
+
+def seed(db, issues=3):
+    user = User(
+        username="etaguser",
+        email="etaguser@example.com",
+        password_hash=hash_password("User123!"),
+        role=UserRole.manager,
+    )
+    db.add(user)
+    db.flush()
+    project = Project(name="ETags", description="demo", created_by_id=user.id)
+    db.add(project)
+    db.flush()
+    rows = [
+        Issue(
+            title=f"Issue {i}",
+            description="desc",
+            project=project.id,
+            reporter=user.id,
+        )
+        for i in range(issues)
+    ]
+    db.add_all(rows)
+    db.commit()
+    token = create_token(str(user.id), "access", timedelta(minutes=15))
+    return project, rows, {"Authorization": f"Bearer {token}"}
+
+
+def revalidate(client, url, headers, etag):
+    return client.get(url, headers={**headers, "If-None-Match": etag})
+
+
+def test_issue_detail_not_modified_until_changed(client, db_session):
+    _, issues, headers = seed(db_session)
+    url = f"/api/issues/{issues[0].id}"
+    first = client.get(url, headers=headers)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+
+    cached = revalidate(client, url, headers, etag)
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["ETag"] == etag
+    assert revalidate(client, url, headers, f"W/{etag}").status_code == 304
+    assert revalidate(client, url, headers, '"stale", ' + etag).status_code == 304
+
+    resp = client.patch(url, json={"title": "Renamed"}, headers=headers)
+    assert resp.status_code == 200
+    changed = revalidate(client, url, headers, etag)
+    assert changed.status_code == 200
+    assert changed.json()["title"] == "Renamed"
+    assert changed.headers["ETag"] != etag
+
+
+def test_new_comment_changes_issue_etag(client, db_session):
+    _, issues, headers = seed(db_session)
+    url = f"/api/issues/{issues[0].id}"
+    etag = client.get(url, headers=headers).headers["ETag"]
+    resp = client.post(
+        f"/api/issues/{issues[0].id}/comments",
+        json={"content": "new activity"},
+        headers=headers,
+    )
+    assert resp.status_code == 201
+    assert revalidate(client, url, headers, etag).status_code == 200
+
+
+def test_detail_probe_still_404s(client, db_session):
+    _, _, headers = seed(db_session)
+    for url in (f"/api/issues/{uuid.uuid4()}", f"/api/projects/{uuid.uuid4()}"):
+        assert revalidate(client, url, headers, '"x"').status_code == 404
+
+
+def test_project_detail_etag(client, db_session):
+    project, _, headers = seed(db_session)
+    url = f"/api/projects/{project.id}"
+    etag = client.get(url, headers=headers).headers["ETag"]
+    assert revalidate(client, url, headers, etag).status_code == 304
+    assert revalidate(client, url, headers, "*").status_code == 304
+
+
+def test_list_etag_tracks_page_contents(client, db_session):
+    project, issues, headers = seed(db_session)
+    url = f"/api/projects/{project.id}/issues?sort=created_at"
+    etag = client.get(url, headers=headers).headers["ETag"]
+    assert revalidate(client, url, headers, etag).status_code == 304
+
+    client.patch(
+        f"/api/issues/{issues[1].id}", json={"title": "Edited"}, headers=headers
+    )
+    resp = revalidate(client, url, headers, etag)
+    assert resp.status_code == 200
+    etag = resp.headers["ETag"]
+
+    client.post(
+        f"/api/projects/{project.id}/issues",
+        json={"title": "Another", "description": "desc"},
+        headers=headers,
+    )
+    assert revalidate(client, url, headers, etag).status_code == 200
+
+
+def test_list_etag_depends_on_query_and_count(client, db_session):
+    project, _, headers = seed(db_session)
+    url = f"/api/projects/{project.id}/issues"
+    plain = client.get(url, headers=headers).headers["ETag"]
+    counted = client.get(url + "?count=exact", headers=headers).headers["ETag"]
+    assert plain != counted
+    assert revalidate(client, url + "?count=exact", headers, counted).status_code == 304
+    assert revalidate(client, url + "?count=exact", headers, plain).status_code == 200
+
+
+def test_comment_list_etag(client, db_session):
+    _, issues, headers = seed(db_session)
+    url = f"/api/issues/{issues[0].id}/comments"
+    etag = client.get(url, headers=headers).headers["ETag"]
+    assert revalidate(client, url, headers, etag).status_code == 304
+    client.post(url, json={"content": "first"}, headers=headers)
+    assert revalidate(client, url, headers, etag).status_code == 200
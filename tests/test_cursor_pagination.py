@@ -0,0 +1,100 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from app.models import Issue, IssuePriority, Project, User, UserRole
+from app.services.security import create_token, hash_password
+
+
+def _auth_headers(user_id: str) -> dict[str, str]:
+    token = create_token(user_id, "access", timedelta(minutes=15))
+    return {"Authorization": f"Bearer {token}"}
+
+
+def seed(db):
+    user = User(
+        username="cursoruser",
+        email="cursoruser@example.com",
+        password_hash=hash_password("User123!"),
+        role=UserRole.manager,
+    )
+    db.add(user)
+    db.flush()
+    project = Project(name="Cursor", description="demo", created_by_id=user.id)
+    db.add(project)
+    db.flush()
+    base = datetime(2026, 1, 1)
+    priorities = list(IssuePriority)
+    for i in range(7):
+        db.add(
+            Issue(
+                title=f"Issue {i}",
+                description="desc",
+                project=project.id,
+                reporter=user.id,
+                priority=priorities[i % len(priorities)],
+                due_date=None if i % 3 == 0 else date(2026, 2, 1 + i % 2),
+                created_at=base + timedelta(minutes=i // 2),
+            )
+        )
+    db.commit()
+    return user, project
+
+
+def _walk(client, url, headers, **params):
+    seen = []
+    cursor = ""
+    while cursor is not None:
+        resp = client.get(url, params={**params, "cursor": cursor}, headers=headers)
+        assert resp.status_code == 200
+        seen.extend(item["id"] for item in resp.json())
+        cursor = resp.headers.get("X-Next-Cursor")
+    return seen
+
+
+@pytest.mark.parametrize(
+    "sort", [None, "created_at", "-created_at", "priority", "-status", "due_date"]
+)
+def test_cursor_walk_matches_offset_listing(client, db_session, sort):
+    user, project = seed(db_session)
+    headers = _auth_headers(str(user.id))
+    params = {"limit": 3}
+    if sort:
+        params["sort"] = sort
+
+    walked = _walk(client, f"/api/projects/{project.id}/issues", headers, **params)
+
+    assert len(walked) == 7
+    assert len(set(walked)) == 7
+    if sort and sort != "due_date":
+        full = client.get(
+            "/api/issues", params={"sort": sort, "limit": 50}, headers=headers
+        )
+        assert [item["id"] for item in full.json()] == walked
+
+
+def test_cursor_nulls_sort_last(client, db_session):
+    user, _ = seed(db_session)
+    headers = _auth_headers(str(user.id))
+    walked = _walk(client, "/api/issues", headers, sort="-due_date", limit=2)
+    issues = {str(i.id): i for i in db_session.query(Issue).all()}
+    due_dates = [issues[issue_id].due_date for issue_id in walked]
+    assert due_dates[-3:] == [None, None, None]
+    assert due_dates[:4] == sorted(due_dates[:4], reverse=True)
+
+
+def test_invalid_cursor_rejected(client, db_session):
+    user, _ = seed(db_session)
+    headers = _auth_headers(str(user.id))
+    resp = client.get("/api/issues", params={"cursor": "garbage"}, headers=headers)
+    assert resp.status_code == 400
+
+    first = client.get(
+        "/api/issues", params={"cursor": "", "limit": 2}, headers=headers
+    )
+    cursor = first.headers["X-Next-Cursor"]
+    resp = client.get(
+        "/api/issues", params={"cursor": cursor, "sort": "-priority"}, headers=headers
+    )
+    assert resp.status_code == 400
+    assert resp.json()["error"]["message"] == "Invalid cursor"
@@ -0,0 +1,83 @@
+import time
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.core.metrics import pool_metrics
+from app.db.pool import InstrumentedQueuePool, instrument_pool, pool_options
+
+
+@pytest.fixture
+def pooled_engine(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=0.05,
+    )
+    instrument_pool(engine.pool, "test_pool", idle_ping_seconds=0.05)
+    yield engine
+    engine.dispose()
+
+
+def stats():
+    return pool_metrics.snapshot()["test_pool"]
+
+
+def test_pool_reports_occupancy_and_timeouts(pooled_engine):
+    first = pooled_engine.connect()
+    second = pooled_engine.connect()
+    assert stats()["in_use"] == 2
+    assert stats()["overflow"] == 1
+    with pytest.raises(PoolTimeoutError):
+        pooled_engine.connect()
+    second.close()
+    first.close()
+
+    snapshot = stats()
+    assert snapshot["in_use"] == 0
+    assert snapshot["checkouts"] >= 2
+    assert snapshot["timeouts"] >= 1
+    assert snapshot["wait_ms_max"] >= 40
+
+
+def test_pre_ping_only_after_idle(pooled_engine):
+    before = stats()["pings"]
+    for _ in range(3):
+        with pooled_engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    assert stats()["pings"] == before
+
+    time.sleep(0.1)
+    with pooled_engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    assert stats()["pings"] == before + 1
+
+
+def test_failed_ping_invalidates_and_reconnects(pooled_engine):
+    with pooled_engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        raw = conn.connection.dbapi_connection
+    raw.close()
+    time.sleep(0.1)
+
+    invalidations = stats()["invalidations"]
+    with pooled_engine.connect() as conn:
+        assert conn.execute(text("SELECT 1")).scalar() == 1
+    assert stats()["ping_failures"] >= 1
+    assert stats()["invalidations"] > invalidations
+
+
+def test_pool_options_skip_sqlite():
+    assert pool_options("sqlite:///:memory:") == {}
+    options = pool_options("postgresql+psycopg2://u:p@db/app")
+    assert options["poolclass"] is InstrumentedQueuePool
+    assert {"pool_size", "max_overflow", "pool_timeout", "pool_recycle"} <= set(options)
+
+
+def test_metrics_endpoint_includes_pools(client):
+    resp = client.get("/metrics")
+    assert resp.status_code == 200
+    assert "db_pools" in resp.json()
@@ -0,0 +1,125 @@
+import time
+import uuid
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import event
+
+from app.models import Issue, Project, User, UserRole
+from app.services.entity_cache import EntityCache, IssueRef, ProjectRef, entity_cache
+from app.services.security import create_token, hash_password
+
+
+def make_user(db, name, role):
+    user = User(
+        username=name,
+        email=f"{name}@example.com",
+        password_hash=hash_password("User123!"),
+        role=role,
+    )
+    db.add(user)
+    db.flush()
+    token = create_token(str(user.id), "access", timedelta(minutes=15))
+    return user, {"Authorization": f"Bearer {token}"}
+
+
+def seed(db):
+    manager, manager_headers = make_user(db, "refmanager", UserRole.manager)
+    developer, developer_headers = make_user(db, "refdev", UserRole.developer)
+    project = Project(name="Refs", description="demo", created_by_id=manager.id)
+    db.add(project)
+    db.flush()
+    issue = Issue(
+        title="Issue", description="desc", project=project.id, reporter=manager.id
+    )
+    db.add(issue)
+    db.commit()
+    return project, issue, developer, manager_headers, developer_headers
+
+
+@pytest.fixture
+def selects(engine):
+    statements: list[str] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", capture)
+    yield statements
+    event.remove(engine, "before_cursor_execute", capture)
+
+
+def test_scoped_reads_skip_the_lookup_once_cached(client, db_session, selects):
+    project, issue, _, headers, _ = seed(db_session)
+    for url in (
+        f"/api/projects/{project.id}/summary",
+        f"/api/issues/{issue.id}/activity",
+    ):
+        assert client.get(url, headers=headers).status_code == 200
+        selects.clear()
+        assert client.get(url, headers=headers).status_code == 200
+        assert not [s for s in selects if "FROM projects" in s or "FROM issues" in s]
+
+
+def test_missing_ids_are_not_cached(client, db_session):
+    _, _, _, headers, _ = seed(db_session)
+    missing = uuid.uuid4()
+    resp = client.get(f"/api/projects/{missing}/summary", headers=headers)
+    assert resp.status_code == 404
+    assert entity_cache.get(ProjectRef, missing) is None
+
+
+def test_reassignment_invalidates_cached_issue(client, db_session):
+    _, issue, developer, manager_headers, developer_headers = seed(db_session)
+    url = f"/api/issues/{issue.id}"
+    client.get(f"{url}/activity", headers=manager_headers)
+    resp = client.patch(url, json={"title": "Mine"}, headers=developer_headers)
+    assert resp.status_code == 403
+
+    resp = client.patch(
+        url, json={"assignee": str(developer.id)}, headers=manager_headers
+    )
+    assert resp.status_code == 200
+    assert entity_cache.get(IssueRef, issue.id) is None
+    resp = client.patch(url, json={"title": "Mine"}, headers=developer_headers)
+    assert resp.status_code == 200
+
+
+def test_archive_invalidates_cached_project(client, db_session):
+    project, _, _, headers, _ = seed(db_session)
+    client.get(f"/api/projects/{project.id}/summary", headers=headers)
+    assert entity_cache.get(ProjectRef, project.id).is_archived is False
+
+    assert (
+        client.delete(f"/api/projects/{project.id}", headers=headers).status_code == 204
+    )
+    client.get(f"/api/projects/{project.id}/summary", headers=headers)
+    assert entity_cache.get(ProjectRef, project.id).is_archived is True
+
+
+def test_entries_are_dropped_after_commit_not_flush(client, db_session):
+    project, issue, developer, headers, _ = seed(db_session)
+    client.get(f"/api/issues/{issue.id}/activity", headers=headers)
+    client.get(f"/api/projects/{project.id}/summary", headers=headers)
+
+    issue.assignee = developer.id
+    project.is_archived = True
+    db_session.flush()
+    assert entity_cache.get(IssueRef, issue.id) is not None
+    db_session.commit()
+    assert entity_cache.get(IssueRef, issue.id) is None
+    assert entity_cache.get(ProjectRef, project.id) is None
+
+
+def test_entries_expire_and_remote_invalidations_apply():
+    cache = EntityCache(max_entries=10, ttl_seconds=0.05)
+    ref = ProjectRef(uuid.uuid4(), uuid.uuid4(), False)
+    cache.put(ref)
+    assert cache.get(ProjectRef, ref.id) == ref
+    cache._on_message({"data": f"ProjectRef:{ref.id}".encode()})
+    assert cache.get(ProjectRef, ref.id) is None
+
+    cache.put(ref)
+    time.sleep(0.06)
+    assert cache.get(ProjectRef, ref.id) is None
@@ -0,0 +1,123 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import update
+
+from app.models import Comment, Issue, Project, User, UserRole
+from app.services.activity import reconcile_issue_activity
+from app.services.security import create_token, hash_password
+
+
+def seed(db):
+    user = User(
+        username="active",
+        email="active@example.com",
+        password_hash=hash_password("User123!"),
+        role=UserRole.developer,
+    )
+    db.add(user)
+    db.flush()
+    project = Project(name="Activity", description="demo", created_by_id=user.id)
+    db.add(project)
+    db.flush()
+    old = datetime(2025, 1, 1)
+    issues = [
+        Issue(
+            title=f"Issue {i}",
+            description="d",
+            project=project.id,
+            reporter=user.id,
+            created_at=old,
+            updated_at=old,
+            last_activity_at=old,
+        )
+        for i in range(3)
+    ]
+    db.add_all(issues)
+    db.commit()
+    token = create_token(str(user.id), "access", timedelta(minutes=15))
+    return user, project, issues, {"Authorization": f"Bearer {token}"}
+
+
+def test_comments_maintain_count_and_activity(client, db_session):
+    _, project, issues, headers = seed(db_session)
+    target = issues[1]
+    for n in range(2):
+        resp = client.post(
+            f"/api/issues/{target.id}/comments",
+            json={"content": f"note {n}"},
+            headers=headers,
+        )
+        assert resp.status_code == 201
+    comment_id = resp.json()["id"]
+
+    db_session.expire_all()
+    issue = db_session.get(Issue, target.id)
+    assert issue.comment_count == 2
+    assert issue.last_activity_at > datetime(2025, 1, 1)
+    assert issue.updated_at == datetime(2025, 1, 1)
+
+    touched = issue.last_activity_at
+    resp = client.patch(
+        f"/api/comments/{comment_id}", json={"content": "edited"}, headers=headers
+    )
+    assert resp.status_code == 200
+    db_session.expire_all()
+    issue = db_session.get(Issue, target.id)
+    assert issue.comment_count == 2
+    assert issue.last_activity_at >= touched
+
+    for sort in ("-comment_count", "-last_activity_at"):
+        resp = client.get(
+            f"/api/projects/{project.id}/issues", params={"sort": sort}, headers=headers
+        )
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body[0]["id"] == str(target.id)
+        assert body[0]["comment_count"] == 2
+
+
+def test_only_content_edits_touch_the_issue(db_session):
+    user, _, issues, _ = seed(db_session)
+    comment = Comment(content="c", issue_id=issues[0].id, author_id=user.id)
+    db_session.add(comment)
+    db_session.commit()
+    old = datetime(2025, 1, 1)
+    issues_table = Issue.__table__
+    db_session.execute(update(issues_table).values(last_activity_at=old))
+    db_session.commit()
+
+    comment.updated_at = datetime(2025, 6, 1)
+    db_session.commit()
+    db_session.expire_all()
+    assert db_session.get(Issue, issues[0].id).last_activity_at == old
+
+    comment.content = "edited"
+    db_session.commit()
+    db_session.expire_all()
+    assert db_session.get(Issue, issues[0].id).last_activity_at > old
+
+
+def test_reconcile_repairs_drift(db_session):
+    user, _, issues, _ = seed(db_session)
+    db_session.add(Comment(content="c", issue_id=issues[0].id, author_id=user.id))
+    db_session.commit()
+    issues_table = Issue.__table__
+    db_session.execute(
+        update(issues_table)
+        .where(issues_table.c.id == issues[0].id)
+        .values(comment_count=7, last_activity_at=datetime(2024, 1, 1))
+    )
+    db_session.execute(
+        update(issues_table)
+        .where(issues_table.c.id == issues[2].id)
+        .values(comment_count=3)
+    )
+    db_session.commit()
+
+    assert reconcile_issue_activity(db_session) == 2
+    db_session.expire_all()
+    repaired = db_session.get(Issue, issues[0].id)
+    assert repaired.comment_count == 1
+    assert repaired.last_activity_at > datetime(2025, 1, 1)
+    assert db_session.get(Issue, issues[2].id).comment_count == 0
+    assert reconcile_issue_activity(db_session) == 0
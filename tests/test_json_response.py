@@ -0,0 +1,76 @@
+from datetime import date, timedelta
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import select
+
+from app.models import Issue, IssuePriority, Project, User, UserRole
+from app.schemas.issue import IssueOut
+from app.services.security import create_token, hash_password
+
+
+def seed(db):
+    user = User(
+        username="fastjson",
+        email="fastjson@example.com",
+        password_hash=hash_password("User123!"),
+        role=UserRole.developer,
+    )
+    db.add(user)
+    db.flush()
+    project = Project(name="Fast JSON", description=None, created_by_id=user.id)
+    db.add(project)
+    db.flush()
+    for i in range(5):
+        db.add(
+            Issue(
+                title=f"Ünïcode “{i}”   <tag>",
+                description='line\nbreak\t"quoted"',
+                project=project.id,
+                reporter=user.id,
+                assignee=user.id if i % 2 else None,
+                priority=list(IssuePriority)[i % 4],
+                due_date=date(2026, 5, 1) if i % 2 else None,
+            )
+        )
+    db.commit()
+    token = create_token(str(user.id), "access", timedelta(minutes=15))
+    return project, {"Authorization": f"Bearer {token}"}
+
+
+def response_model_body(value, schema):
+    # What FastAPI produces for a route declared with response_model=schema.
+    adapter = TypeAdapter(schema)
+    validated = adapter.validate_python(value, from_attributes=True)
+    return JSONResponse(adapter.dump_python(validated, mode="json")).body
+
+
+def test_issue_list_matches_response_model_output(client, db_session):
+    project, headers = seed(db_session)
+    resp = client.get(
+        f"/api/projects/{project.id}/issues",
+        params={"sort": "priority", "limit": 3, "cursor": "", "count": "exact"},
+        headers=headers,
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/json"
+    assert resp.headers["X-Total-Count"] == "5"
+    assert resp.headers["X-Next-Cursor"]
+
+    ids = [item["id"] for item in resp.json()]
+    issues = {
+        str(issue.id): issue
+        for issue in db_session.scalars(
+            select(Issue).where(Issue.project == project.id)
+        )
+    }
+    expected = response_model_body([issues[i] for i in ids], list[IssueOut])
+    assert resp.content == expected
+
+
+def test_issue_detail_matches_response_model_output(client, db_session):
+    project, headers = seed(db_session)
+    issue = db_session.scalars(select(Issue).where(Issue.project == project.id)).first()
+    resp = client.get(f"/api/issues/{issue.id}", headers=headers)
+    assert resp.status_code == 200
+    assert resp.content == response_model_body(issue, IssueOut)
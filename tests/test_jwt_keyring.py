@@ -0,0 +1,117 @@
+from datetime import timedelta
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+
+from app.core.config import settings
+from app.services import security
+
+GENERATORS = {
+    "RS256": lambda: rsa.generate_private_key(public_exponent=65537, key_size=2048),
+    "ES256": lambda: ec.generate_private_key(ec.SECP256R1()),
+    "EdDSA": ed25519.Ed25519PrivateKey.generate,
+}
+
+
+def write_key(directory, name, algorithm):
+    key = GENERATORS[algorithm]()
+    private_path = directory / f"{name}_private.pem"
+    public_path = directory / f"{name}_public.pem"
+    private_path.write_bytes(
+        key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        )
+    )
+    public_path.write_bytes(
+        key.public_key().public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+    )
+    return private_path, public_path
+
+
+@pytest.fixture
+def use_key(monkeypatch):
+    monkeypatch.setattr(security, "KEYRING_CACHE", None)
+    monkeypatch.setattr(
+        security, "verified_tokens", security.VerifiedTokenCache(max_entries=0)
+    )
+
+    def use(algorithm, private_path, public_path, previous=()):
+        monkeypatch.setattr(settings, "jwt_alg", algorithm)
+        monkeypatch.setattr(settings, "jwt_private_key_path", private_path)
+        monkeypatch.setattr(settings, "jwt_public_key_path", public_path)
+        monkeypatch.setattr(
+            settings,
+            "jwt_previous_public_key_paths",
+            ",".join(str(p) for p in previous),
+        )
+        security.KEYRING_CACHE = None
+
+    return use
+
+
+@pytest.mark.parametrize("algorithm", sorted(GENERATORS))
+def test_tokens_carry_kid_and_round_trip(tmp_path, use_key, algorithm):
+    use_key(algorithm, *write_key(tmp_path, "current", algorithm))
+    token = security.create_token("user", "access", timedelta(minutes=5))
+    header = jwt.get_unverified_header(token)
+    assert header["alg"] == algorithm
+    assert header["kid"] == security.get_keyring().kid
+    assert security.decode_token(token)["sub"] == "user"
+
+
+def test_rotation_honours_previous_keys(tmp_path, use_key):
+    old_private, old_public = write_key(tmp_path, "old", "RS256")
+    new_private, new_public = write_key(tmp_path, "new", "EdDSA")
+    use_key("RS256", old_private, old_public)
+    old_token = security.create_token("user", "access", timedelta(minutes=5))
+
+    use_key("EdDSA", new_private, new_public, previous=[old_public])
+    assert security.decode_token(old_token)["sub"] == "user"
+    new_token = security.create_token("user", "access", timedelta(minutes=5))
+    assert jwt.get_unverified_header(new_token)["alg"] == "EdDSA"
+
+    use_key("EdDSA", new_private, new_public)
+    with pytest.raises(ValueError):
+        security.decode_token(old_token)
+    assert security.decode_token(new_token)["sub"] == "user"
+
+
+def test_kid_pins_the_algorithm(tmp_path, use_key):
+    use_key("ES256", *write_key(tmp_path, "current", "ES256"))
+    keyring = security.get_keyring()
+    forged = jwt.encode(
+        {"sub": "user", "type": "access"},
+        "s" * 32,
+        algorithm="HS256",
+        headers={"kid": keyring.kid},
+    )
+    with pytest.raises(ValueError):
+        security.decode_token(forged)
+
+
+def test_tokens_without_kid_use_the_current_key(tmp_path, use_key):
+    use_key("EdDSA", *write_key(tmp_path, "current", "EdDSA"))
+    token = jwt.encode(
+        {"sub": "user", "type": "access"},
+        security.get_private_key(),
+        algorithm="EdDSA",
+    )
+    assert security.decode_token(token)["sub"] == "user"
+
+
+def test_mismatched_keys_are_rejected(tmp_path, use_key):
+    private_path, _ = write_key(tmp_path, "signing", "ES256")
+    _, other_public = write_key(tmp_path, "other", "ES256")
+    use_key("RS256", private_path, other_public)
+    with pytest.raises(ValueError, match="not a RS256 key"):
+        security.get_keyring()
+    use_key("ES256", private_path, other_public)
+    with pytest.raises(ValueError, match="does not match"):
+        security.get_keyring()
@@ -0,0 +1,106 @@
+import json
+import logging
+import queue
+from collections import deque
+
+from app.core import logging as app_logging
+from app.core.logging import (
+    AccessLogSampler,
+    ContextQueueHandler,
+    JsonFormatter,
+    SpillingQueueListener,
+    parse_sample_rules,
+    request_id_ctx,
+)
+from app.core.metrics import log_metrics
+
+
+def access_record(status_code, route, name="access", level=logging.INFO):
+    record = logging.LogRecord(name, level, __file__, 1, "request", None, None)
+    record.event = {"path": route, "route": route, "status_code": status_code}
+    return record
+
+
+def test_sampler_drops_only_sampled_2xx_access_records():
+    sampler = AccessLogSampler(1.0, parse_sample_rules("/health=0, /api/issues=0"))
+    before = log_metrics.snapshot()["sampled_out"]
+    assert not sampler.filter(access_record(200, "/health/live"))
+    assert not sampler.filter(access_record(204, "/api/issues/{issue_id}"))
+    assert sampler.filter(access_record(404, "/api/issues/{issue_id}"))
+    assert sampler.filter(access_record(500, "/health/live"))
+    assert sampler.filter(access_record(200, "/api/projects"))
+    assert sampler.filter(access_record(200, "/health", name="audit"))
+    assert sampler.filter(access_record(200, "/health", level=logging.WARNING))
+    assert log_metrics.snapshot()["sampled_out"] == before + 2
+
+
+def test_sample_rules_prefer_longest_prefix():
+    sampler = AccessLogSampler(0.5, parse_sample_rules("/api=0,/api/issues=1"))
+    assert sampler.rate_for("/api/issues/bulk") == 1
+    assert sampler.rate_for("/api/projects") == 0
+    assert sampler.rate_for("/metrics") == 0.5
+
+
+def test_queue_handler_captures_context_and_counts_overflow():
+    log_queue = queue.Queue(maxsize=1)
+    handler = ContextQueueHandler(log_queue)
+    logger = logging.getLogger("test.pipeline")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+    token = request_id_ctx.set("req-1")
+    before = log_metrics.snapshot()["dropped"]
+    try:
+        logger.warning("first %s", "record")
+        logger.info("overflow")
+    finally:
+        request_id_ctx.reset(token)
+        logger.removeHandler(handler)
+        logger.propagate = True
+
+    assert log_metrics.snapshot()["dropped"] == before + 1
+    record = log_queue.get_nowait()
+    assert record.request_id == "req-1"
+    payload = json.loads(JsonFormatter().format(record))
+    assert payload["message"] == "first record"
+    assert payload["request_id"] == "req-1"
+    assert payload["level"] == "WARNING"
+
+
+def test_full_queue_spills_must_deliver_records_instead_of_blocking():
+    log_queue = queue.Queue(maxsize=1)
+    spill = deque()
+    handler = ContextQueueHandler(log_queue, spill)
+    before = log_metrics.snapshot()
+    for message in ("first", "second", "third"):
+        handler.handle(access_record(200, message, name="audit"))
+
+    after = log_metrics.snapshot()
+    assert after["blocked"] == before["blocked"] + 2
+    assert after["spilled"] == before["spilled"] + 2
+    assert after["dropped"] == before["dropped"]
+
+    delivered = []
+
+    class Collect(logging.Handler):
+        def emit(self, record):
+            delivered.append(record.event["path"])
+
+    listener = SpillingQueueListener(log_queue, spill, Collect())
+    listener.start()
+    listener.stop()
+    assert sorted(delivered) == ["first", "second", "third"]
+    assert not spill
+
+
+def test_access_log_reports_route_template(client, monkeypatch):
+    seen = []
+    monkeypatch.setattr(
+        app_logging.AccessLogSampler,
+        "filter",
+        lambda self, record: seen.append(record.event) or False,
+    )
+    resp = client.get("/health/live")
+    assert resp.status_code == 200
+    assert seen[-1]["route"] == "/health/live"
+    assert seen[-1]["status_code"] == 200
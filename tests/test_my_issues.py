@@ -0,0 +1,119 @@
+import uuid
+from datetime import date, timedelta
+
+from app.models import Issue, IssuePriority, IssueStatus, Project, User, UserRole
+from app.services.security import create_token, hash_password
+
+
+def seed(db):
+    me = User(
+        username="inboxdev",
+        email="inboxdev@example.com",
+        password_hash=hash_password("User123!"),
+        role=UserRole.developer,
+    )
+    other = User(
+        username="otherdev",
+        email="otherdev@example.com",
+        password_hash=hash_password("User123!"),
+        role=UserRole.developer,
+    )
+    db.add_all([me, other])
+    db.flush()
+    projects = [
+        Project(name=f"Inbox {i}", description="d", created_by_id=me.id)
+        for i in range(2)
+    ]
+    db.add_all(projects)
+    db.flush()
+    statuses = [IssueStatus.open, IssueStatus.in_progress, IssueStatus.closed]
+    for i in range(12):
+        db.add(
+            Issue(
+                title=f"Mine {i}",
+                description="d",
+                project=projects[i % 2].id,
+                reporter=other.id,
+                assignee=me.id,
+                status=statuses[i % 3],
+                priority=list(IssuePriority)[i % 4],
+                due_date=None if i % 5 == 0 else date(2026, 3, 1) + timedelta(days=i),
+            )
+        )
+    db.add(
+        Issue(
+            title="Theirs",
+            description="d",
+            project=projects[0].id,
+            reporter=me.id,
+            assignee=other.id,
+        )
+    )
+    db.commit()
+    token = create_token(str(me.id), "access", timedelta(minutes=15))
+    return me, projects, {"Authorization": f"Bearer {token}"}
+
+
+def test_my_issues_pages_through_open_work(client, db_session):
+    me, projects, headers = seed(db_session)
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 3}
+        if cursor:
+            params["cursor"] = cursor
+        resp = client.get("/api/me/issues", params=params, headers=headers)
+        assert resp.status_code == 200
+        body = resp.json()
+        seen.extend(body["items"])
+        cursor = resp.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+    assert len(seen) == 8
+    assert len({item["id"] for item in seen}) == 8
+    assert all(item["assignee"] == str(me.id) for item in seen)
+    assert all(item["status"] != "closed" for item in seen)
+    # Explicit ranks, not enum names: open before in_progress, critical first.
+    status_rank = {status.value: rank for rank, status in enumerate(IssueStatus)}
+    priority_rank = {
+        priority.value: rank for rank, priority in enumerate(reversed(IssuePriority))
+    }
+    order = [
+        (
+            status_rank[item["status"]],
+            priority_rank[item["priority"]],
+            item["due_date"] is None,
+            item["due_date"] or "",
+        )
+        for item in seen
+    ]
+    assert order == sorted(order)
+    assert [seen[0]["status"], seen[-1]["status"]] == ["open", "in_progress"]
+    open_priorities = [item["priority"] for item in seen if item["status"] == "open"]
+    assert open_priorities == ["critical", "high", "medium", "low"]
+
+    groups = body["groups"]
+    assert sum(group["count"] for group in groups) == 8
+    assert {(g["project"], g["status"]) for g in groups} == {
+        (str(p.id), s) for p in projects for s in ("open", "in_progress")
+    }
+
+
+def test_my_issues_filters(client, db_session):
+    _, projects, headers = seed(db_session)
+    resp = client.get(
+        "/api/me/issues",
+        params={"status": "closed", "project": str(projects[0].id)},
+        headers=headers,
+    )
+    assert resp.status_code == 200
+    body = resp.json()
+    assert {item["status"] for item in body["items"]} == {"closed"}
+    assert body["groups"] == [
+        {"project": str(projects[0].id), "status": "closed", "count": 2}
+    ]
+    resp = client.get(
+        "/api/me/issues", params={"project": str(uuid.uuid4())}, headers=headers
+    )
+    assert resp.json() == {"groups": [], "items": []}
@@ -0,0 +1,86 @@
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import event
+
+from app.models import User, UserRole
+from app.services.entity_cache import Principal, principal_cache
+from app.services.security import create_token, hash_password
+from app.services.token_store import InMemoryStore
+
+
+def make_user(db, role=UserRole.developer):
+    user = User(
+        username="principal",
+        email="principal@example.com",
+        password_hash=hash_password("User123!"),
+        role=role,
+    )
+    db.add(user)
+    db.commit()
+    token = create_token(str(user.id), "access", timedelta(minutes=15))
+    return user, {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def user_selects(engine):
+    statements: list[str] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if (
+            statement.lstrip().upper().startswith("SELECT")
+            and "FROM users" in statement
+        ):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", capture)
+    yield statements
+    event.remove(engine, "before_cursor_execute", capture)
+
+
+def test_principal_is_loaded_once(client, db_session, user_selects):
+    _, headers = make_user(db_session)
+    user_selects.clear()
+    assert client.get("/api/projects", headers=headers).status_code == 200
+    assert len(user_selects) == 1
+    assert client.get("/api/projects", headers=headers).status_code == 200
+    assert len(user_selects) == 1
+
+
+def test_me_returns_full_profile(client, db_session):
+    _, headers = make_user(db_session)
+    client.get("/api/projects", headers=headers)
+    resp = client.get("/api/auth/me", headers=headers)
+    assert resp.status_code == 200
+    assert resp.json()["username"] == "principal"
+
+
+def test_role_change_and_deactivation_apply_immediately(client, db_session):
+    user, headers = make_user(db_session)
+    assert client.get("/api/audit/events", headers=headers).status_code == 403
+
+    user.role = UserRole.admin
+    db_session.flush()
+    assert principal_cache.get(Principal, user.id) is not None
+    db_session.commit()
+    assert client.get("/api/audit/events", headers=headers).status_code == 200
+
+    user.is_active = False
+    db_session.commit()
+    assert client.get("/api/projects", headers=headers).status_code == 401
+
+
+def test_logout_all_drops_cached_principal(client, db_session):
+    user, headers = make_user(db_session)
+    client.get("/api/projects", headers=headers)
+    assert principal_cache.get(Principal, user.id) is not None
+    assert client.post("/api/auth/logout-all", headers=headers).status_code == 204
+    assert principal_cache.get(Principal, user.id) is None
+
+
+def test_access_token_state_combines_both_checks():
+    store = InMemoryStore()
+    assert store.access_token_state("token", "user") == (False, None)
+    store.add("token", 60)
+    store.set_access_revoked_at("user", 123, 60)
+    assert store.access_token_state("token", "user") == (True, 123)
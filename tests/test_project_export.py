@@ -0,0 +1,89 @@
+import csv
+import io
+import json
+from datetime import datetime, timedelta
+
+from app.models import Comment, Issue, Project, User, UserRole
+from app.services import export
+from app.services.security import create_token, hash_password
+
+
+def seed(db):
+    user = User(
+        username="exporter",
+        email="exporter@example.com",
+        password_hash=hash_password("User123!"),
+        role=UserRole.developer,
+    )
+    db.add(user)
+    db.flush()
+    project = Project(name="Export", description="demo", created_by_id=user.id)
+    other = Project(name="Other", description="demo", created_by_id=user.id)
+    db.add_all([project, other])
+    db.flush()
+    base = datetime(2026, 1, 1)
+    issues = []
+    for i in range(5):
+        issue = Issue(
+            title=f"=Issue {i}" if i == 0 else f"Issue {i}",
+            description="d",
+            project=project.id,
+            reporter=user.id,
+            created_at=base + timedelta(minutes=i),
+        )
+        issues.append(issue)
+    db.add_all(issues)
+    db.add(
+        Issue(title="Elsewhere", description="d", project=other.id, reporter=user.id)
+    )
+    db.flush()
+    for n in range(3):
+        db.add(
+            Comment(
+                content=f"note {n}",
+                issue_id=issues[1].id,
+                author_id=user.id,
+                created_at=base + timedelta(hours=1, minutes=n),
+            )
+        )
+    db.commit()
+    token = create_token(str(user.id), "access", timedelta(minutes=15))
+    return project, issues, {"Authorization": f"Bearer {token}"}
+
+
+def test_export_ndjson_with_comments(client, db_session, monkeypatch):
+    monkeypatch.setattr(export, "BATCH_SIZE", 2)
+    monkeypatch.setattr(export, "CHUNK_BYTES", 100)
+    project, issues, headers = seed(db_session)
+    resp = client.get(
+        f"/api/projects/{project.id}/export",
+        params={"comments": "true"},
+        headers=headers,
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    assert "attachment" in resp.headers["content-disposition"]
+    records = [json.loads(line) for line in resp.text.splitlines()]
+    assert [r["id"] for r in records] == [str(i.id) for i in issues]
+    assert [c["content"] for c in records[1]["comments"]] == [
+        "note 0",
+        "note 1",
+        "note 2",
+    ]
+    assert all(r["comments"] == [] for r in records if r["id"] != str(issues[1].id))
+
+
+def test_export_csv(client, db_session):
+    project, issues, headers = seed(db_session)
+    resp = client.get(
+        f"/api/projects/{project.id}/export",
+        params={"format": "csv"},
+        headers=headers,
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(resp.text)))
+    assert list(rows[0]) == export.ISSUE_FIELDS
+    assert [row["id"] for row in rows] == [str(i.id) for i in issues]
+    assert rows[0]["title"] == "'=Issue 0"
+    assert rows[0]["assignee"] == ""
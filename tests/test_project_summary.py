@@ -0,0 +1,101 @@
+from datetime import timedelta
+
+from sqlalchemy import delete, update
+
+from app.models import Issue, ProjectIssueCounter, User, UserRole
+from app.services.project_summary import rebuild_project_counters
+from app.services.security import create_token, hash_password
+
+
+def setup_project(client, db):
+    manager = User(
+        username="summgr",
+        email="summgr@example.com",
+        password_hash=hash_password("Manager123!"),
+        role=UserRole.manager,
+    )
+    db.add(manager)
+    db.commit()
+    token = create_token(str(manager.id), "access", timedelta(minutes=15))
+    headers = {"Authorization": f"Bearer {token}"}
+    resp = client.post(
+        "/api/projects", json={"name": "Summary", "description": "d"}, headers=headers
+    )
+    assert resp.status_code == 201
+    return resp.json()["id"], headers
+
+
+def summary(client, project_id, headers):
+    resp = client.get(f"/api/projects/{project_id}/summary", headers=headers)
+    assert resp.status_code == 200
+    return resp.json()
+
+
+def test_summary_tracks_creates_and_updates(client, db_session):
+    project_id, headers = setup_project(client, db_session)
+    assert summary(client, project_id, headers)["total"] == 0
+
+    first = client.post(
+        f"/api/projects/{project_id}/issues",
+        json={"title": "A", "description": "d", "priority": "high"},
+        headers=headers,
+    ).json()
+    client.post(
+        "/api/issues",
+        json={"title": "B", "description": "d", "project": project_id},
+        headers=headers,
+    )
+    client.post(
+        "/api/issues/bulk",
+        json=[
+            {"title": "C", "description": "d", "project": project_id},
+            {
+                "title": "D",
+                "description": "d",
+                "project": project_id,
+                "priority": "low",
+            },
+        ],
+        headers=headers,
+    )
+    body = summary(client, project_id, headers)
+    assert body["total"] == 4
+    assert body["by_status"]["open"] == 4
+    assert body["by_priority"] == {"low": 1, "medium": 2, "high": 1, "critical": 0}
+
+    resp = client.patch(
+        f"/api/issues/{first['id']}",
+        json={"status": "in_progress", "priority": "critical"},
+        headers=headers,
+    )
+    assert resp.status_code == 200
+    client.patch(
+        f"/api/issues/{first['id']}", json={"title": "Renamed"}, headers=headers
+    )
+    body = summary(client, project_id, headers)
+    assert body["total"] == 4
+    assert body["by_status"]["open"] == 3
+    assert body["by_status"]["in_progress"] == 1
+    assert body["by_priority"] == {"low": 1, "medium": 2, "high": 0, "critical": 1}
+
+
+def test_rebuild_recomputes_counters(client, db_session):
+    project_id, headers = setup_project(client, db_session)
+    for title in ("A", "B", "C"):
+        client.post(
+            f"/api/projects/{project_id}/issues",
+            json={"title": title, "description": "d"},
+            headers=headers,
+        )
+    expected = summary(client, project_id, headers)
+
+    issues = Issue.__table__
+    db_session.execute(delete(ProjectIssueCounter.__table__))
+    db_session.execute(update(issues).values(priority="low"))
+    db_session.commit()
+    assert summary(client, project_id, headers)["total"] == 0
+
+    assert rebuild_project_counters(db_session) == 1
+    body = summary(client, project_id, headers)
+    assert body["total"] == expected["total"] == 3
+    assert body["by_priority"]["low"] == 3
@@ -0,0 +1,190 @@
+"""Fail when a list query shape falls back to a full table scan."""
+
+import re
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event, insert, text
+
+from app.models import (
+    Comment,
+    Issue,
+    IssuePriority,
+    IssueStatus,
+    Project,
+    User,
+    UserRole,
+)
+from app.services.response_cache import response_cache
+from app.services.security import create_token, hash_password
+
+ISSUES_PER_PROJECT = 1500
+PROJECTS = 4
+TABLES = ("issues", "comments", "projects")
+FULL_SCAN = re.compile(r"\bSCAN (\w+)(?! USING| VIRTUAL)")
+
+
+def seed_large(db):
+    manager = User(
+        username="planmgr",
+        email="planmgr@example.com",
+        password_hash=hash_password("Manager123!"),
+        role=UserRole.manager,
+    )
+    others = [
+        User(
+            username=f"plandev{i}",
+            email=f"plandev{i}@example.com",
+            password_hash=manager.password_hash,
+            role=UserRole.developer,
+        )
+        for i in range(5)
+    ]
+    db.add_all([manager, *others])
+    db.flush()
+    base = datetime(2025, 1, 1)
+    projects = [
+        {
+            "id": uuid.uuid4(),
+            "name": f"Plan {i}",
+            "created_by_id": manager.id,
+            "created_at": base,
+            "updated_at": base,
+            "is_archived": i == 0,
+        }
+        for i in range(PROJECTS)
+    ]
+    db.execute(insert(Project), projects)
+    statuses = list(IssueStatus)
+    priorities = list(IssuePriority)
+    issues = []
+    for p_index, project in enumerate(projects):
+        for i in range(ISSUES_PER_PROJECT):
+            created = base + timedelta(minutes=p_index * ISSUES_PER_PROJECT + i)
+            issues.append(
+                {
+                    "id": uuid.uuid4(),
+                    "title": f"Issue {i}",
+                    "description": "seeded",
+                    "status": statuses[i % len(statuses)],
+                    "priority": priorities[i % len(priorities)],
+                    "project": project["id"],
+                    "reporter": others[i % len(others)].id,
+                    "assignee": others[i % len(others)].id if i % 4 else None,
+                    "created_at": created,
+                    "updated_at": created,
+                }
+            )
+    db.execute(insert(Issue), issues)
+    db.execute(
+        insert(Comment),
+        [
+            {
+                "id": uuid.uuid4(),
+                "content": "seeded",
+                "issue_id": issue["id"],
+                "author_id": manager.id,
+                "created_at": issue["created_at"],
+                "updated_at": issue["created_at"],
+            }
+            for issue in issues[::3]
+        ],
+    )
+    db.commit()
+    db.execute(text("ANALYZE"))
+    return manager, others, projects, issues
+
+
+def full_scans(connection, statement, parameters) -> list[str]:
+    plan = connection.exec_driver_sql(
+        f"EXPLAIN QUERY PLAN {statement}", parameters
+    ).all()
+    return [
+        row[-1]
+        for row in plan
+        if (match := FULL_SCAN.search(row[-1])) and match.group(1) in TABLES
+    ]
+
+
+@pytest.fixture
+def captured_sql(engine):
+    statements: list[tuple[str, tuple]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and not executemany:
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    yield statements
+    event.remove(engine, "before_cursor_execute", capture)
+
+
+def test_list_query_shapes_use_indexes(client, db_session, captured_sql, monkeypatch):
+    # Every request must reach the database for its plan to be checked.
+    monkeypatch.setattr(response_cache, "max_entries", 0)
+    manager, others, projects, issues = seed_large(db_session)
+    headers = {
+        "Authorization": "Bearer "
+        + create_token(str(manager.id), "access", timedelta(minutes=15))
+    }
+    project_id = projects[1]["id"]
+    critical_issue = next(
+        i
+        for i in issues
+        if i["priority"] == IssuePriority.critical
+        and i["status"] == IssueStatus.resolved
+    )
+    shapes = [
+        f"/api/projects/{project_id}/issues",
+        f"/api/projects/{project_id}/issues?sort=-created_at",
+        f"/api/projects/{project_id}/issues?cursor=&limit=20",
+        f"/api/projects/{project_id}/issues?status=open",
+        f"/api/projects/{project_id}/issues?status=open&sort=created_at",
+        f"/api/projects/{project_id}/issues?sort=priority",
+        f"/api/projects/{project_id}/issues?sort=-comment_count",
+        f"/api/projects/{project_id}/issues?cursor=&sort=-last_activity_at",
+        f"/api/projects/{project_id}/issues?assignee={others[1].id}",
+        f"/api/projects/{project_id}/issues?count=exact",
+        f"/api/projects/{project_id}/issues?cursor=&count=capped",
+        "/api/issues?sort=-created_at&page=20",
+        "/api/issues?cursor=&sort=created_at",
+        "/api/issues?status=in_progress",
+        f"/api/issues?assignee={others[2].id}&status=open",
+        "/api/projects?sort=created_at",
+        "/api/me/issues",
+        f"/api/me/issues?status=open&project={project_id}",
+        f"/api/issues/{issues[0]['id']}/comments",
+        f"/api/comments/issue/{issues[3]['id']}",
+    ]
+    failures = {}
+    connection = db_session.connection()
+    # The If-None-Match pass covers the id/version probe queries as well.
+    revalidate = {**headers, "If-None-Match": '"stale"'}
+    for url, request_headers in [
+        *((url, headers) for url in shapes),
+        *((url, revalidate) for url in shapes),
+    ]:
+        captured_sql.clear()
+        resp = client.get(url, headers=request_headers)
+        assert resp.status_code == 200, url
+        scans = [
+            scan
+            for statement, parameters in captured_sql
+            for scan in full_scans(connection, statement, parameters)
+        ]
+        if scans:
+            failures.setdefault(url, []).extend(scans)
+
+    captured_sql.clear()
+    resp = client.patch(
+        f"/api/issues/{critical_issue['id']}",
+        json={"status": "closed"},
+        headers=headers,
+    )
+    assert resp.status_code in {200, 400}
+    for statement, parameters in captured_sql:
+        if scans := full_scans(connection, statement, parameters):
+            failures["critical close"] = scans
+
+    assert failures == {}
@@ -0,0 +1,114 @@
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.pool import StaticPool
+
+from app.core.config import settings
+from app.db import session as db_session
+from app.models import Project, User, UserRole
+from app.services import auth as auth_service
+from app.services import security, token_store
+from app.services.security import create_token, hash_password
+
+
+@pytest.fixture
+def lagging_replica(monkeypatch):
+    # An empty schema stands in for a replica that has not caught up yet.
+    replica = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    db_session.Base.metadata.create_all(replica)
+    monkeypatch.setattr(settings, "database_replica_urls", "sqlite://replica")
+    monkeypatch.setattr(db_session, "_replica_engines", [replica])
+    monkeypatch.setattr(token_store, "store", token_store.InMemoryStore())
+    yield replica
+    replica.dispose()
+
+
+def make_user(db, username):
+    user = User(
+        username=username,
+        email=f"{username}@example.com",
+        password_hash=hash_password("Manager123!"),
+        role=UserRole.manager,
+    )
+    db.add(user)
+    db.commit()
+    token = create_token(str(user.id), "access", timedelta(minutes=15))
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_reads_use_replica_until_caller_writes(client, db_session, lagging_replica):
+    headers = make_user(db_session, "replicawriter")
+
+    # The caller has not written yet, so even their own user row is read from
+    # the (empty) replica.
+    assert client.get("/api/auth/me", headers=headers).status_code == 401
+
+    resp = client.post(
+        "/api/projects", json={"name": "Replica", "description": "d"}, headers=headers
+    )
+    assert resp.status_code == 201
+    project_id = resp.json()["id"]
+
+    resp = client.get(f"/api/projects/{project_id}", headers=headers)
+    assert resp.status_code == 200
+
+
+def test_recent_write_window_expires(client, db_session, lagging_replica, monkeypatch):
+    headers = make_user(db_session, "replicaexpiry")
+    monkeypatch.setattr(settings, "read_your_writes_seconds", 0)
+
+    resp = client.post(
+        "/api/projects", json={"name": "Expired", "description": "d"}, headers=headers
+    )
+    assert resp.status_code == 201
+    resp = client.get(f"/api/projects/{resp.json()['id']}", headers=headers)
+    # Served by the replica, which has neither the user nor the project.
+    assert resp.status_code in {401, 404}
+
+
+def test_rejected_tokens_do_not_pin_the_caller(client, db_session, lagging_replica):
+    headers = make_user(db_session, "replicarevoked")
+    token = headers["Authorization"].removeprefix("Bearer ")
+    auth_service.blacklist_access(token)
+    resp = client.post(
+        "/api/projects", json={"name": "Revoked", "description": "d"}, headers=headers
+    )
+    assert resp.status_code == 401
+    subject = security.decode_token(token)["sub"]
+    assert not auth_service.has_recent_write(subject)
+
+
+def test_replica_reads_never_fill_the_response_cache(
+    client, db_session, lagging_replica
+):
+    writer = make_user(db_session, "cachewriter")
+    reader = make_user(db_session, "cachereader")
+    resp = client.post(
+        "/api/projects", json={"name": "Lag", "description": "d"}, headers=writer
+    )
+    project_id = resp.json()["id"]
+    # The replica has the users and the project, but not the issue below.
+    with lagging_replica.begin() as replica:
+        for model in (User, Project):
+            rows = db_session.execute(select(model.__table__)).mappings().all()
+            replica.execute(insert(model.__table__), [dict(row) for row in rows])
+    resp = client.post(
+        f"/api/projects/{project_id}/issues",
+        json={"title": "Fresh", "description": "d", "priority": "high"},
+        headers=writer,
+    )
+    issue_id = resp.json()["id"]
+    url = f"/api/projects/{project_id}/issues"
+
+    lagging = client.get(url, headers=reader)
+    assert lagging.json() == []
+    assert lagging.headers["X-Cache"] == "MISS"
+    for headers in (writer, reader):
+        resp = client.get(url, headers=headers)
+        assert [item["id"] for item in resp.json()] == [issue_id]
+    assert resp.headers["X-Cache"] == "HIT"
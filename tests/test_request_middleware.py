@@ -0,0 +1,61 @@
+def chunks(total, size=64 * 1024):
+    yield b'{"blob":"'
+    sent = 0
+    while sent < total:
+        yield b"a" * min(size, total - sent)
+        sent += size
+    yield b'"}'
+
+
+def test_chunked_body_over_limit_is_rejected(client):
+    resp = client.post(
+        "/api/auth/register",
+        content=chunks(1_100_000),
+        headers={"Content-Type": "application/json"},
+    )
+    assert resp.status_code == 413
+    body = resp.json()
+    assert body["error"]["code"] == "payload_too_large"
+    assert body["error"]["request_id"] == resp.headers["X-Request-ID"]
+
+
+def test_chunked_body_under_limit_reaches_route(client):
+    resp = client.post(
+        "/api/auth/register",
+        content=chunks(10),
+        headers={"Content-Type": "application/json"},
+    )
+    assert resp.status_code == 422
+    assert resp.json()["error"]["code"] == "validation_error"
+
+
+def test_chunked_body_needs_json_content_type(client):
+    resp = client.post(
+        "/api/auth/register", content=chunks(10), headers={"Content-Type": "text/plain"}
+    )
+    assert resp.status_code == 415
+
+
+def test_every_response_gets_request_id_and_security_headers(client):
+    ok = client.get("/health/live")
+    rejected = client.post(
+        "/api/auth/register", content="x", headers={"Content-Type": "text/plain"}
+    )
+    for resp in (ok, rejected):
+        assert resp.headers["X-Request-ID"]
+        assert resp.headers["Content-Security-Policy"] == "default-src 'self'"
+        assert resp.headers["X-Frame-Options"] == "DENY"
+        assert "Strict-Transport-Security" not in resp.headers
+    assert ok.headers["X-Request-ID"] != rejected.headers["X-Request-ID"]
+    assert rejected.json()["error"]["request_id"] == rejected.headers["X-Request-ID"]
+
+
+def test_bulk_limits_apply_only_to_the_bulk_import(client):
+    for content_type, body, status_code in (
+        ("application/x-ndjson", b"{}", 415),
+        ("application/json", chunks(1_100_000), 413),
+    ):
+        resp = client.patch(
+            "/api/issues/bulk", content=body, headers={"Content-Type": content_type}
+        )
+        assert resp.status_code == status_code
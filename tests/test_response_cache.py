@@ -0,0 +1,149 @@
+import asyncio
+from datetime import timedelta
+
+from app.models import Issue, Project, User, UserRole
+from app.services.response_cache import CacheOutcome, ResponseCache
+from app.services.security import create_token, hash_password
+
+
+def seed(db):
+    user = User(
+        username="cacheuser",
+        email="cacheuser@example.com",
+        password_hash=hash_password("User123!"),
+        role=UserRole.manager,
+    )
+    db.add(user)
+    db.flush()
+    projects = [
+        Project(name=f"Cached {i}", description="demo", created_by_id=user.id)
+        for i in range(2)
+    ]
+    db.add_all(projects)
+    db.flush()
+    issues = [
+        Issue(title=f"Issue {i}", description="desc", project=p.id, reporter=user.id)
+        for p in projects
+        for i in range(2)
+    ]
+    db.add_all(issues)
+    db.commit()
+    token = create_token(str(user.id), "access", timedelta(minutes=15))
+    return projects, issues, {"Authorization": f"Bearer {token}"}
+
+
+def test_repeated_list_is_served_from_cache(client, db_session):
+    projects, _, headers = seed(db_session)
+    url = f"/api/projects/{projects[0].id}/issues"
+    first = client.get(url + "?status=open&sort=-priority", headers=headers)
+    assert first.headers["X-Cache"] == "MISS"
+    second = client.get(url + "?sort=-priority&status=open", headers=headers)
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.content == first.content
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert second.headers["content-type"] == "application/json"
+
+    cached = client.get(
+        url + "?status=open&sort=-priority",
+        headers={**headers, "If-None-Match": first.headers["ETag"]},
+    )
+    assert cached.status_code == 304
+    assert cached.headers["X-Cache"] == "HIT"
+
+
+def test_writes_invalidate_only_their_project(client, db_session):
+    projects, issues, headers = seed(db_session)
+    urls = [f"/api/projects/{p.id}/issues" for p in projects]
+    for url in urls:
+        client.get(url, headers=headers)
+
+    resp = client.patch(
+        f"/api/issues/{issues[0].id}", json={"title": "Changed"}, headers=headers
+    )
+    assert resp.status_code == 200
+    changed = client.get(urls[0], headers=headers)
+    assert changed.headers["X-Cache"] == "MISS"
+    assert "Changed" in {issue["title"] for issue in changed.json()}
+    assert client.get(urls[1], headers=headers).headers["X-Cache"] == "HIT"
+
+
+def test_comment_writes_invalidate_issue_lists(client, db_session):
+    projects, issues, headers = seed(db_session)
+    url = f"/api/projects/{projects[0].id}/issues"
+    comments_url = f"/api/issues/{issues[0].id}/comments"
+    client.get(url, headers=headers)
+    assert client.get(comments_url, headers=headers).json() == []
+
+    resp = client.post(comments_url, json={"content": "hello"}, headers=headers)
+    assert resp.status_code == 201
+    counts = {
+        i["id"]: i["comment_count"] for i in client.get(url, headers=headers).json()
+    }
+    assert counts[str(issues[0].id)] == 1
+    listed = client.get(comments_url, headers=headers)
+    assert listed.headers["X-Cache"] == "MISS"
+    assert [c["content"] for c in listed.json()] == ["hello"]
+
+    client.patch(
+        f"/api/comments/{resp.json()['id']}",
+        json={"content": "edited"},
+        headers=headers,
+    )
+    assert client.get(url, headers=headers).headers["X-Cache"] == "MISS"
+
+
+def test_lru_evicts_oldest_entry():
+    cache = ResponseCache(max_entries=2, ttl_seconds=60, stale_seconds=0)
+
+    async def run():
+        for key in ("a", "b", "a", "c"):
+            await cache.get_or_build(key, "p", _builder(key))
+        return [
+            (await cache.get_or_build(key, "p", _builder(key)))[1] for key in ("a", "b")
+        ]
+
+    assert asyncio.run(run()) == [CacheOutcome.hit, CacheOutcome.miss]
+
+
+def test_expired_entry_served_stale_during_rebuild():
+    cache = ResponseCache(max_entries=10, ttl_seconds=0.01, stale_seconds=60)
+    calls = []
+
+    async def run():
+        await cache.get_or_build("k", "p", _builder("old"))
+        await asyncio.sleep(0.02)
+        results = await asyncio.gather(
+            *(cache.get_or_build("k", "p", _builder("new", calls)) for _ in range(5))
+        )
+        return [(entry.body, outcome) for entry, outcome in results]
+
+    results = asyncio.run(run())
+    assert len(calls) == 1
+    assert results[0] == (b"new", CacheOutcome.miss)
+    assert results[1:] == [(b"old", CacheOutcome.stale)] * 4
+
+
+def test_invalidated_entry_is_never_served_stale():
+    cache = ResponseCache(max_entries=10, ttl_seconds=60, stale_seconds=60)
+    calls = []
+
+    async def run():
+        await cache.get_or_build("k", "p", _builder("old"))
+        await cache.invalidate("p")
+        results = await asyncio.gather(
+            *(cache.get_or_build("k", "p", _builder("new", calls)) for _ in range(5))
+        )
+        return [entry.body for entry, _ in results]
+
+    assert asyncio.run(run()) == [b"new"] * 5
+    assert len(calls) == 1
+
+
+def _builder(body, calls=None):
+    async def build():
+        if calls is not None:
+            calls.append(body)
+        await asyncio.sleep(0.01)
+        return body.encode(), ()
+
+    return build
@@ -0,0 +1,119 @@
+from datetime import timedelta
+
+from app.models import Comment, Issue, IssuePriority, Project, User, UserRole
+from app.services.security import create_token, hash_password
+
+
+def _auth_headers(user_id: str) -> dict[str, str]:
+    token = create_token(user_id, "access", timedelta(minutes=15))
+    return {"Authorization": f"Bearer {token}"}
+
+
+def seed(db):
+    user = User(
+        username="searcher",
+        email="searcher@example.com",
+        password_hash=hash_password("User123!"),
+        role=UserRole.manager,
+    )
+    db.add(user)
+    db.flush()
+    project = Project(
+        name="Payments", description="Checkout service", created_by_id=user.id
+    )
+    db.add(project)
+    db.flush()
+    crash = Issue(
+        title="Checkout crashes on submit",
+        description="Stacktrace attached",
+        project=project.id,
+        reporter=user.id,
+        priority=IssuePriority.high,
+    )
+    typo = Issue(
+        title="Typo in footer",
+        description="Minor wording",
+        project=project.id,
+        reporter=user.id,
+        priority=IssuePriority.low,
+    )
+    db.add_all([crash, typo])
+    db.flush()
+    db.add(
+        Comment(content="Reproduced the segfault", issue_id=typo.id, author_id=user.id)
+    )
+    db.commit()
+    return user, project, crash, typo
+
+
+def test_list_search_uses_prefix_full_text(client, db_session):
+    user, project, crash, typo = seed(db_session)
+    headers = _auth_headers(str(user.id))
+
+    resp = client.get("/api/issues", params={"search": "check"}, headers=headers)
+    assert resp.status_code == 200
+    assert [item["id"] for item in resp.json()] == [str(crash.id)]
+
+    resp = client.get(
+        f"/api/projects/{project.id}/issues",
+        params={"search": "minor footer"},
+        headers=headers,
+    )
+    assert [item["id"] for item in resp.json()] == [str(typo.id)]
+
+    resp = client.get("/api/projects", params={"search": "checkout"}, headers=headers)
+    assert [item["id"] for item in resp.json()] == [str(project.id)]
+
+
+def test_search_matches_word_prefixes_not_substrings(client, db_session):
+    user, _, crash, _ = seed(db_session)
+    headers = _auth_headers(str(user.id))
+    for term, expected in (
+        ("crash", [str(crash.id)]),
+        ("rashes", []),
+        ("checkout typo", []),
+    ):
+        resp = client.get("/api/issues", params={"search": term}, headers=headers)
+        assert [item["id"] for item in resp.json()] == expected, term
+    resp = client.get("/api/search", params={"q": "ashes"}, headers=headers)
+    assert resp.json() == []
+
+
+def test_search_index_follows_updates(client, db_session):
+    user, _, crash, _ = seed(db_session)
+    headers = _auth_headers(str(user.id))
+    resp = client.patch(
+        f"/api/issues/{crash.id}", json={"title": "Payment timeout"}, headers=headers
+    )
+    assert resp.status_code == 200
+
+    old = client.get("/api/issues", params={"search": "crashes"}, headers=headers)
+    new = client.get("/api/issues", params={"search": "timeout"}, headers=headers)
+    assert old.json() == []
+    assert [item["id"] for item in new.json()] == [str(crash.id)]
+
+
+def test_search_endpoint_ranks_and_includes_comments(client, db_session):
+    user, project, crash, typo = seed(db_session)
+    headers = _auth_headers(str(user.id))
+
+    resp = client.get("/api/search", params={"q": "checkout"}, headers=headers)
+    assert resp.status_code == 200
+    hits = resp.json()
+    assert {(hit["type"], hit["id"]) for hit in hits} == {
+        ("issues", str(crash.id)),
+        ("projects", str(project.id)),
+    }
+    assert hits == sorted(hits, key=lambda hit: hit["rank"], reverse=True)
+
+    resp = client.get("/api/search", params={"q": "segfault"}, headers=headers)
+    assert resp.json() == []
+    resp = client.get(
+        "/api/search",
+        params={"q": "segfault", "include_comments": "true"},
+        headers=headers,
+    )
+    [hit] = resp.json()
+    assert hit["type"] == "comments"
+    assert hit["issue_id"] == str(typo.id)
+    assert hit["project"] == str(project.id)
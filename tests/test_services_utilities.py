@@ -1,4 +1,5 @@
 import logging
+from datetime import timedelta
 from uuid import uuid4
 
 import pytest
@@ -9,7 +10,7 @@ from app.core.metrics import MetricsStore
 from app.models import Comment, Project, User, UserRole
 from app.services import pii, security
 from app.services.audit import audit_log
-from app.services.token_store import InMemoryStore
+from app.services.token_store import InMemoryStore, RedisStore, blacklist_key
 
 
 def _make_user(role: UserRole, user_id=None, username="user") -> User:
@@ -33,6 +34,8 @@ def test_security_password_helpers():
     assert not security.verify_password("Wrong123!", hashed)
 
     assert security.sanitize_markdown("<b>hi</b>") == "hi"
+    assert security.sanitize_markdown("plain *text*\n") == "plain *text*\n"
+    assert security.sanitize_markdown("a & b\r\n") == "a &amp; b\n"
     assert security.mask_sensitive("secretvalue") == "secr***"
     assert security.mask_sensitive("abcd") == "****"
     assert security.mask_email("alice@example.com") == "a***@example.com"
@@ -91,6 +94,39 @@ def test_inmemory_token_store_sessions():
     assert store.list_refresh_sessions("u1") == []
 
 
+def test_blacklist_is_keyed_by_compact_digest():
+    first = security.create_token("user", "access", timedelta(minutes=5))
+    second = security.create_token("user", "access", timedelta(minutes=5))
+    assert security.decode_token(first)["jti"] != security.decode_token(second)["jti"]
+
+    store = InMemoryStore()
+    store.add(first, 60)
+    assert store.exists(first)
+    assert not store.exists(second)
+    assert list(store._data) == [blacklist_key(first)]
+    assert len(blacklist_key(first)) == 25
+
+
+def test_redis_blacklist_checks_legacy_keys():
+    class Client:
+        def __init__(self):
+            self.keys = {"blacklist:old-token"}
+
+        def exists(self, *keys):
+            return sum(key in self.keys for key in keys)
+
+        def setex(self, key, ttl, value):
+            self.keys.add(key)
+
+    store = RedisStore("redis://localhost:6379/0")
+    store.client = Client()
+    assert store.exists("old-token")
+    store.add("new-token", 60)
+    assert blacklist_key("new-token") in store.client.keys
+    assert store.exists("new-token")
+    assert not store.exists("other-token")
+
+
 def test_permission_helpers():
     creator_id = uuid4()
     project = Project(name="Demo", description="d", created_by_id=creator_id)
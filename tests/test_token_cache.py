@@ -0,0 +1,85 @@
+from datetime import timedelta
+
+import jwt
+import pytest
+
+from app.core.config import settings
+from app.models import User, UserRole
+from app.services import security
+
+
+@pytest.fixture
+def verified_tokens(monkeypatch):
+    cache = security.VerifiedTokenCache(max_entries=2)
+    monkeypatch.setattr(security, "verified_tokens", cache)
+    return cache
+
+
+def test_access_tokens_are_verified_once(verified_tokens, monkeypatch):
+    token = security.create_token("user", "access", timedelta(minutes=5))
+    claims = security.decode_token(token)
+    assert len(verified_tokens) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("signature checked again")
+
+    monkeypatch.setattr(jwt, "decode", fail)
+    assert security.decode_token(token) == claims
+
+
+def test_refresh_and_invalid_tokens_are_not_cached(verified_tokens):
+    refresh = security.create_token("user", "refresh", timedelta(days=1), jti="j")
+    assert security.decode_token(refresh)["type"] == "refresh"
+    with pytest.raises(ValueError):
+        security.decode_token("not-a-token")
+    assert len(verified_tokens) == 0
+
+
+def test_expired_entries_are_reverified(verified_tokens):
+    token = jwt.encode(
+        {"sub": "user", "type": "access", "exp": 1},
+        security.get_private_key(),
+        algorithm=settings.jwt_alg,
+    )
+    verified_tokens.put(token, {"sub": "user", "type": "access", "exp": 1})
+    with pytest.raises(ValueError):
+        security.decode_token(token)
+    assert len(verified_tokens) == 0
+
+
+def test_cache_is_bounded(verified_tokens):
+    tokens = [
+        security.create_token(f"user{i}", "access", timedelta(minutes=5))
+        for i in range(3)
+    ]
+    for token in tokens:
+        security.decode_token(token)
+    assert len(verified_tokens) == 2
+    assert verified_tokens.get(tokens[0]) is None
+
+
+def test_logout_keeps_cached_token_revoked(client, db_session, verified_tokens):
+    db_session.add(
+        User(
+            username="tokencache",
+            email="tokencache@example.com",
+            password_hash=security.hash_password("User123!"),
+            role=UserRole.developer,
+        )
+    )
+    db_session.commit()
+    resp = client.post(
+        "/api/auth/login", json={"username": "tokencache", "password": "User123!"}
+    )
+    tokens = resp.json()
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+    assert client.get("/api/projects", headers=headers).status_code == 200
+    assert len(verified_tokens) == 1
+
+    resp = client.post(
+        "/api/auth/logout",
+        json={"refresh_token": tokens["refresh_token"]},
+        headers=headers,
+    )
+    assert resp.status_code == 204
+    assert client.get("/api/projects", headers=headers).status_code == 401
@@ -0,0 +1,90 @@
+from datetime import timedelta
+
+import pytest
+
+from app.api import query
+from app.models import Issue, IssueStatus, Project, User, UserRole
+from app.services.response_cache import response_cache
+from app.services.security import create_token, hash_password
+
+
+def seed(db, issues=7):
+    user = User(
+        username="countuser",
+        email="countuser@example.com",
+        password_hash=hash_password("User123!"),
+        role=UserRole.manager,
+    )
+    db.add(user)
+    db.flush()
+    project = Project(name="Counts", description="demo", created_by_id=user.id)
+    db.add(project)
+    db.flush()
+    for i in range(issues):
+        db.add(
+            Issue(
+                title=f"Issue {i}",
+                description="desc",
+                project=project.id,
+                reporter=user.id,
+                status=IssueStatus.open if i % 2 else IssueStatus.in_progress,
+            )
+        )
+    db.commit()
+    token = create_token(str(user.id), "access", timedelta(minutes=15))
+    return project, {"Authorization": f"Bearer {token}"}
+
+
+def totals(resp):
+    assert resp.status_code == 200
+    return resp.headers.get("X-Total-Count"), resp.headers.get("X-Total-Count-Mode")
+
+
+def test_total_count_is_opt_in(client, db_session):
+    project, headers = seed(db_session)
+    resp = client.get(f"/api/projects/{project.id}/issues", headers=headers)
+    assert totals(resp) == (None, None)
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"limit": 3},
+        {"limit": 3, "page": 9},
+        {"limit": 3, "cursor": ""},
+        {"limit": 3, "status": "open"},
+    ],
+)
+def test_exact_count(client, db_session, params):
+    project, headers = seed(db_session)
+    resp = client.get(
+        f"/api/projects/{project.id}/issues",
+        params={**params, "count": "exact"},
+        headers=headers,
+    )
+    expected = "3" if "status" in params else "7"
+    assert totals(resp) == (expected, "exact")
+    assert len(resp.json()) == (0 if params.get("page") == 9 else 3)
+
+
+def test_capped_count_stops_at_cap(client, db_session, monkeypatch):
+    project, headers = seed(db_session)
+    url = f"/api/projects/{project.id}/issues"
+
+    resp = client.get(url, params={"count": "capped"}, headers=headers)
+    assert totals(resp) == ("7", "exact")
+
+    monkeypatch.setattr(query, "COUNT_CAP", 5)
+    response_cache.clear()
+    resp = client.get(url, params={"count": "capped"}, headers=headers)
+    assert totals(resp) == ("5", "capped")
+
+
+def test_estimated_count_degrades_without_planner_stats(client, db_session):
+    project, headers = seed(db_session)
+    resp = client.get(
+        f"/api/projects/{project.id}/issues",
+        params={"count": "estimated"},
+        headers=headers,
+    )
+    assert totals(resp) == ("7", "exact")